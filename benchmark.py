@@ -0,0 +1,239 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import tempfile
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import geopy.distance
+
+from geo_distance import haversine_distance, vincenty_distance
+from geo_linker import load_geonames
+from geo_mapper import GEO_MAP
+from geonames import generate_geo_url
+from osm_reader import read_osm_csv
+from parser import generate_output_path, generate_rdf_file, generate_tags
+from profiling import generate_stage_summary
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+WEST_BANK_PATH = os.path.join(BASE_PATH, 'data/westbank/westbank.csv')
+GAZA_PATH = os.path.join(BASE_PATH, 'data/gaza/gaza.csv')
+
+CSV_HEADER = ('id', 'type', 'tags', 'lat', 'lon', 'nds', 'members',
+              'changeset', 'timestamp', 'uid', 'user', 'version')
+
+# Synthetic nodes get ids above every real OSM node id
+SYNTHETIC_FIRST_ID = 10 ** 11
+SYNTHETIC_JITTER = 0.01
+
+
+def legacy_generate_tags(tags):
+    # generate_tags as it was before the single pass tokenizer, kept here
+    # only as a reference point for the benchmark
+    node_tags = dict()
+    tags = tags[1: len(tags) - 2].split(',')
+    for element in tags:
+        values = element.split('=')
+        if len(values) > 1:
+            node_tags[values[0].lstrip()] = values[1].lstrip()
+    return node_tags
+
+
+def time_per_row(function, rows, repeat):
+    timer = timeit.Timer(lambda: [function(row) for row in rows])
+    best = min(timer.repeat(repeat=repeat, number=1))
+    return best / len(rows) * 1e6
+
+
+def benchmark_tags(source_path, repeat=5):
+    rows = [tags for tags, in read_osm_csv(source_path, columns=('tags',))]
+    legacy = time_per_row(legacy_generate_tags, rows, repeat)
+    current = time_per_row(generate_tags, rows, repeat)
+    print('generate_tags on {0} rows of {1}'.format(
+        len(rows), os.path.basename(source_path)))
+    print('  legacy  {0:.3f} us/row'.format(legacy))
+    print('  current {0:.3f} us/row'.format(current))
+    print('  speedup {0:.2f}x'.format(legacy / current))
+
+
+def load_geo_map_pairs():
+    # (geo lat, geo lon, osm lat, osm lon) of every GEO_MAP link
+    geonames = load_geonames()
+    features = {generate_geo_url(geo_id): (lat, lon)
+                for geo_id, lat, lon in zip(geonames['geo_id'].tolist(),
+                                            geonames['lat'].tolist(),
+                                            geonames['lon'].tolist())}
+    pairs = []
+    for source_path in [GAZA_PATH, WEST_BANK_PATH]:
+        rows = read_osm_csv(source_path, columns=('id', 'lat', 'lon'))
+        for osm_id, lat, lon in rows:
+            geo_id = GEO_MAP.get(str(osm_id))
+            if geo_id in features:
+                pairs.append(features[geo_id] + (lat, lon))
+    return pairs
+
+
+def benchmark_distance(repeat=5):
+    # geopy.distance.vincenty is gone from current geopy releases, geodesic
+    # is the per pair call the match report would use today
+    pairs = load_geo_map_pairs()
+    columns = [list(column) for column in zip(*pairs)]
+
+    def geopy_loop():
+        return [geopy.distance.geodesic(pair[:2], pair[2:]).m
+                for pair in pairs]
+
+    timings = dict()
+    for name, function in (('geopy loop', geopy_loop),
+                           ('vincenty', lambda: vincenty_distance(*columns)),
+                           ('haversine', lambda: haversine_distance(*columns))):
+        timer = timeit.Timer(function)
+        timings[name] = min(timer.repeat(repeat=repeat, number=1))
+
+    error = max(abs(vincenty - geodesic) for vincenty, geodesic in
+                zip(vincenty_distance(*columns), geopy_loop()))
+    print('distance on {0} GEO_MAP pairs'.format(len(pairs)))
+    for name, timing in timings.items():
+        print('  {0:<10} {1:.3f} ms  {2:.1f}x'.format(
+            name, timing * 1e3, timings['geopy loop'] / timing))
+    print('  vincenty max difference from geopy {0:.6f} m'.format(error))
+
+
+def generate_synthetic_csv(output_path, rows, sources=(GAZA_PATH,
+                                                       WEST_BANK_PATH)):
+    # Scale the bundled extracts up to any size by sampling real rows, the
+    # tags keep their real distribution and the positions are jittered
+    samples = []
+    for source_path in sources:
+        samples.extend(read_osm_csv(source_path,
+                                    columns=('tags', 'lat', 'lon')))
+    generator = random.Random(rows)
+    with open(output_path, mode='w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')
+        writer.writerow(CSV_HEADER)
+        for position in range(rows):
+            tags, lat, lon = generator.choice(samples)
+            writer.writerow((
+                SYNTHETIC_FIRST_ID + position, 'node', tags,
+                '{0:.7f}'.format(lat + generator.uniform(-SYNTHETIC_JITTER,
+                                                         SYNTHETIC_JITTER)),
+                '{0:.7f}'.format(lon + generator.uniform(-SYNTHETIC_JITTER,
+                                                         SYNTHETIC_JITTER)),
+                '[]', '[]', '0', '', '0', '', '1'))
+
+
+def count_source_tags(source_path):
+    # Tags with a value as read from the source, without the country tag
+    # the conversion adds to every node
+    return sum(sum(1 for value in generate_tags(tags).values() if value)
+               for tags, in read_osm_csv(source_path, columns=('tags',)))
+
+
+def run_pipeline(source_path, stream=False):
+    # Convert source_path with generate_rdf_file and its --profile stages,
+    # so the report has the same stages as the profile of a conversion.
+    # Runs in a fresh process so ru_maxrss is this run's peak
+    with open(os.devnull, mode='w') as devnull, redirect_stdout(devnull):
+        # The profile table is printed, the report below replaces it
+        start = time.perf_counter()
+        generate_rdf_file(source_path, stream=stream, profile=True)
+        total = time.perf_counter() - start
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stages = generate_stage_summary()
+    rows = stages['generate_osm_node']['calls']
+    tags = count_source_tags(source_path)
+
+    return {
+        'source': os.path.basename(source_path),
+        'mode': 'stream' if stream else 'tree',
+        'rows': rows,
+        'tags': tags,
+        'seconds': total,
+        'stages': stages,
+        'rows_per_sec': rows / total if total else None,
+        'tags_per_sec': tags / total if total else None,
+        'peak_rss_kb': peak_rss_kb,
+        'output_bytes': os.path.getsize(
+            generate_output_path(source_path, 'xml')),
+    }
+
+
+def benchmark_pipeline(sources, synthetic_rows=(), stream=False):
+    # The bundled sources are copied to a scratch directory first, the
+    # conversion writes its output next to the source it reads
+    results = []
+    work_dir = tempfile.mkdtemp(prefix='osm-benchmark-')
+    try:
+        cases = []
+        for source_path in sources:
+            case_path = os.path.join(work_dir, os.path.basename(source_path))
+            shutil.copyfile(source_path, case_path)
+            cases.append((case_path, stream))
+        # The tree keeps about 3 KB per node until it is written, millions
+        # of synthetic rows only fit in memory with the streaming writer
+        for rows in synthetic_rows:
+            case_path = os.path.join(work_dir, 'synthetic{0}.csv'.format(rows))
+            generate_synthetic_csv(case_path, rows)
+            cases.append((case_path, True))
+
+        for case_path, case_stream in cases:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(run_pipeline,
+                                               case_path,
+                                               case_stream).result())
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Parser benchmarks')
+    arg_parser.add_argument('benchmark',
+                            nargs='?',
+                            choices=('pipeline', 'tags', 'distance'),
+                            default='pipeline')
+    arg_parser.add_argument('--source',
+                            action='append',
+                            help='CSV to benchmark, bundled ones by default')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--synthetic',
+                            type=int,
+                            action='append',
+                            default=[],
+                            help='Also run on N synthetic rows, '
+                                 'e.g. 1000000 and 10000000')
+    arg_parser.add_argument('--stream',
+                            action='store_true',
+                            help='Benchmark the streaming writer, the '
+                                 'synthetic rows always use it')
+    arg_parser.add_argument('--output',
+                            default=None,
+                            help='Write the pipeline results as JSON')
+    args = arg_parser.parse_args()
+
+    if args.benchmark == 'tags':
+        benchmark_tags((args.source or [WEST_BANK_PATH])[0], args.repeat)
+    elif args.benchmark == 'distance':
+        benchmark_distance(args.repeat)
+    else:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'results': benchmark_pipeline(args.source or [GAZA_PATH,
+                                                          WEST_BANK_PATH],
+                                          args.synthetic,
+                                          args.stream),
+        }
+        if args.output:
+            with open(args.output, mode='w', encoding='utf-8') as f:
+                json.dump(report, f, indent=4)
+        else:
+            print(json.dumps(report, indent=4))
@@ -1,6 +1,7 @@
 import csv
 import os
-import pandas as pd
+
+from osm_reader import read_osm_csv
 
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 WEST_BANK_PATH = os.path.join(BASE_PATH, 'data/westbank/westbank.csv')
@@ -12,10 +13,9 @@ if __name__ == '__main__':
                          quoting=csv.QUOTE_ALL,
                          skipinitialspace=True)
     for source_path in [GAZA_PATH, WEST_BANK_PATH]:
-        with open(source_path, mode='r') as csv_file:
-            data = pd.read_csv(csv_file)
-            for _, entry in data.iterrows():
-                headers.append([str(entry['id']), str(entry['lat']), str(entry['lon'])])
+        for osm_id, lat, lon in read_osm_csv(source_path,
+                                             columns=('id', 'lat', 'lon')):
+            headers.append([str(osm_id), str(lat), str(lon)])
 
     with open('osm_data.csv', 'w') as f:
         writer = csv.writer(f, dialect='myDialect')
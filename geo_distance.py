@@ -0,0 +1,86 @@
+
+import numpy as np
+
+# WGS-84
+EARTH_RADIUS = 6371008.8
+ELLIPSOID_A = 6378137.0
+ELLIPSOID_F = 1 / 298.257223563
+ELLIPSOID_B = (1 - ELLIPSOID_F) * ELLIPSOID_A
+
+VINCENTY_MAX_ITERATIONS = 200
+VINCENTY_TOLERANCE = 1e-12
+
+DISTANCE_METHODS = ('haversine', 'vincenty')
+
+
+def to_radians(*values):
+    return [np.radians(np.asarray(value, dtype=np.float64)) for value in values]
+
+
+def haversine_distance(lat_1, lon_1, lat_2, lon_2):
+    # Great circle distance in meters between every pair of points, the
+    # arguments are sequences (or numpy arrays) of degrees
+    lat_1, lon_1, lat_2, lon_2 = to_radians(lat_1, lon_1, lat_2, lon_2)
+    a = (np.sin((lat_2 - lat_1) / 2) ** 2 +
+         np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) / 2) ** 2)
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def vincenty_distance(lat_1,
+                      lon_1,
+                      lat_2,
+                      lon_2,
+                      max_iterations=VINCENTY_MAX_ITERATIONS,
+                      tolerance=VINCENTY_TOLERANCE):
+    # Vincenty inverse formula on the WGS-84 ellipsoid, every pair iterates
+    # together until all of them converged
+    lat_1, lon_1, lat_2, lon_2 = to_radians(lat_1, lon_1, lat_2, lon_2)
+    f = ELLIPSOID_F
+    u_1 = np.arctan((1 - f) * np.tan(lat_1))
+    u_2 = np.arctan((1 - f) * np.tan(lat_2))
+    sin_u_1, cos_u_1 = np.sin(u_1), np.cos(u_1)
+    sin_u_2, cos_u_2 = np.sin(u_2), np.cos(u_2)
+
+    big_l = lon_2 - lon_1
+    lam = big_l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.sqrt(
+                (cos_u_2 * sin_lam) ** 2 +
+                (cos_u_1 * sin_u_2 - sin_u_1 * cos_u_2 * cos_lam) ** 2)
+            cos_sigma = sin_u_1 * sin_u_2 + cos_u_1 * cos_u_2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(
+                sin_sigma == 0, 0.0,
+                cos_u_1 * cos_u_2 * sin_lam / sin_sigma)
+            cos_sq_alpha = 1 - sin_alpha ** 2
+            # Both points on the equator
+            cos_2_sigma_m = np.where(
+                cos_sq_alpha == 0, 0.0,
+                cos_sigma - 2 * sin_u_1 * sin_u_2 / cos_sq_alpha)
+            c = f / 16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+            previous = lam
+            lam = big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (
+                    cos_2_sigma_m + c * cos_sigma *
+                    (-1 + 2 * cos_2_sigma_m ** 2)))
+            if np.all(np.abs(lam - previous) <= tolerance):
+                break
+
+    u_sq = cos_sq_alpha * (ELLIPSOID_A ** 2 - ELLIPSOID_B ** 2) / ELLIPSOID_B ** 2
+    big_a = 1 + u_sq / 16384 * (
+        4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (
+        cos_2_sigma_m + big_b / 4 * (
+            cos_sigma * (-1 + 2 * cos_2_sigma_m ** 2) -
+            big_b / 6 * cos_2_sigma_m * (-3 + 4 * sin_sigma ** 2) *
+            (-3 + 4 * cos_2_sigma_m ** 2)))
+    return ELLIPSOID_B * big_a * (sigma - delta_sigma)
+
+
+def distance(lat_1, lon_1, lat_2, lon_2, method='haversine'):
+    if method == 'vincenty':
+        return vincenty_distance(lat_1, lon_1, lat_2, lon_2)
+    return haversine_distance(lat_1, lon_1, lat_2, lon_2)
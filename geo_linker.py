@@ -0,0 +1,171 @@
+import argparse
+import csv
+import math
+import os
+
+import numpy as np
+
+from geo_distance import EARTH_RADIUS, haversine_distance
+from geo_mapper import GEO_MAP_PATH
+from geonames import (GAZETTEER_PATH,
+                      GEO_NAMES_PATH,
+                      generate_geo_url,
+                      load_geonames_csv,
+                      open_gazetteer,
+                      parse_geo_id)
+from osm_node import OsmNode
+from osm_reader import read_osm_csv_chunks
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+WEST_BANK_PATH = os.path.join(BASE_PATH, 'data/westbank/westbank.csv')
+GAZA_PATH = os.path.join(BASE_PATH, 'data/gaza/gaza.csv')
+
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+# The row of a cell goes in the high bits of its key, the column in the low
+# ones
+CELL_KEY_SHIFT = 32
+
+# Maximum distance in meters between an OSM node and a GeoNames feature
+LINK_RADIUS = 60
+
+
+def load_geonames(geo_names_path=GEO_NAMES_PATH,
+                  gazetteer_path=GAZETTEER_PATH):
+    # Prefer the compiled gazetteer, see geonames.build_gazetteer, its
+    # columns stay memory mapped
+    if os.path.isdir(gazetteer_path):
+        return open_gazetteer(gazetteer_path)
+    return load_geonames_csv(geo_names_path)
+
+
+def get_cell_keys(rows, cols):
+    # (row, col) cells as a single int64, sorted by row then col
+    return (rows << CELL_KEY_SHIFT) + cols
+
+
+def build_grid_index(features, radius=LINK_RADIUS):
+    # Bucket the features in square cells of radius degrees, a lookup only
+    # has to visit the cells around the query point. The features are
+    # sorted by cell so every run of cells of a row is one slice
+    cell_size = radius / METERS_PER_DEGREE
+    rows = np.floor(features['lat'] / cell_size).astype(np.int64)
+    cols = np.floor(features['lon'] / cell_size).astype(np.int64)
+    keys = get_cell_keys(rows, cols)
+    order = np.argsort(keys, kind='stable')
+    return {
+        'features': features,
+        'order': order,
+        'keys': keys[order],
+        'cell_size': cell_size,
+        'radius': radius,
+    }
+
+
+def find_candidates(index, lats, lons):
+    # (node position, feature position) pairs of every feature in the
+    # cells around the nodes, in row, col and feature order
+    cell_size = index['cell_size']
+    rows = np.floor(lats / cell_size).astype(np.int64)
+    cols = np.floor(lons / cell_size).astype(np.int64)
+    # A degree of longitude gets shorter away from the equator
+    col_span = np.ceil(
+        1 / np.maximum(np.cos(np.radians(lats)), 1e-6)).astype(np.int64)
+    nodes, features = [], []
+    for row_offset in (-1, 0, 1):
+        first = np.searchsorted(
+            index['keys'],
+            get_cell_keys(rows + row_offset, cols - col_span),
+            side='left')
+        last = np.searchsorted(
+            index['keys'],
+            get_cell_keys(rows + row_offset, cols + col_span),
+            side='right')
+        counts = last - first
+        starts = np.cumsum(counts) - counts
+        nodes.append(np.repeat(np.arange(len(lats)), counts))
+        features.append(np.arange(counts.sum()) +
+                        np.repeat(first - starts, counts))
+    nodes = np.concatenate(nodes)
+    order = np.argsort(nodes, kind='stable')
+    return nodes[order], index['order'][np.concatenate(features)[order]]
+
+
+def read_node_chunks(source_path):
+    # Only the position is needed, the tags are not tokenized
+    chunks = read_osm_csv_chunks(source_path, columns=('id', 'lat', 'lon'))
+    for rows in chunks:
+        yield [OsmNode(node_id, lat, lon) for node_id, lat, lon in rows]
+
+
+def generate_geo_links(source_path, index):
+    # Collect the candidate pairs of a whole chunk and measure them with a
+    # single vectorized call, then keep the nearest one of every node. Only
+    # the linked features get a GeoNames URL
+    features = index['features']
+    for chunk in read_node_chunks(source_path):
+        lats = np.fromiter((node.lat for node in chunk), dtype=np.float64,
+                           count=len(chunk))
+        lons = np.fromiter((node.lon for node in chunk), dtype=np.float64,
+                           count=len(chunk))
+        nodes, candidates = find_candidates(index, lats, lons)
+        if not len(nodes):
+            continue
+
+        distances = haversine_distance(lats[nodes],
+                                       lons[nodes],
+                                       features['lat'][candidates],
+                                       features['lon'][candidates])
+        order = np.lexsort((distances, nodes))
+        order = order[distances[order] <= index['radius']]
+        _, first = np.unique(nodes[order], return_index=True)
+        for pair in order[first]:
+            yield (str(chunk[nodes[pair]].id),
+                   generate_geo_url(int(features['geo_id'][candidates[pair]])),
+                   float(distances[pair]))
+
+
+def generate_geo_links_file(source_path, index):
+    # Same format as the checked in data/*/*_geo_osm.txt files
+    name = os.path.basename(source_path).split('.')[0]
+    file_name = '{0}/{1}_geo_osm.txt'.format(os.path.dirname(source_path),
+                                             name)
+    links = dict()
+    with open(file_name, mode='w', encoding='utf-8') as links_file:
+        for osm_id, geo_id, dis in generate_geo_links(source_path, index):
+            links[osm_id] = geo_id
+            links_file.write('{0} {1}\n'.format(osm_id,
+                                                {'geo_id': geo_id,
+                                                 'dis': dis}))
+    return links
+
+
+def write_geo_map(links, geo_map_path=GEO_MAP_PATH):
+    # Same format as the checked in data/geo_map.csv read by GeoMap
+    with open(geo_map_path, mode='w', encoding='utf-8') as csv_file:
+        writer = csv.writer(csv_file,
+                            quoting=csv.QUOTE_ALL,
+                            lineterminator='\n')
+        writer.writerow(['osm_id', 'geo_id'])
+        for osm_id, geo_id in links.items():
+            writer.writerow([osm_id, parse_geo_id(geo_id)])
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Link OSM nodes to their nearest GeoNames feature')
+    arg_parser.add_argument('--radius',
+                            type=float,
+                            default=LINK_RADIUS,
+                            help='Maximum distance in meters')
+    arg_parser.add_argument('--geo-map',
+                            action='store_true',
+                            help='Also replace data/geo_map.csv with the '
+                                 'links found')
+    args = arg_parser.parse_args()
+    geo_index = build_grid_index(load_geonames(), args.radius)
+    geo_links = dict()
+    for source in [GAZA_PATH, WEST_BANK_PATH]:
+        geo_links.update(generate_geo_links_file(source, geo_index))
+    if args.geo_map:
+        write_geo_map(geo_links)
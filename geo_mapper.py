@@ -1,1566 +1,89 @@
+import csv
+import os
+from collections.abc import Mapping
 
-GEO_MAP = {
-'4466418798':'http://sws.geonames.org/8042091/',
-'5315327621':'http://sws.geonames.org/8042077/',
-'5315327624':'http://sws.geonames.org/7302441/',
-'5315327625':'http://sws.geonames.org/281129/',
-'5315327721':'http://sws.geonames.org/8041971/',
-'4316435497':'http://sws.geonames.org/8051608/',
-'1195062824':'http://sws.geonames.org/8041258/',
-'4908646621':'http://sws.geonames.org/8042092/',
-'1634494851':'http://sws.geonames.org/8041972/',
-'3941074633':'http://sws.geonames.org/7730637/',
-'4639315789':'http://sws.geonames.org/8041978/',
-'4770115822':'http://sws.geonames.org/8042068/',
-'4376215693':'http://sws.geonames.org/8042001/',
-'4385214091':'http://sws.geonames.org/8041271/',
-'5325083129':'http://sws.geonames.org/7302441/',
-'5325106726':'http://sws.geonames.org/281129/',
-'4571426591':'http://sws.geonames.org/8051625/',
-'4304451394':'http://sws.geonames.org/8051603/',
-'6320823387':'http://sws.geonames.org/8041264/',
-'4550908693':'http://sws.geonames.org/8041975/',
-'4885767621':'http://sws.geonames.org/281086/',
-'2614522390':'http://sws.geonames.org/8042077/',
-'2614524950':'http://sws.geonames.org/8042077/',
-'5646656721':'http://sws.geonames.org/8051637/',
-'4952509726':'http://sws.geonames.org/281165/',
-'2386373260':'http://sws.geonames.org/8041972/',
-'4748830421':'http://sws.geonames.org/8041272/',
-'4748830422':'http://sws.geonames.org/8041271/',
-'5460602224':'http://sws.geonames.org/8051638/',
-'5460602521':'http://sws.geonames.org/8041265/',
-'2296721089':'http://sws.geonames.org/8041667/',
-'5493731325':'http://sws.geonames.org/8041981/',
-'4305674991':'http://sws.geonames.org/8068833/',
-'504252582':'http://sws.geonames.org/8042079/',
-'504253012':'http://sws.geonames.org/8041203/',
-'504255368':'http://sws.geonames.org/8042069/',
-'504257007':'http://sws.geonames.org/8041202/',
-'504257104':'http://sws.geonames.org/8041247/',
-'504259355':'http://sws.geonames.org/8042095/',
-'504260884':'http://sws.geonames.org/8041259/',
-'504261187':'http://sws.geonames.org/8041257/',
-'504263745':'http://sws.geonames.org/8042095/',
-'504264164':'http://sws.geonames.org/8042092/',
-'504264355':'http://sws.geonames.org/7870544/',
-'504264436':'http://sws.geonames.org/8042092/',
-'504268533':'http://sws.geonames.org/8042074/',
-'504269537':'http://sws.geonames.org/8041658/',
-'504267022':'http://sws.geonames.org/8041272/',
-'504267106':'http://sws.geonames.org/8042096/',
-'504267233':'http://sws.geonames.org/8041200/',
-'504271766':'http://sws.geonames.org/8042093/',
-'504272737':'http://sws.geonames.org/7870487/',
-'504272781':'http://sws.geonames.org/8041252/',
-'504272995':'http://sws.geonames.org/8042093/',
-'504274983':'http://sws.geonames.org/8042092/',
-'504275789':'http://sws.geonames.org/8041266/',
-'504276192':'http://sws.geonames.org/8042093/',
-'504276957':'http://sws.geonames.org/8041659/',
-'504277165':'http://sws.geonames.org/8041252/',
-'504277817':'http://sws.geonames.org/8041979/',
-'504278079':'http://sws.geonames.org/8042092/',
-'504278152':'http://sws.geonames.org/8042095/',
-'504280020':'http://sws.geonames.org/8042069/',
-'504281932':'http://sws.geonames.org/8041667/',
-'504282471':'http://sws.geonames.org/8041977/',
-'504283140':'http://sws.geonames.org/8041655/',
-'504284250':'http://sws.geonames.org/8041975/',
-'504289281':'http://sws.geonames.org/8041254/',
-'504291989':'http://sws.geonames.org/8042070/',
-'504292617':'http://sws.geonames.org/8041659/',
-'504293294':'http://sws.geonames.org/8041252/',
-'504295962':'http://sws.geonames.org/8041979/',
-'504296015':'http://sws.geonames.org/8041198/',
-'504296524':'http://sws.geonames.org/8041972/',
-'504297336':'http://sws.geonames.org/8041264/',
-'504297622':'http://sws.geonames.org/8041268/',
-'504298036':'http://sws.geonames.org/8041658/',
-'504298056':'http://sws.geonames.org/8041264/',
-'504300054':'http://sws.geonames.org/7302441/',
-'504301734':'http://sws.geonames.org/8041667/',
-'504301920':'http://sws.geonames.org/8042064/',
-'504302171':'http://sws.geonames.org/8041252/',
-'504302547':'http://sws.geonames.org/8041218/',
-'505017601':'http://sws.geonames.org/281141/',
-'505018967':'http://sws.geonames.org/8051612/',
-'505092692':'http://sws.geonames.org/7870559/',
-'505094465':'http://sws.geonames.org/7871045/',
-'505098704':'http://sws.geonames.org/281119/',
-'505109970':'http://sws.geonames.org/7870559/',
-'505120298':'http://sws.geonames.org/8051669/',
-'505125388':'http://sws.geonames.org/8051625/',
-'505133726':'http://sws.geonames.org/8051675/',
-'505134819':'http://sws.geonames.org/8051627/',
-'505135362':'http://sws.geonames.org/281076/',
-'5359858021':'http://sws.geonames.org/8041204/',
-'4362393589':'http://sws.geonames.org/8041978/',
-'5897858185':'http://sws.geonames.org/8041268/',
-'5897869785':'http://sws.geonames.org/8041203/',
-'4696835892':'http://sws.geonames.org/7870540/',
-'2857952812':'http://sws.geonames.org/8041255/',
-'4629274789':'http://sws.geonames.org/8041976/',
-'5327153524':'http://sws.geonames.org/8041200/',
-'3657662326':'http://sws.geonames.org/8041659/',
-'5256200422':'http://sws.geonames.org/8041265/',
-'5256213021':'http://sws.geonames.org/8041265/',
-'5321028021':'http://sws.geonames.org/8041224/',
-'4306315292':'http://sws.geonames.org/8051594/',
-'4306378691':'http://sws.geonames.org/281081/',
-'5462137721':'http://sws.geonames.org/8042063/',
-'4306418891':'http://sws.geonames.org/8051614/',
-'4306419389':'http://sws.geonames.org/281141/',
-'4306420490':'http://sws.geonames.org/8051598/',
-'5124119121':'http://sws.geonames.org/8041671/',
-'1431334773':'http://sws.geonames.org/281119/',
-'1431365436':'http://sws.geonames.org/8041264/',
-'5804109964':'http://sws.geonames.org/8041258/',
-'5257234322':'http://sws.geonames.org/8041271/',
-'6160992988':'http://sws.geonames.org/8042002/',
-'6160992989':'http://sws.geonames.org/8041257/',
-'4308529233':'http://sws.geonames.org/7870268/',
-'1467639418':'http://sws.geonames.org/8041270/',
-'4866614922':'http://sws.geonames.org/8041251/',
-'4866614923':'http://sws.geonames.org/8041251/',
-'6378799785':'http://sws.geonames.org/281069/',
-'4777198023':'http://sws.geonames.org/8041978/',
-'6096781987':'http://sws.geonames.org/8042071/',
-'5375101421':'http://sws.geonames.org/8041970/',
-'4381123896':'http://sws.geonames.org/8042001/',
-'5182033621':'http://sws.geonames.org/8051592/',
-'6313704087':'http://sws.geonames.org/8041656/',
-'4867939323':'http://sws.geonames.org/8041223/',
-'2775571683':'http://sws.geonames.org/8041200/',
-'4790707521':'http://sws.geonames.org/281081/',
-'5118117821':'http://sws.geonames.org/8042062/',
-'5118156121':'http://sws.geonames.org/8041260/',
-'5118355324':'http://sws.geonames.org/281123/',
-'5168788124':'http://sws.geonames.org/281069/',
-'4217332689':'http://sws.geonames.org/8042091/',
-'5354790524':'http://sws.geonames.org/8042092/',
-'5354819721':'http://sws.geonames.org/8042065/',
-'4313593175':'http://sws.geonames.org/8051592/',
-'4313645555':'http://sws.geonames.org/281126/',
-'4313648027':'http://sws.geonames.org/8051609/',
-'5152048724':'http://sws.geonames.org/8041976/',
-'4301565895':'http://sws.geonames.org/281084/',
-'4301566589':'http://sws.geonames.org/281084/',
-'4837014324':'http://sws.geonames.org/8042082/',
-'4759813924':'http://sws.geonames.org/8041978/',
-'6077133387':'http://sws.geonames.org/8042062/',
-'5906206885':'http://sws.geonames.org/8041249/',
-'5907826385':'http://sws.geonames.org/8041203/',
-'5870648186':'http://sws.geonames.org/8073310/',
-'5870671285':'http://sws.geonames.org/8073309/',
-'4947560621':'http://sws.geonames.org/8054050/',
-'4947575924':'http://sws.geonames.org/8057530/',
-'4947610521':'http://sws.geonames.org/8057530/',
-'4319869389':'http://sws.geonames.org/8068290/',
-'4947627122':'http://sws.geonames.org/8057928/',
-'960265168':'http://sws.geonames.org/8072885/',
-'960265690':'http://sws.geonames.org/8072885/',
-'5340609422':'http://sws.geonames.org/8069857/',
-'5871243585':'http://sws.geonames.org/284356/',
-'5300293921':'http://sws.geonames.org/8056552/',
-'5103867621':'http://sws.geonames.org/8057490/',
-'3478463609':'http://sws.geonames.org/8075565/',
-'4320782891':'http://sws.geonames.org/8073018/',
-'3693968185':'http://sws.geonames.org/8057244/',
-'4948907524':'http://sws.geonames.org/8054054/',
-'4564967189':'http://sws.geonames.org/285133/',
-'2150103476':'http://sws.geonames.org/10105286/',
-'2609491186':'http://sws.geonames.org/10302562/',
-'2150103487':'http://sws.geonames.org/10302562/',
-'5341552323':'http://sws.geonames.org/8068333/',
-'5341552423':'http://sws.geonames.org/8068333/',
-'5341582321':'http://sws.geonames.org/8068313/',
-'5341582322':'http://sws.geonames.org/8068313/',
-'4445534689':'http://sws.geonames.org/6957223/',
-'4271114089':'http://sws.geonames.org/8068388/',
-'4665647290':'http://sws.geonames.org/284593/',
-'4285492592':'http://sws.geonames.org/8069955/',
-'5308742421':'http://sws.geonames.org/8055727/',
-'5308742721':'http://sws.geonames.org/8054006/',
-'4102978491':'http://sws.geonames.org/8073308/',
-'5985323693':'http://sws.geonames.org/8071267/',
-'3554403461':'http://sws.geonames.org/281356/',
-'5342250322':'http://sws.geonames.org/8138865/',
-'2423800347':'http://sws.geonames.org/285094/',
-'2423800357':'http://sws.geonames.org/10302563/',
-'2423800365':'http://sws.geonames.org/10302563/',
-'4294364594':'http://sws.geonames.org/8057927/',
-'4294377795':'http://sws.geonames.org/284067/',
-'4294377796':'http://sws.geonames.org/284067/',
-'3048360420':'http://sws.geonames.org/8068860/',
-'5465320221':'http://sws.geonames.org/8074312/',
-'4116657050':'http://sws.geonames.org/8073016/',
-'4968235121':'http://sws.geonames.org/285190/',
-'6283251986':'http://sws.geonames.org/8052723/',
-'2944706656':'http://sws.geonames.org/8057236/',
-'4720358592':'http://sws.geonames.org/8052895/',
-'4720377091':'http://sws.geonames.org/8052932/',
-'4788693325':'http://sws.geonames.org/8057221/',
-'5859684962':'http://sws.geonames.org/8052897/',
-'1391051510':'http://sws.geonames.org/8057530/',
-'6082737585':'http://sws.geonames.org/8075001/',
-'5181448919':'http://sws.geonames.org/8069018/',
-'5181464822':'http://sws.geonames.org/8070356/',
-'3528600820':'http://sws.geonames.org/8069859/',
-'4367720693':'http://sws.geonames.org/284196/',
-'4353056894':'http://sws.geonames.org/8072884/',
-'6264098686':'http://sws.geonames.org/8055795/',
-'4367928790':'http://sws.geonames.org/284237/',
-'5181767222':'http://sws.geonames.org/8072470/',
-'4982439823':'http://sws.geonames.org/282110/',
-'4104251090':'http://sws.geonames.org/8067684/',
-'4104264289':'http://sws.geonames.org/8067684/',
-'2662713705':'http://sws.geonames.org/8057933/',
-'5574475721':'http://sws.geonames.org/283699/',
-'973573475':'http://sws.geonames.org/8054063/',
-'3493398507':'http://sws.geonames.org/281998/',
-'5760476768':'http://sws.geonames.org/8075560/',
-'5705669824':'http://sws.geonames.org/8074266/',
-'5277684421':'http://sws.geonames.org/8068378/',
-'5277704521':'http://sws.geonames.org/8068448/',
-'4789464697':'http://sws.geonames.org/8074786/',
-'4789464698':'http://sws.geonames.org/8074786/',
-'6165294288':'http://sws.geonames.org/284597/',
-'4402015966':'http://sws.geonames.org/8056590/',
-'4789555321':'http://sws.geonames.org/284294/',
-'3037086076':'http://sws.geonames.org/8057530/',
-'3037088784':'http://sws.geonames.org/282239/',
-'3878093988':'http://sws.geonames.org/8053967/',
-'4402347189':'http://sws.geonames.org/8074228/',
-'928457586':'http://sws.geonames.org/8074929/',
-'4494418697':'http://sws.geonames.org/8071251/',
-'5861210088':'http://sws.geonames.org/6957220/',
-'5384278750':'http://sws.geonames.org/8057232/',
-'4307150790':'http://sws.geonames.org/282812/',
-'5384279427':'http://sws.geonames.org/8071253/',
-'4038027292':'http://sws.geonames.org/8056615/',
-'4950267511':'http://sws.geonames.org/8075340/',
-'2472071363':'http://sws.geonames.org/8134239/',
-'4307195090':'http://sws.geonames.org/8057530/',
-'5061608827':'http://sws.geonames.org/8069017/',
-'4621139290':'http://sws.geonames.org/281565/',
-'4769001945':'http://sws.geonames.org/8074266/',
-'4746747421':'http://sws.geonames.org/8057567/',
-'2519556564':'http://sws.geonames.org/284559/',
-'5027391323':'http://sws.geonames.org/8537317/',
-'2650182119':'http://sws.geonames.org/8072888/',
-'4436437389':'http://sws.geonames.org/8073384/',
-'4296328693':'http://sws.geonames.org/8335062/',
-'4296382196':'http://sws.geonames.org/8335062/',
-'5203976006':'http://sws.geonames.org/8052933/',
-'4332219020':'http://sws.geonames.org/8074944/',
-'4332219028':'http://sws.geonames.org/8074937/',
-'884077260':'http://sws.geonames.org/284279/',
-'4332267644':'http://sws.geonames.org/8075569/',
-'5126174653':'http://sws.geonames.org/8073379/',
-'5353235924':'http://sws.geonames.org/8074933/',
-'2683914960':'http://sws.geonames.org/8068442/',
-'2683929838':'http://sws.geonames.org/8068440/',
-'2683931488':'http://sws.geonames.org/8068338/',
-'2683932285':'http://sws.geonames.org/8068377/',
-'525523388':'http://sws.geonames.org/8056612/',
-'2683943249':'http://sws.geonames.org/8068337/',
-'2683954463':'http://sws.geonames.org/8068337/',
-'2683959766':'http://sws.geonames.org/8068381/',
-'525553758':'http://sws.geonames.org/8053948/',
-'2684026203':'http://sws.geonames.org/8068381/',
-'2684028622':'http://sws.geonames.org/8068439/',
-'4951037621':'http://sws.geonames.org/8057203/',
-'4951037721':'http://sws.geonames.org/8057206/',
-'3354245036':'http://sws.geonames.org/7273978/',
-'2396164834':'http://sws.geonames.org/7890301/',
-'6339378385':'http://sws.geonames.org/8057744/',
-'2396187856':'http://sws.geonames.org/7890173/',
-'2396187859':'http://sws.geonames.org/7890173/',
-'2396187870':'http://sws.geonames.org/10105286/',
-'2493259940':'http://sws.geonames.org/6957228/',
-'2493259941':'http://sws.geonames.org/10124410/',
-'2493259942':'http://sws.geonames.org/6957228/',
-'3391056252':'http://sws.geonames.org/8054021/',
-'5363206422':'http://sws.geonames.org/8074801/',
-'2493577319':'http://sws.geonames.org/8057530/',
-'517252802':'http://sws.geonames.org/8074789/',
-'4769471490':'http://sws.geonames.org/8068337/',
-'2417519380':'http://sws.geonames.org/9971482/',
-'5511652723':'http://sws.geonames.org/8072957/',
-'4803010924':'http://sws.geonames.org/8056624/',
-'4131196189':'http://sws.geonames.org/8068331/',
-'517327916':'http://sws.geonames.org/8073609/',
-'1250378011':'http://sws.geonames.org/8074931/',
-'1277435243':'http://sws.geonames.org/8055780/',
-'3557659978':'http://sws.geonames.org/284324/',
-'767932177':'http://sws.geonames.org/8067749/',
-'431622867':'http://sws.geonames.org/8074817/',
-'431623044':'http://sws.geonames.org/8074817/',
-'431623078':'http://sws.geonames.org/8074815/',
-'431623233':'http://sws.geonames.org/7870543/',
-'431623253':'http://sws.geonames.org/8074944/',
-'431623557':'http://sws.geonames.org/8074850/',
-'431623558':'http://sws.geonames.org/8074819/',
-'431623819':'http://sws.geonames.org/8074927/',
-'431623957':'http://sws.geonames.org/8074939/',
-'431623958':'http://sws.geonames.org/8074938/',
-'431623960':'http://sws.geonames.org/8074932/',
-'431623961':'http://sws.geonames.org/8074932/',
-'431624404':'http://sws.geonames.org/284324/',
-'431624407':'http://sws.geonames.org/8074983/',
-'431624424':'http://sws.geonames.org/8074970/',
-'431624430':'http://sws.geonames.org/8074967/',
-'431624550':'http://sws.geonames.org/284879/',
-'431624662':'http://sws.geonames.org/8074933/',
-'431624664':'http://sws.geonames.org/8074858/',
-'431624666':'http://sws.geonames.org/8074862/',
-'431624729':'http://sws.geonames.org/8074823/',
-'431624730':'http://sws.geonames.org/8074823/',
-'431624731':'http://sws.geonames.org/8074819/',
-'431624877':'http://sws.geonames.org/8074978/',
-'431624880':'http://sws.geonames.org/8074514/',
-'431624882':'http://sws.geonames.org/8074304/',
-'431624922':'http://sws.geonames.org/8074311/',
-'431625157':'http://sws.geonames.org/8073410/',
-'431626025':'http://sws.geonames.org/8074304/',
-'431626770':'http://sws.geonames.org/8074145/',
-'431626856':'http://sws.geonames.org/8073604/',
-'431627945':'http://sws.geonames.org/8074811/',
-'431628710':'http://sws.geonames.org/8074942/',
-'431628837':'http://sws.geonames.org/8074808/',
-'431628964':'http://sws.geonames.org/8075953/',
-'431629350':'http://sws.geonames.org/8074235/',
-'431629353':'http://sws.geonames.org/281609/',
-'431629431':'http://sws.geonames.org/8073733/',
-'431629556':'http://sws.geonames.org/8073605/',
-'431629557':'http://sws.geonames.org/8073605/',
-'431629558':'http://sws.geonames.org/8073605/',
-'431629741':'http://sws.geonames.org/8074938/',
-'431629837':'http://sws.geonames.org/8073605/',
-'431629843':'http://sws.geonames.org/8073602/',
-'431629961':'http://sws.geonames.org/8074928/',
-'431630091':'http://sws.geonames.org/8074819/',
-'431630108':'http://sws.geonames.org/8073608/',
-'431630231':'http://sws.geonames.org/8074227/',
-'431630788':'http://sws.geonames.org/8073603/',
-'431630942':'http://sws.geonames.org/8073604/',
-'431632953':'http://sws.geonames.org/7890694/',
-'431633406':'http://sws.geonames.org/281609/',
-'431634485':'http://sws.geonames.org/8073615/',
-'431634486':'http://sws.geonames.org/8073615/',
-'431634597':'http://sws.geonames.org/283122/',
-'431634982':'http://sws.geonames.org/8074889/',
-'431635161':'http://sws.geonames.org/8074278/',
-'431635162':'http://sws.geonames.org/8074274/',
-'431635163':'http://sws.geonames.org/8074274/',
-'431635299':'http://sws.geonames.org/7890356/',
-'431635300':'http://sws.geonames.org/8074306/',
-'431635308':'http://sws.geonames.org/8074267/',
-'431635599':'http://sws.geonames.org/8073596/',
-'431635658':'http://sws.geonames.org/8073600/',
-'431635685':'http://sws.geonames.org/8073598/',
-'431635698':'http://sws.geonames.org/11670529/',
-'431636308':'http://sws.geonames.org/8074926/',
-'431636895':'http://sws.geonames.org/7870560/',
-'431636913':'http://sws.geonames.org/7870560/',
-'431636922':'http://sws.geonames.org/284678/',
-'946459222':'http://sws.geonames.org/8057928/',
-'4332782889':'http://sws.geonames.org/8057870/',
-'5310930333':'http://sws.geonames.org/8069851/',
-'431708619':'http://sws.geonames.org/8069018/',
-'431708647':'http://sws.geonames.org/281657/',
-'431708663':'http://sws.geonames.org/8069018/',
-'431708757':'http://sws.geonames.org/281657/',
-'431708762':'http://sws.geonames.org/8069018/',
-'431708806':'http://sws.geonames.org/281657/',
-'431708809':'http://sws.geonames.org/8069018/',
-'431708812':'http://sws.geonames.org/8069025/',
-'5477091182':'http://sws.geonames.org/8067749/',
-'5477091183':'http://sws.geonames.org/8067670/',
-'431715867':'http://sws.geonames.org/284655/',
-'431720844':'http://sws.geonames.org/281791/',
-'431720847':'http://sws.geonames.org/8068451/',
-'431722322':'http://sws.geonames.org/8068258/',
-'431727947':'http://sws.geonames.org/284780/',
-'431730745':'http://sws.geonames.org/281638/',
-'5477092335':'http://sws.geonames.org/8067749/',
-'431735895':'http://sws.geonames.org/283570/',
-'431740095':'http://sws.geonames.org/8068255/',
-'431746336':'http://sws.geonames.org/284893/',
-'4460267194':'http://sws.geonames.org/8074145/',
-'5290234723':'http://sws.geonames.org/8073011/',
-'4414867992':'http://sws.geonames.org/284590/',
-'6095312786':'http://sws.geonames.org/281847/',
-'4308893548':'http://sws.geonames.org/8055730/',
-'1366411250':'http://sws.geonames.org/10124410/',
-'1366411257':'http://sws.geonames.org/285094/',
-'1366411276':'http://sws.geonames.org/10124410/',
-'1366428935':'http://sws.geonames.org/10302563/',
-'3950295826':'http://sws.geonames.org/8072991/',
-'1565732578':'http://sws.geonames.org/8069861/',
-'1366453012':'http://sws.geonames.org/6957229/',
-'1366454073':'http://sws.geonames.org/7890173/',
-'1366454074':'http://sws.geonames.org/10119627/',
-'1366457615':'http://sws.geonames.org/10124410/',
-'4369794189':'http://sws.geonames.org/8054078/',
-'4369795101':'http://sws.geonames.org/8057746/',
-'1366466398':'http://sws.geonames.org/10119827/',
-'1366466399':'http://sws.geonames.org/10105286/',
-'1366481454':'http://sws.geonames.org/10119827/',
-'1366489004':'http://sws.geonames.org/7890173/',
-'3901479904':'http://sws.geonames.org/8074819/',
-'1786333812':'http://sws.geonames.org/8057920/',
-'5083496425':'http://sws.geonames.org/8073308/',
-'3517391476':'http://sws.geonames.org/7870547/',
-'1366534408':'http://sws.geonames.org/10302563/',
-'5160216821':'http://sws.geonames.org/8055780/',
-'5663243021':'http://sws.geonames.org/8054082/',
-'4237021181':'http://sws.geonames.org/8068377/',
-'4370145977':'http://sws.geonames.org/8074796/',
-'5028810921':'http://sws.geonames.org/8068440/',
-'3673357531':'http://sws.geonames.org/8056315/',
-'4404377689':'http://sws.geonames.org/8057237/',
-'5236661421':'http://sws.geonames.org/7870992/',
-'4916240921':'http://sws.geonames.org/8057927/',
-'4425665291':'http://sws.geonames.org/8067726/',
-'5477970823':'http://sws.geonames.org/8073018/',
-'2357285027':'http://sws.geonames.org/281577/',
-'4984613222':'http://sws.geonames.org/8074817/',
-'4984613323':'http://sws.geonames.org/8074817/',
-'4355044590':'http://sws.geonames.org/8074796/',
-'5650682021':'http://sws.geonames.org/8071674/',
-'5084059323':'http://sws.geonames.org/8054061/',
-'5938400710':'http://sws.geonames.org/8073057/',
-'4610796689':'http://sws.geonames.org/8069860/',
-'4404811792':'http://sws.geonames.org/8056322/',
-'1394743935':'http://sws.geonames.org/8056546/',
-'1394747280':'http://sws.geonames.org/7890016/',
-'1394759557':'http://sws.geonames.org/8057928/',
-'2511166315':'http://sws.geonames.org/8068382/',
-'4170163918':'http://sws.geonames.org/8068388/',
-'1010586592':'http://sws.geonames.org/8057828/',
-'1010591217':'http://sws.geonames.org/8057530/',
-'4133310990':'http://sws.geonames.org/8071897/',
-'2511280641':'http://sws.geonames.org/8068441/',
-'4237518802':'http://sws.geonames.org/7870584/',
-'4714060394':'http://sws.geonames.org/8067677/',
-'4483787522':'http://sws.geonames.org/8056319/',
-'3480617385':'http://sws.geonames.org/8074824/',
-'4693158390':'http://sws.geonames.org/8069857/',
-'3473353904':'http://sws.geonames.org/8074791/',
-'3473353943':'http://sws.geonames.org/8074265/',
-'4382893093':'http://sws.geonames.org/8052708/',
-'4382893290':'http://sws.geonames.org/8052709/',
-'4938355443':'http://sws.geonames.org/284104/',
-'4681351995':'http://sws.geonames.org/281370/',
-'4474447391':'http://sws.geonames.org/8068443/',
-'1968724673':'http://sws.geonames.org/8055795/',
-'3026671623':'http://sws.geonames.org/8073016/',
-'6274201585':'http://sws.geonames.org/8071873/',
-'5875263387':'http://sws.geonames.org/285066/',
-'3583766924':'http://sws.geonames.org/8073308/',
-'2785023950':'http://sws.geonames.org/8056618/',
-'2785027275':'http://sws.geonames.org/8056618/',
-'2785027476':'http://sws.geonames.org/8056321/',
-'3950370505':'http://sws.geonames.org/8072974/',
-'3950436890':'http://sws.geonames.org/8073077/',
-'2785119753':'http://sws.geonames.org/8056589/',
-'3950514495':'http://sws.geonames.org/8073083/',
-'3950520657':'http://sws.geonames.org/8073304/',
-'3950580877':'http://sws.geonames.org/8073047/',
-'3950580878':'http://sws.geonames.org/8073047/',
-'3950614341':'http://sws.geonames.org/8073008/',
-'3950655433':'http://sws.geonames.org/8073379/',
-'5458133521':'http://sws.geonames.org/284594/',
-'2418607552':'http://sws.geonames.org/8073012/',
-'4370953319':'http://sws.geonames.org/8068440/',
-'5896809439':'http://sws.geonames.org/9886028/',
-'3426654787':'http://sws.geonames.org/8057745/',
-'5920236185':'http://sws.geonames.org/7870677/',
-'4591076289':'http://sws.geonames.org/8069018/',
-'6013018692':'http://sws.geonames.org/8069861/',
-'6013019287':'http://sws.geonames.org/284271/',
-'4569338600':'http://sws.geonames.org/8074279/',
-'5785990156':'http://sws.geonames.org/8068468/',
-'6322399985':'http://sws.geonames.org/8054078/',
-'2419781477':'http://sws.geonames.org/8056305/',
-'4959890724':'http://sws.geonames.org/8056552/',
-'4839482721':'http://sws.geonames.org/8074819/',
-'5312140437':'http://sws.geonames.org/8075574/',
-'4959906922':'http://sws.geonames.org/8057567/',
-'4959907221':'http://sws.geonames.org/8057220/',
-'4959907225':'http://sws.geonames.org/8057492/',
-'4569904391':'http://sws.geonames.org/284315/',
-'4521410404':'http://sws.geonames.org/8073015/',
-'4325961189':'http://sws.geonames.org/8067832/',
-'5253534022':'http://sws.geonames.org/281997/',
-'4570573701':'http://sws.geonames.org/8068447/',
-'4592627292':'http://sws.geonames.org/8054085/',
-'4624386790':'http://sws.geonames.org/8057923/',
-'5312735835':'http://sws.geonames.org/8075342/',
-'5312735836':'http://sws.geonames.org/8075342/',
-'1531776729':'http://sws.geonames.org/8073308/',
-'4522530890':'http://sws.geonames.org/8072888/',
-'4123232893':'http://sws.geonames.org/8067832/',
-'4299401804':'http://sws.geonames.org/8057233/',
-'3145083504':'http://sws.geonames.org/7890301/',
-'4123235497':'http://sws.geonames.org/8067832/',
-'4396155295':'http://sws.geonames.org/8069589/',
-'4299689492':'http://sws.geonames.org/8073018/',
-'4571079289':'http://sws.geonames.org/8068286/',
-'4606063168':'http://sws.geonames.org/8074789/',
-'4938806322':'http://sws.geonames.org/8068380/',
-'4938810021':'http://sws.geonames.org/8068441/',
-'5516299723':'http://sws.geonames.org/8073304/',
-'4715190825':'http://sws.geonames.org/8067684/',
-'431747404':'http://sws.geonames.org/8068252/',
-'431749733':'http://sws.geonames.org/281566/',
-'431750661':'http://sws.geonames.org/8068278/',
-'431753077':'http://sws.geonames.org/7870322/',
-'431754715':'http://sws.geonames.org/283570/',
-'4961468321':'http://sws.geonames.org/8054020/',
-'431756693':'http://sws.geonames.org/8068259/',
-'431766435':'http://sws.geonames.org/284933/',
-'431768022':'http://sws.geonames.org/285127/',
-'431770529':'http://sws.geonames.org/8068252/',
-'431776920':'http://sws.geonames.org/8068249/',
-'431777453':'http://sws.geonames.org/8068278/',
-'5304304823':'http://sws.geonames.org/8057826/',
-'4426701292':'http://sws.geonames.org/7870546/',
-'431783101':'http://sws.geonames.org/284999/',
-'431784951':'http://sws.geonames.org/283817/',
-'431785585':'http://sws.geonames.org/283540/',
-'431786328':'http://sws.geonames.org/284602/',
-'431789166':'http://sws.geonames.org/8073367/',
-'431789367':'http://sws.geonames.org/7870322/',
-'431789619':'http://sws.geonames.org/8068256/',
-'431791336':'http://sws.geonames.org/8068297/',
-'431792939':'http://sws.geonames.org/8072976/',
-'431794888':'http://sws.geonames.org/284999/',
-'1359316810':'http://sws.geonames.org/10124410/',
-'1359323663':'http://sws.geonames.org/10119827/',
-'431797211':'http://sws.geonames.org/8073047/',
-'431800467':'http://sws.geonames.org/8072968/',
-'431802779':'http://sws.geonames.org/283151/',
-'431804536':'http://sws.geonames.org/8073393/',
-'431806432':'http://sws.geonames.org/8073029/',
-'431814408':'http://sws.geonames.org/8073381/',
-'431822550':'http://sws.geonames.org/7870322/',
-'1605269919':'http://sws.geonames.org/281573/',
-'431835317':'http://sws.geonames.org/8073032/',
-'431836767':'http://sws.geonames.org/8073368/',
-'431836899':'http://sws.geonames.org/8072956/',
-'431836905':'http://sws.geonames.org/284347/',
-'431841770':'http://sws.geonames.org/8072973/',
-'431842180':'http://sws.geonames.org/7870992/',
-'431843782':'http://sws.geonames.org/8073057/',
-'1605310194':'http://sws.geonames.org/281573/',
-'1605310205':'http://sws.geonames.org/281573/',
-'431848691':'http://sws.geonames.org/8073380/',
-'2381258557':'http://sws.geonames.org/8057244/',
-'431850794':'http://sws.geonames.org/8073058/',
-'431854957':'http://sws.geonames.org/8073099/',
-'431855474':'http://sws.geonames.org/8072978/',
-'431865127':'http://sws.geonames.org/284347/',
-'431868519':'http://sws.geonames.org/8073049/',
-'431871718':'http://sws.geonames.org/8072955/',
-'431873909':'http://sws.geonames.org/8073310/',
-'431876615':'http://sws.geonames.org/284347/',
-'1404611790':'http://sws.geonames.org/8073036/',
-'1404611806':'http://sws.geonames.org/8073035/',
-'431881192':'http://sws.geonames.org/8073030/',
-'431888452':'http://sws.geonames.org/8073102/',
-'431894426':'http://sws.geonames.org/8073377/',
-'431896692':'http://sws.geonames.org/8071242/',
-'4328179495':'http://sws.geonames.org/8073072/',
-'431897042':'http://sws.geonames.org/8073028/',
-'431898510':'http://sws.geonames.org/284341/',
-'431901053':'http://sws.geonames.org/8072888/',
-'431901680':'http://sws.geonames.org/8071883/',
-'431902936':'http://sws.geonames.org/282140/',
-'431904721':'http://sws.geonames.org/8073056/',
-'431906781':'http://sws.geonames.org/284320/',
-'431907099':'http://sws.geonames.org/283636/',
-'431908879':'http://sws.geonames.org/8072893/',
-'431909695':'http://sws.geonames.org/8073101/',
-'431909793':'http://sws.geonames.org/282279/',
-'431910051':'http://sws.geonames.org/8073379/',
-'4328219689':'http://sws.geonames.org/8073072/',
-'431913946':'http://sws.geonames.org/8072474/',
-'431915904':'http://sws.geonames.org/8071241/',
-'431919446':'http://sws.geonames.org/8072480/',
-'431919869':'http://sws.geonames.org/8073389/',
-'431920698':'http://sws.geonames.org/8071873/',
-'431921955':'http://sws.geonames.org/8072899/',
-'431923237':'http://sws.geonames.org/8071245/',
-'431923385':'http://sws.geonames.org/8072465/',
-'431924443':'http://sws.geonames.org/284540/',
-'431924661':'http://sws.geonames.org/8071901/',
-'431926804':'http://sws.geonames.org/284320/',
-'431927079':'http://sws.geonames.org/8071892/',
-'431928034':'http://sws.geonames.org/281982/',
-'431928631':'http://sws.geonames.org/282284/',
-'431930154':'http://sws.geonames.org/8072478/',
-'431930806':'http://sws.geonames.org/8071628/',
-'431930845':'http://sws.geonames.org/8073027/',
-'5955625185':'http://sws.geonames.org/8057238/',
-'5109285825':'http://sws.geonames.org/8054080/',
-'431935516':'http://sws.geonames.org/8072474/',
-'431936402':'http://sws.geonames.org/284593/',
-'431937082':'http://sws.geonames.org/8072984/',
-'431944783':'http://sws.geonames.org/8071888/',
-'431946299':'http://sws.geonames.org/8072897/',
-'431949230':'http://sws.geonames.org/8073388/',
-'2401155266':'http://sws.geonames.org/9886034/',
-'431953022':'http://sws.geonames.org/8138821/',
-'4806036022':'http://sws.geonames.org/8074796/',
-'4939629521':'http://sws.geonames.org/8138821/',
-'4939629822':'http://sws.geonames.org/8071886/',
-'431955544':'http://sws.geonames.org/8071889/',
-'431956485':'http://sws.geonames.org/7870434/',
-'431957508':'http://sws.geonames.org/8073312/',
-'431959599':'http://sws.geonames.org/284701/',
-'4100729490':'http://sws.geonames.org/8068279/',
-'431961228':'http://sws.geonames.org/8072990/',
-'431964172':'http://sws.geonames.org/8073002/',
-'431966068':'http://sws.geonames.org/283129/',
-'431967441':'http://sws.geonames.org/284819/',
-'5304833010':'http://sws.geonames.org/8067670/',
-'431971146':'http://sws.geonames.org/8071887/',
-'431973880':'http://sws.geonames.org/283365/',
-'431975583':'http://sws.geonames.org/8072474/',
-'431977294':'http://sws.geonames.org/8071872/',
-'431980389':'http://sws.geonames.org/8072889/',
-'431981177':'http://sws.geonames.org/8072889/',
-'431983333':'http://sws.geonames.org/284356/',
-'4385225089':'http://sws.geonames.org/8073016/',
-'431988413':'http://sws.geonames.org/8072479/',
-'431988755':'http://sws.geonames.org/8072476/',
-'431989277':'http://sws.geonames.org/8071783/',
-'431990101':'http://sws.geonames.org/8073082/',
-'431992374':'http://sws.geonames.org/8071266/',
-'431993052':'http://sws.geonames.org/8072898/',
-'431993687':'http://sws.geonames.org/8072894/',
-'431994733':'http://sws.geonames.org/8073031/',
-'5304896199':'http://sws.geonames.org/8067647/',
-'5304903689':'http://sws.geonames.org/8067651/',
-'431995176':'http://sws.geonames.org/8073382/',
-'431997212':'http://sws.geonames.org/8072476/',
-'431998744':'http://sws.geonames.org/284693/',
-'431999305':'http://sws.geonames.org/281859/',
-'431999675':'http://sws.geonames.org/284593/',
-'432001008':'http://sws.geonames.org/8072995/',
-'1606190158':'http://sws.geonames.org/9971482/',
-'1606190171':'http://sws.geonames.org/9971482/',
-'432005128':'http://sws.geonames.org/284693/',
-'432005457':'http://sws.geonames.org/8072852/',
-'432006117':'http://sws.geonames.org/283129/',
-'432008153':'http://sws.geonames.org/8072479/',
-'432008648':'http://sws.geonames.org/8072465/',
-'432008822':'http://sws.geonames.org/8071245/',
-'432009545':'http://sws.geonames.org/8072466/',
-'432035994':'http://sws.geonames.org/8071881/',
-'432036547':'http://sws.geonames.org/8071626/',
-'4442514491':'http://sws.geonames.org/8072888/',
-'432039035':'http://sws.geonames.org/284347/',
-'2508149982':'http://sws.geonames.org/8057566/',
-'432040214':'http://sws.geonames.org/283428/',
-'432041004':'http://sws.geonames.org/8072858/',
-'1606326449':'http://sws.geonames.org/9886034/',
-'432045007':'http://sws.geonames.org/8072892/',
-'432045299':'http://sws.geonames.org/285062/',
-'432045374':'http://sws.geonames.org/8073073/',
-'5178971722':'http://sws.geonames.org/8057928/',
-'432046678':'http://sws.geonames.org/8070356/',
-'432047335':'http://sws.geonames.org/8138821/',
-'4442539092':'http://sws.geonames.org/8072886/',
-'2508161151':'http://sws.geonames.org/8057566/',
-'432047834':'http://sws.geonames.org/8072473/',
-'432048568':'http://sws.geonames.org/8071785/',
-'432048702':'http://sws.geonames.org/284295/',
-'2508167852':'http://sws.geonames.org/8057530/',
-'432053275':'http://sws.geonames.org/8071886/',
-'432060754':'http://sws.geonames.org/282216/',
-'432061984':'http://sws.geonames.org/282684/',
-'432062865':'http://sws.geonames.org/8072888/',
-'432063158':'http://sws.geonames.org/8070356/',
-'432064229':'http://sws.geonames.org/282283/',
-'5179015022':'http://sws.geonames.org/8056621/',
-'432067044':'http://sws.geonames.org/282423/',
-'432067159':'http://sws.geonames.org/8073045/',
-'432064696':'http://sws.geonames.org/284593/',
-'432068763':'http://sws.geonames.org/8071887/',
-'432070036':'http://sws.geonames.org/284343/',
-'432070114':'http://sws.geonames.org/8072468/',
-'432070935':'http://sws.geonames.org/282941/',
-'5305039474':'http://sws.geonames.org/8067677/',
-'432073463':'http://sws.geonames.org/8071891/',
-'5305043314':'http://sws.geonames.org/8067677/',
-'432073723':'http://sws.geonames.org/8071887/',
-'432074255':'http://sws.geonames.org/8071784/',
-'432075105':'http://sws.geonames.org/282108/',
-'5305045147':'http://sws.geonames.org/8067677/',
-'432075451':'http://sws.geonames.org/284196/',
-'432076300':'http://sws.geonames.org/284540/',
-'432077619':'http://sws.geonames.org/282283/',
-'432080318':'http://sws.geonames.org/282116/',
-'432080429':'http://sws.geonames.org/284593/',
-'432082132':'http://sws.geonames.org/8073368/',
-'432086479':'http://sws.geonames.org/282517/',
-'432086911':'http://sws.geonames.org/281982/',
-'432087059':'http://sws.geonames.org/8072892/',
-'432089645':'http://sws.geonames.org/284347/',
-'432091142':'http://sws.geonames.org/8073086/',
-'432092303':'http://sws.geonames.org/8073381/',
-'432093390':'http://sws.geonames.org/8138824/',
-'432093623':'http://sws.geonames.org/8072892/',
-'432094064':'http://sws.geonames.org/8072894/',
-'432094145':'http://sws.geonames.org/8072972/',
-'432094196':'http://sws.geonames.org/282284/',
-'4442699692':'http://sws.geonames.org/7870545/',
-'432096320':'http://sws.geonames.org/8072981/',
-'432098139':'http://sws.geonames.org/8072471/',
-'432099044':'http://sws.geonames.org/284356/',
-'432103826':'http://sws.geonames.org/8072894/',
-'432105163':'http://sws.geonames.org/284524/',
-'432105568':'http://sws.geonames.org/8072897/',
-'432105745':'http://sws.geonames.org/284489/',
-'432105815':'http://sws.geonames.org/284581/',
-'432105825':'http://sws.geonames.org/8072898/',
-'4275553520':'http://sws.geonames.org/284643/',
-'432109962':'http://sws.geonames.org/8070392/',
-'432110503':'http://sws.geonames.org/8071892/',
-'432110554':'http://sws.geonames.org/283636/',
-'432114690':'http://sws.geonames.org/8072890/',
-'432115123':'http://sws.geonames.org/8072889/',
-'432115717':'http://sws.geonames.org/281674/',
-'432115830':'http://sws.geonames.org/284581/',
-'4625897793':'http://sws.geonames.org/8057235/',
-'432121866':'http://sws.geonames.org/284341/',
-'432123124':'http://sws.geonames.org/8073371/',
-'432124460':'http://sws.geonames.org/283141/',
-'432124491':'http://sws.geonames.org/8072894/',
-'432126515':'http://sws.geonames.org/283408/',
-'432126940':'http://sws.geonames.org/8073048/',
-'432127099':'http://sws.geonames.org/8073302/',
-'432127371':'http://sws.geonames.org/7870992/',
-'432129127':'http://sws.geonames.org/8073020/',
-'432129239':'http://sws.geonames.org/8072894/',
-'432129272':'http://sws.geonames.org/284547/',
-'432131145':'http://sws.geonames.org/284054/',
-'432131525':'http://sws.geonames.org/284800/',
-'432134610':'http://sws.geonames.org/8073039/',
-'432134655':'http://sws.geonames.org/8072991/',
-'4374237297':'http://sws.geonames.org/8054061/',
-'432136717':'http://sws.geonames.org/284922/',
-'432137776':'http://sws.geonames.org/8073376/',
-'1787508060':'http://sws.geonames.org/8056623/',
-'432140794':'http://sws.geonames.org/8072968/',
-'432140842':'http://sws.geonames.org/8073372/',
-'432142271':'http://sws.geonames.org/8073083/',
-'432142775':'http://sws.geonames.org/8072889/',
-'432143192':'http://sws.geonames.org/8072889/',
-'432148414':'http://sws.geonames.org/282684/',
-'432150881':'http://sws.geonames.org/8072896/',
-'4919923621':'http://sws.geonames.org/8072474/',
-'4919923622':'http://sws.geonames.org/8072474/',
-'432156055':'http://sws.geonames.org/283850/',
-'432156546':'http://sws.geonames.org/8073388/',
-'432157962':'http://sws.geonames.org/8072893/',
-'432159332':'http://sws.geonames.org/8073101/',
-'432162900':'http://sws.geonames.org/8071866/',
-'432163009':'http://sws.geonames.org/8072526/',
-'432163046':'http://sws.geonames.org/8073046/',
-'432164149':'http://sws.geonames.org/8073304/',
-'432164716':'http://sws.geonames.org/8071881/',
-'432166016':'http://sws.geonames.org/282108/',
-'432166080':'http://sws.geonames.org/8072889/',
-'432167326':'http://sws.geonames.org/8138865/',
-'432169265':'http://sws.geonames.org/281293/',
-'432170118':'http://sws.geonames.org/8072482/',
-'432171782':'http://sws.geonames.org/284419/',
-'432173461':'http://sws.geonames.org/283592/',
-'432173619':'http://sws.geonames.org/8071871/',
-'432174211':'http://sws.geonames.org/8073077/',
-'432174783':'http://sws.geonames.org/284939/',
-'432175291':'http://sws.geonames.org/8070667/',
-'432175400':'http://sws.geonames.org/8071871/',
-'432175678':'http://sws.geonames.org/8072969/',
-'432177389':'http://sws.geonames.org/8071243/',
-'432179460':'http://sws.geonames.org/8073385/',
-'6255664088':'http://sws.geonames.org/8073379/',
-'432181424':'http://sws.geonames.org/8070003/',
-'432184451':'http://sws.geonames.org/8072889/',
-'432184524':'http://sws.geonames.org/8072474/',
-'432185113':'http://sws.geonames.org/8070392/',
-'432191101':'http://sws.geonames.org/283129/',
-'432191180':'http://sws.geonames.org/8073034/',
-'432194675':'http://sws.geonames.org/8073028/',
-'432200905':'http://sws.geonames.org/8073089/',
-'432204237':'http://sws.geonames.org/284320/',
-'432205690':'http://sws.geonames.org/8072967/',
-'432206526':'http://sws.geonames.org/8072974/',
-'432210090':'http://sws.geonames.org/8073367/',
-'432212560':'http://sws.geonames.org/8073377/',
-'432215719':'http://sws.geonames.org/8073050/',
-'432217716':'http://sws.geonames.org/8073373/',
-'432224374':'http://sws.geonames.org/8073034/',
-'432226903':'http://sws.geonames.org/8073313/',
-'432227723':'http://sws.geonames.org/8072989/',
-'432229205':'http://sws.geonames.org/8073382/',
-'432233428':'http://sws.geonames.org/8073317/',
-'432235837':'http://sws.geonames.org/8073389/',
-'432237394':'http://sws.geonames.org/8073057/',
-'432240599':'http://sws.geonames.org/8073017/',
-'5269918321':'http://sws.geonames.org/8068337/',
-'432244329':'http://sws.geonames.org/8073368/',
-'432248251':'http://sws.geonames.org/8073378/',
-'432249257':'http://sws.geonames.org/8072958/',
-'432254104':'http://sws.geonames.org/8073311/',
-'432255617':'http://sws.geonames.org/8073021/',
-'432255979':'http://sws.geonames.org/8073028/',
-'432259936':'http://sws.geonames.org/8055730/',
-'432260127':'http://sws.geonames.org/8052891/',
-'432260238':'http://sws.geonames.org/8052448/',
-'432260256':'http://sws.geonames.org/8052423/',
-'432260322':'http://sws.geonames.org/281778/',
-'432260328':'http://sws.geonames.org/8057198/',
-'432260382':'http://sws.geonames.org/8056613/',
-'432260429':'http://sws.geonames.org/8057530/',
-'432260440':'http://sws.geonames.org/8056552/',
-'432260487':'http://sws.geonames.org/8054073/',
-'432260601':'http://sws.geonames.org/8055780/',
-'432260630':'http://sws.geonames.org/8055781/',
-'432260636':'http://sws.geonames.org/8057234/',
-'432260887':'http://sws.geonames.org/8055781/',
-'432261260':'http://sws.geonames.org/8053632/',
-'432261686':'http://sws.geonames.org/8057530/',
-'432261752':'http://sws.geonames.org/8057746/',
-'432261763':'http://sws.geonames.org/8055799/',
-'432261771':'http://sws.geonames.org/8057528/',
-'432261848':'http://sws.geonames.org/285285/',
-'432261931':'http://sws.geonames.org/8052897/',
-'432261972':'http://sws.geonames.org/8056624/',
-'432262023':'http://sws.geonames.org/8057241/',
-'432262159':'http://sws.geonames.org/8054082/',
-'432262330':'http://sws.geonames.org/7870321/',
-'432262720':'http://sws.geonames.org/8055600/',
-'432262770':'http://sws.geonames.org/281593/',
-'432262867':'http://sws.geonames.org/8057922/',
-'432263112':'http://sws.geonames.org/283245/',
-'432263218':'http://sws.geonames.org/8057920/',
-'432263244':'http://sws.geonames.org/284966/',
-'432263336':'http://sws.geonames.org/8057921/',
-'432263416':'http://sws.geonames.org/8052461/',
-'432263591':'http://sws.geonames.org/8054048/',
-'432263605':'http://sws.geonames.org/284633/',
-'432263632':'http://sws.geonames.org/284078/',
-'432263634':'http://sws.geonames.org/8057870/',
-'432263676':'http://sws.geonames.org/8057920/',
-'432263959':'http://sws.geonames.org/8055920/',
-'432263962':'http://sws.geonames.org/8057921/',
-'432264046':'http://sws.geonames.org/8056618/',
-'432264052':'http://sws.geonames.org/282461/',
-'432264057':'http://sws.geonames.org/7889665/',
-'432264128':'http://sws.geonames.org/8055332/',
-'432264166':'http://sws.geonames.org/8057202/',
-'432264217':'http://sws.geonames.org/8055925/',
-'432264231':'http://sws.geonames.org/8055893/',
-'432264570':'http://sws.geonames.org/8055769/',
-'432264579':'http://sws.geonames.org/8056616/',
-'432264639':'http://sws.geonames.org/8056552/',
-'432264720':'http://sws.geonames.org/8053597/',
-'432264873':'http://sws.geonames.org/8053913/',
-'432264892':'http://sws.geonames.org/7870314/',
-'432265225':'http://sws.geonames.org/8055995/',
-'432265366':'http://sws.geonames.org/8054056/',
-'432265470':'http://sws.geonames.org/8056632/',
-'432265565':'http://sws.geonames.org/8053593/',
-'432265668':'http://sws.geonames.org/8054022/',
-'432266100':'http://sws.geonames.org/8055909/',
-'432266160':'http://sws.geonames.org/8055727/',
-'432266175':'http://sws.geonames.org/8057236/',
-'432266207':'http://sws.geonames.org/8057929/',
-'432266426':'http://sws.geonames.org/8057236/',
-'432266682':'http://sws.geonames.org/8055954/',
-'432266783':'http://sws.geonames.org/8056624/',
-'432266829':'http://sws.geonames.org/8052707/',
-'432267112':'http://sws.geonames.org/8053593/',
-'432267248':'http://sws.geonames.org/8057871/',
-'432267255':'http://sws.geonames.org/8052891/',
-'432267301':'http://sws.geonames.org/284342/',
-'432267322':'http://sws.geonames.org/8053967/',
-'432267361':'http://sws.geonames.org/8054021/',
-'432267452':'http://sws.geonames.org/8056619/',
-'432267471':'http://sws.geonames.org/8057230/',
-'432267583':'http://sws.geonames.org/8054019/',
-'432267684':'http://sws.geonames.org/8055787/',
-'432267719':'http://sws.geonames.org/8052911/',
-'432267774':'http://sws.geonames.org/8055773/',
-'432267884':'http://sws.geonames.org/8054079/',
-'4347356390':'http://sws.geonames.org/8056615/',
-'432268003':'http://sws.geonames.org/8057928/',
-'432268036':'http://sws.geonames.org/8055772/',
-'432268112':'http://sws.geonames.org/8055905/',
-'432268164':'http://sws.geonames.org/281778/',
-'432268179':'http://sws.geonames.org/8055765/',
-'432268344':'http://sws.geonames.org/8053964/',
-'432268352':'http://sws.geonames.org/8055749/',
-'432268448':'http://sws.geonames.org/8057921/',
-'432268685':'http://sws.geonames.org/8054078/',
-'432268770':'http://sws.geonames.org/8052711/',
-'432269100':'http://sws.geonames.org/8056615/',
-'432269188':'http://sws.geonames.org/8057927/',
-'432269377':'http://sws.geonames.org/8057236/',
-'432269419':'http://sws.geonames.org/8054080/',
-'432269441':'http://sws.geonames.org/8054054/',
-'432269481':'http://sws.geonames.org/282230/',
-'432269620':'http://sws.geonames.org/8057744/',
-'432269741':'http://sws.geonames.org/8057198/',
-'432269773':'http://sws.geonames.org/8057490/',
-'432269854':'http://sws.geonames.org/8054049/',
-'432270024':'http://sws.geonames.org/284559/',
-'432270117':'http://sws.geonames.org/283464/',
-'432270197':'http://sws.geonames.org/285032/',
-'432270326':'http://sws.geonames.org/285009/',
-'432270543':'http://sws.geonames.org/8056624/',
-'432270632':'http://sws.geonames.org/8054018/',
-'432270696':'http://sws.geonames.org/8056548/',
-'432271331':'http://sws.geonames.org/8054078/',
-'432271339':'http://sws.geonames.org/8057490/',
-'432271368':'http://sws.geonames.org/8057236/',
-'432271379':'http://sws.geonames.org/8054083/',
-'432271639':'http://sws.geonames.org/8055996/',
-'432271898':'http://sws.geonames.org/8054068/',
-'432271932':'http://sws.geonames.org/8055777/',
-'432271975':'http://sws.geonames.org/8057232/',
-'432272041':'http://sws.geonames.org/8134251/',
-'432272400':'http://sws.geonames.org/8057920/',
-'432272885':'http://sws.geonames.org/8056006/',
-'432272918':'http://sws.geonames.org/8053980/',
-'432272964':'http://sws.geonames.org/8055227/',
-'432273030':'http://sws.geonames.org/8055920/',
-'432273166':'http://sws.geonames.org/8057241/',
-'432273518':'http://sws.geonames.org/282812/',
-'432273597':'http://sws.geonames.org/7870314/',
-'432273692':'http://sws.geonames.org/8052892/',
-'432273736':'http://sws.geonames.org/8056552/',
-'432273910':'http://sws.geonames.org/8057931/',
-'432274132':'http://sws.geonames.org/285108/',
-'432274164':'http://sws.geonames.org/8055766/',
-'432274323':'http://sws.geonames.org/8134232/',
-'432274456':'http://sws.geonames.org/8055997/',
-'432274470':'http://sws.geonames.org/284238/',
-'432274550':'http://sws.geonames.org/284312/',
-'432274561':'http://sws.geonames.org/8055745/',
-'432274975':'http://sws.geonames.org/8052438/',
-'432274979':'http://sws.geonames.org/282726/',
-'432275151':'http://sws.geonames.org/8056611/',
-'432275154':'http://sws.geonames.org/8057565/',
-'432275350':'http://sws.geonames.org/8054059/',
-'432275540':'http://sws.geonames.org/285049/',
-'432275711':'http://sws.geonames.org/282783/',
-'432275771':'http://sws.geonames.org/8134232/',
-'432275909':'http://sws.geonames.org/8057826/',
-'432276520':'http://sws.geonames.org/8057919/',
-'432276544':'http://sws.geonames.org/8053600/',
-'432276691':'http://sws.geonames.org/8057567/',
-'432277079':'http://sws.geonames.org/8055996/',
-'432277362':'http://sws.geonames.org/8054021/',
-'432277499':'http://sws.geonames.org/8134232/',
-'432277517':'http://sws.geonames.org/284670/',
-'432277765':'http://sws.geonames.org/8057232/',
-'5828642799':'http://sws.geonames.org/8074793/',
-'432278156':'http://sws.geonames.org/284238/',
-'432278263':'http://sws.geonames.org/8052724/',
-'432278378':'http://sws.geonames.org/282230/',
-'432278578':'http://sws.geonames.org/7889665/',
-'432278586':'http://sws.geonames.org/8057920/',
-'432278771':'http://sws.geonames.org/8054051/',
-'432278899':'http://sws.geonames.org/7873902/',
-'432279307':'http://sws.geonames.org/8052723/',
-'432279410':'http://sws.geonames.org/285007/',
-'432279441':'http://sws.geonames.org/8053606/',
-'432279466':'http://sws.geonames.org/8057530/',
-'432279497':'http://sws.geonames.org/8053966/',
-'432280172':'http://sws.geonames.org/8055776/',
-'432280423':'http://sws.geonames.org/283466/',
-'432280425':'http://sws.geonames.org/8052446/',
-'432280462':'http://sws.geonames.org/284069/',
-'432280475':'http://sws.geonames.org/8056318/',
-'432280597':'http://sws.geonames.org/284306/',
-'432280733':'http://sws.geonames.org/8052473/',
-'432280802':'http://sws.geonames.org/8056321/',
-'432280872':'http://sws.geonames.org/8057230/',
-'432280901':'http://sws.geonames.org/8054085/',
-'432280933':'http://sws.geonames.org/8057241/',
-'432280994':'http://sws.geonames.org/8055287/',
-'432281216':'http://sws.geonames.org/8056552/',
-'432281231':'http://sws.geonames.org/8056546/',
-'432281372':'http://sws.geonames.org/8053116/',
-'432281542':'http://sws.geonames.org/8052473/',
-'432281549':'http://sws.geonames.org/282185/',
-'432281755':'http://sws.geonames.org/8053636/',
-'432281884':'http://sws.geonames.org/8054048/',
-'432282033':'http://sws.geonames.org/8054061/',
-'432282043':'http://sws.geonames.org/8055430/',
-'432282095':'http://sws.geonames.org/8052472/',
-'432282114':'http://sws.geonames.org/8054061/',
-'432282169':'http://sws.geonames.org/284297/',
-'432282223':'http://sws.geonames.org/7889665/',
-'432282266':'http://sws.geonames.org/282265/',
-'432282295':'http://sws.geonames.org/283713/',
-'432282338':'http://sws.geonames.org/7870391/',
-'432282348':'http://sws.geonames.org/284515/',
-'432282372':'http://sws.geonames.org/8057919/',
-'432282460':'http://sws.geonames.org/8057746/',
-'432282644':'http://sws.geonames.org/281808/',
-'432282703':'http://sws.geonames.org/8055781/',
-'432282713':'http://sws.geonames.org/8054056/',
-'432282759':'http://sws.geonames.org/8057244/',
-'432282888':'http://sws.geonames.org/8056621/',
-'432282914':'http://sws.geonames.org/8054054/',
-'432282966':'http://sws.geonames.org/8055990/',
-'432283021':'http://sws.geonames.org/284294/',
-'432283050':'http://sws.geonames.org/8054082/',
-'432283056':'http://sws.geonames.org/8053592/',
-'432283077':'http://sws.geonames.org/8055781/',
-'432283128':'http://sws.geonames.org/8053593/',
-'432283179':'http://sws.geonames.org/8053631/',
-'432283226':'http://sws.geonames.org/8054079/',
-'432283243':'http://sws.geonames.org/8053592/',
-'432283266':'http://sws.geonames.org/7873901/',
-'432283268':'http://sws.geonames.org/285049/',
-'432283274':'http://sws.geonames.org/8055800/',
-'432283492':'http://sws.geonames.org/8056324/',
-'432283503':'http://sws.geonames.org/8057921/',
-'432283505':'http://sws.geonames.org/8053592/',
-'432283513':'http://sws.geonames.org/8056619/',
-'432283533':'http://sws.geonames.org/8056547/',
-'432283596':'http://sws.geonames.org/8056547/',
-'432283613':'http://sws.geonames.org/8056543/',
-'432283709':'http://sws.geonames.org/8055901/',
-'432283710':'http://sws.geonames.org/8057236/',
-'432283747':'http://sws.geonames.org/283142/',
-'432283778':'http://sws.geonames.org/8055788/',
-'432283829':'http://sws.geonames.org/8055780/',
-'432283884':'http://sws.geonames.org/284670/',
-'432283926':'http://sws.geonames.org/8057931/',
-'432284049':'http://sws.geonames.org/8057232/',
-'432284088':'http://sws.geonames.org/8057922/',
-'432284097':'http://sws.geonames.org/8057216/',
-'432284184':'http://sws.geonames.org/284815/',
-'432284538':'http://sws.geonames.org/8057221/',
-'432284569':'http://sws.geonames.org/8052433/',
-'432284618':'http://sws.geonames.org/8055746/',
-'432284709':'http://sws.geonames.org/8052428/',
-'432284768':'http://sws.geonames.org/284865/',
-'432285009':'http://sws.geonames.org/8057931/',
-'432285266':'http://sws.geonames.org/8055790/',
-'432285817':'http://sws.geonames.org/284797/',
-'432285857':'http://sws.geonames.org/8056547/',
-'432285913':'http://sws.geonames.org/284501/',
-'432285982':'http://sws.geonames.org/8056590/',
-'432285996':'http://sws.geonames.org/8053593/',
-'432286266':'http://sws.geonames.org/8052467/',
-'432286576':'http://sws.geonames.org/8055781/',
-'432286587':'http://sws.geonames.org/282234/',
-'432286662':'http://sws.geonames.org/8052473/',
-'432286799':'http://sws.geonames.org/8054082/',
-'432286809':'http://sws.geonames.org/8057921/',
-'432286826':'http://sws.geonames.org/8056612/',
-'432286882':'http://sws.geonames.org/8057919/',
-'432287019':'http://sws.geonames.org/8053597/',
-'432287021':'http://sws.geonames.org/8054063/',
-'432287024':'http://sws.geonames.org/8056624/',
-'432287316':'http://sws.geonames.org/8053592/',
-'432287345':'http://sws.geonames.org/8053596/',
-'432287426':'http://sws.geonames.org/284996/',
-'432287504':'http://sws.geonames.org/8052894/',
-'432287895':'http://sws.geonames.org/8054078/',
-'432287898':'http://sws.geonames.org/8052913/',
-'432288017':'http://sws.geonames.org/8052467/',
-'432288186':'http://sws.geonames.org/8057928/',
-'432288200':'http://sws.geonames.org/7870314/',
-'432288218':'http://sws.geonames.org/8054063/',
-'432288436':'http://sws.geonames.org/282234/',
-'432288476':'http://sws.geonames.org/8052093/',
-'432288605':'http://sws.geonames.org/8055560/',
-'432288678':'http://sws.geonames.org/8054080/',
-'432288893':'http://sws.geonames.org/8054606/',
-'432288900':'http://sws.geonames.org/284515/',
-'432288921':'http://sws.geonames.org/8056615/',
-'432289045':'http://sws.geonames.org/8054082/',
-'432289282':'http://sws.geonames.org/8054050/',
-'432289387':'http://sws.geonames.org/8054054/',
-'432289601':'http://sws.geonames.org/8052918/',
-'432289727':'http://sws.geonames.org/8057528/',
-'432289914':'http://sws.geonames.org/8055783/',
-'432289947':'http://sws.geonames.org/8053965/',
-'432289976':'http://sws.geonames.org/8057927/',
-'432290206':'http://sws.geonames.org/8054020/',
-'432290267':'http://sws.geonames.org/284332/',
-'432290435':'http://sws.geonames.org/8057920/',
-'432290566':'http://sws.geonames.org/284864/',
-'432290849':'http://sws.geonames.org/8055946/',
-'432291020':'http://sws.geonames.org/8056545/',
-'432291069':'http://sws.geonames.org/8053631/',
-'432291408':'http://sws.geonames.org/8052919/',
-'432291540':'http://sws.geonames.org/8055903/',
-'432291561':'http://sws.geonames.org/8054021/',
-'432291600':'http://sws.geonames.org/8057920/',
-'432291613':'http://sws.geonames.org/8053634/',
-'432291636':'http://sws.geonames.org/7870316/',
-'432291821':'http://sws.geonames.org/8057921/',
-'432292045':'http://sws.geonames.org/282069/',
-'432292399':'http://sws.geonames.org/8056321/',
-'432292689':'http://sws.geonames.org/8057567/',
-'432292692':'http://sws.geonames.org/7873901/',
-'432292701':'http://sws.geonames.org/281808/',
-'432292739':'http://sws.geonames.org/284332/',
-'432292952':'http://sws.geonames.org/8054059/',
-'432293171':'http://sws.geonames.org/8054078/',
-'432293215':'http://sws.geonames.org/8053597/',
-'432293314':'http://sws.geonames.org/8055746/',
-'432293570':'http://sws.geonames.org/8057567/',
-'432293612':'http://sws.geonames.org/8054014/',
-'432294111':'http://sws.geonames.org/8055990/',
-'432294515':'http://sws.geonames.org/8055121/',
-'432294621':'http://sws.geonames.org/8052898/',
-'432294656':'http://sws.geonames.org/8055328/',
-'432294659':'http://sws.geonames.org/8054055/',
-'432294689':'http://sws.geonames.org/284237/',
-'432294790':'http://sws.geonames.org/8056611/',
-'432294805':'http://sws.geonames.org/8054078/',
-'432294933':'http://sws.geonames.org/284342/',
-'432294945':'http://sws.geonames.org/8053599/',
-'432294951':'http://sws.geonames.org/8057202/',
-'432294983':'http://sws.geonames.org/8052895/',
-'432295052':'http://sws.geonames.org/8056323/',
-'432295443':'http://sws.geonames.org/8055286/',
-'432295446':'http://sws.geonames.org/8054088/',
-'432295468':'http://sws.geonames.org/8054057/',
-'432295542':'http://sws.geonames.org/8054059/',
-'432295650':'http://sws.geonames.org/8054019/',
-'432295759':'http://sws.geonames.org/284996/',
-'432295785':'http://sws.geonames.org/8056624/',
-'432295797':'http://sws.geonames.org/8057871/',
-'432295931':'http://sws.geonames.org/8054082/',
-'432295932':'http://sws.geonames.org/8055922/',
-'432296039':'http://sws.geonames.org/8055223/',
-'432296142':'http://sws.geonames.org/8057218/',
-'432296185':'http://sws.geonames.org/8054059/',
-'432296296':'http://sws.geonames.org/8052895/',
-'432296314':'http://sws.geonames.org/8052891/',
-'432296543':'http://sws.geonames.org/8052932/',
-'432296814':'http://sws.geonames.org/8055765/',
-'432296890':'http://sws.geonames.org/8056618/',
-'432297099':'http://sws.geonames.org/8055744/',
-'432297144':'http://sws.geonames.org/8055768/',
-'432297184':'http://sws.geonames.org/285071/',
-'432297220':'http://sws.geonames.org/8134245/',
-'432297381':'http://sws.geonames.org/8057745/',
-'432297387':'http://sws.geonames.org/8054014/',
-'432297562':'http://sws.geonames.org/8057236/',
-'4276426405':'http://sws.geonames.org/8057931/',
-'432301104':'http://sws.geonames.org/284767/',
-'432304837':'http://sws.geonames.org/283843/',
-'432311838':'http://sws.geonames.org/7889501/',
-'432315190':'http://sws.geonames.org/283449/',
-'432316180':'http://sws.geonames.org/283843/',
-'432317599':'http://sws.geonames.org/285100/',
-'432319724':'http://sws.geonames.org/283843/',
-'432319949':'http://sws.geonames.org/7870488/',
-'432321624':'http://sws.geonames.org/7870488/',
-'432325150':'http://sws.geonames.org/284427/',
-'432325535':'http://sws.geonames.org/283092/',
-'432329696':'http://sws.geonames.org/7871003/',
-'4717234737':'http://sws.geonames.org/8067677/',
-'432334705':'http://sws.geonames.org/8069847/',
-'432334709':'http://sws.geonames.org/8069847/',
-'432334710':'http://sws.geonames.org/8069846/',
-'432334713':'http://sws.geonames.org/8069846/',
-'432334723':'http://sws.geonames.org/8069848/',
-'432334724':'http://sws.geonames.org/8069848/',
-'432334725':'http://sws.geonames.org/8069844/',
-'432334738':'http://sws.geonames.org/8069850/',
-'432334740':'http://sws.geonames.org/8069850/',
-'432334745':'http://sws.geonames.org/8069846/',
-'432334749':'http://sws.geonames.org/8069857/',
-'432334794':'http://sws.geonames.org/8069860/',
-'432334796':'http://sws.geonames.org/8069860/',
-'432334797':'http://sws.geonames.org/8069860/',
-'432334830':'http://sws.geonames.org/8069045/',
-'432334832':'http://sws.geonames.org/8069852/',
-'432334833':'http://sws.geonames.org/8069851/',
-'432334835':'http://sws.geonames.org/282457/',
-'432334843':'http://sws.geonames.org/8069843/',
-'432334846':'http://sws.geonames.org/8069851/',
-'432334847':'http://sws.geonames.org/8069851/',
-'432334939':'http://sws.geonames.org/8069589/',
-'432335018':'http://sws.geonames.org/8067680/',
-'432335060':'http://sws.geonames.org/8067704/',
-'432335088':'http://sws.geonames.org/8067703/',
-'4276586700':'http://sws.geonames.org/8057931/',
-'432335691':'http://sws.geonames.org/8067677/',
-'432335732':'http://sws.geonames.org/8067749/',
-'432335788':'http://sws.geonames.org/8067675/',
-'432335845':'http://sws.geonames.org/8067757/',
-'432336082':'http://sws.geonames.org/8067656/',
-'432336257':'http://sws.geonames.org/8067661/',
-'432336280':'http://sws.geonames.org/8067729/',
-'432336576':'http://sws.geonames.org/8067676/',
-'432336705':'http://sws.geonames.org/8067760/',
-'432337008':'http://sws.geonames.org/8067742/',
-'432337309':'http://sws.geonames.org/8067751/',
-'432337347':'http://sws.geonames.org/8067702/',
-'432337982':'http://sws.geonames.org/8067741/',
-'432338099':'http://sws.geonames.org/8067672/',
-'432338220':'http://sws.geonames.org/8067744/',
-'432338352':'http://sws.geonames.org/281732/',
-'432338430':'http://sws.geonames.org/8067676/',
-'432338446':'http://sws.geonames.org/8067744/',
-'432338847':'http://sws.geonames.org/8067659/',
-'432338913':'http://sws.geonames.org/8067751/',
-'432339096':'http://sws.geonames.org/8067703/',
-'432339097':'http://sws.geonames.org/8067699/',
-'432339122':'http://sws.geonames.org/8067637/',
-'432339259':'http://sws.geonames.org/8067662/',
-'432339793':'http://sws.geonames.org/8067672/',
-'432340456':'http://sws.geonames.org/8067750/',
-'432340742':'http://sws.geonames.org/8067741/',
-'432340786':'http://sws.geonames.org/8067751/',
-'432340822':'http://sws.geonames.org/8067670/',
-'432340934':'http://sws.geonames.org/8067672/',
-'432341006':'http://sws.geonames.org/8067749/',
-'432341063':'http://sws.geonames.org/8067728/',
-'4955513823':'http://sws.geonames.org/8056611/',
-'432341269':'http://sws.geonames.org/8067746/',
-'432341740':'http://sws.geonames.org/8067674/',
-'432341814':'http://sws.geonames.org/8067733/',
-'432342621':'http://sws.geonames.org/8067742/',
-'432342711':'http://sws.geonames.org/8067728/',
-'432342946':'http://sws.geonames.org/8067704/',
-'432343237':'http://sws.geonames.org/8067748/',
-'432343789':'http://sws.geonames.org/8067703/',
-'432343887':'http://sws.geonames.org/8067684/',
-'432343924':'http://sws.geonames.org/8067746/',
-'432344087':'http://sws.geonames.org/8067651/',
-'432344128':'http://sws.geonames.org/8067751/',
-'432344248':'http://sws.geonames.org/8067746/',
-'432344296':'http://sws.geonames.org/8067672/',
-'432344387':'http://sws.geonames.org/8067676/',
-'432344390':'http://sws.geonames.org/8067678/',
-'432344922':'http://sws.geonames.org/8067752/',
-'432344997':'http://sws.geonames.org/282976/',
-'432345244':'http://sws.geonames.org/8068867/',
-'432345434':'http://sws.geonames.org/8068859/',
-'5694558621':'http://sws.geonames.org/8072860/',
-'432345957':'http://sws.geonames.org/284485/',
-'432346280':'http://sws.geonames.org/8068866/',
-'432346578':'http://sws.geonames.org/284792/',
-'432347047':'http://sws.geonames.org/282837/',
-'432347761':'http://sws.geonames.org/283580/',
-'432348847':'http://sws.geonames.org/282264/',
-'432348916':'http://sws.geonames.org/7870324/',
-'432348925':'http://sws.geonames.org/8068859/',
-'432349247':'http://sws.geonames.org/283055/',
-'432349381':'http://sws.geonames.org/8068862/',
-'432349417':'http://sws.geonames.org/8068861/',
-'432349544':'http://sws.geonames.org/8068846/',
-'432349625':'http://sws.geonames.org/284624/',
-'432349914':'http://sws.geonames.org/7870324/',
-'432351852':'http://sws.geonames.org/281979/',
-'432351916':'http://sws.geonames.org/8068862/',
-'432352001':'http://sws.geonames.org/284485/',
-'432352152':'http://sws.geonames.org/8068859/',
-'432352195':'http://sws.geonames.org/8068861/',
-'432352448':'http://sws.geonames.org/284271/',
-'432352503':'http://sws.geonames.org/282837/',
-'432352913':'http://sws.geonames.org/8068853/',
-'432353110':'http://sws.geonames.org/7870324/',
-'432353867':'http://sws.geonames.org/8068862/',
-'432350885':'http://sws.geonames.org/8068859/',
-'432351004':'http://sws.geonames.org/8068859/',
-'432351313':'http://sws.geonames.org/8068858/',
-'432351593':'http://sws.geonames.org/284527/',
-'432354102':'http://sws.geonames.org/8068854/',
-'432354477':'http://sws.geonames.org/8068846/',
-'432354509':'http://sws.geonames.org/8068862/',
-'432354871':'http://sws.geonames.org/284703/',
-'432354912':'http://sws.geonames.org/8068854/',
-'432355064':'http://sws.geonames.org/8068857/',
-'432355309':'http://sws.geonames.org/284694/',
-'432356239':'http://sws.geonames.org/283055/',
-'432356624':'http://sws.geonames.org/282342/',
-'432356686':'http://sws.geonames.org/8068861/',
-'432356795':'http://sws.geonames.org/283955/',
-'432357728':'http://sws.geonames.org/282837/',
-'432357879':'http://sws.geonames.org/284792/',
-'432358484':'http://sws.geonames.org/7870329/',
-'432358810':'http://sws.geonames.org/284485/',
-'432358856':'http://sws.geonames.org/8068859/',
-'432359012':'http://sws.geonames.org/8068859/',
-'2078307907':'http://sws.geonames.org/8074920/',
-'432368217':'http://sws.geonames.org/281226/',
-'432368799':'http://sws.geonames.org/284426/',
-'432371750':'http://sws.geonames.org/7870595/',
-'432372353':'http://sws.geonames.org/284557/',
-'2939366541':'http://sws.geonames.org/8054021/',
-'432374549':'http://sws.geonames.org/284100/',
-'4613863490':'http://sws.geonames.org/8071885/',
-'432378647':'http://sws.geonames.org/284557/',
-'432381485':'http://sws.geonames.org/7870329/',
-'5688207222':'http://sws.geonames.org/8067751/',
-'432383573':'http://sws.geonames.org/283614/',
-'432384058':'http://sws.geonames.org/282068/',
-'432384357':'http://sws.geonames.org/283918/',
-'432384886':'http://sws.geonames.org/284100/',
-'432386639':'http://sws.geonames.org/281801/',
-'5200693023':'http://sws.geonames.org/8071872/',
-'432394142':'http://sws.geonames.org/284100/',
-'5032987321':'http://sws.geonames.org/282980/',
-'4793636221':'http://sws.geonames.org/8068385/',
-'432403734':'http://sws.geonames.org/7870595/',
-'1390250645':'http://sws.geonames.org/8057870/',
-'1390250646':'http://sws.geonames.org/8057927/',
-'1390250647':'http://sws.geonames.org/8056589/',
-'1390250649':'http://sws.geonames.org/8057928/',
-'1390250650':'http://sws.geonames.org/8057198/',
-'1390250651':'http://sws.geonames.org/8056320/',
-'1390250652':'http://sws.geonames.org/8057240/',
-'1390250654':'http://sws.geonames.org/8056612/',
-'432410650':'http://sws.geonames.org/283358/',
-'432416047':'http://sws.geonames.org/283166/',
-'1390276628':'http://sws.geonames.org/282239/',
-'432420373':'http://sws.geonames.org/8537202/',
-'4718055547':'http://sws.geonames.org/8067672/',
-'432422678':'http://sws.geonames.org/283918/',
-'432422778':'http://sws.geonames.org/284426/',
-'4827982125':'http://sws.geonames.org/8074823/',
-'5100509521':'http://sws.geonames.org/8074826/',
-'432533124':'http://sws.geonames.org/284976/',
-'432534938':'http://sws.geonames.org/284100/',
-'432534978':'http://sws.geonames.org/284426/',
-'432536763':'http://sws.geonames.org/7870595/',
-'432539209':'http://sws.geonames.org/284046/',
-'432539510':'http://sws.geonames.org/283348/',
-'432539962':'http://sws.geonames.org/284313/',
-'432544249':'http://sws.geonames.org/281603/',
-'432544802':'http://sws.geonames.org/283153/',
-'432544803':'http://sws.geonames.org/283153/',
-'432544887':'http://sws.geonames.org/282476/',
-'432544888':'http://sws.geonames.org/282476/',
-'432544964':'http://sws.geonames.org/284888/',
-'432544981':'http://sws.geonames.org/284909/',
-'432545088':'http://sws.geonames.org/8068261/',
-'432545090':'http://sws.geonames.org/8068260/',
-'432545092':'http://sws.geonames.org/8068260/',
-'432545093':'http://sws.geonames.org/8068260/',
-'432545095':'http://sws.geonames.org/8068345/',
-'432545098':'http://sws.geonames.org/8068380/',
-'432545099':'http://sws.geonames.org/8068337/',
-'432545108':'http://sws.geonames.org/8068442/',
-'432545110':'http://sws.geonames.org/8068444/',
-'432545113':'http://sws.geonames.org/8068282/',
-'432545118':'http://sws.geonames.org/8068281/',
-'432545121':'http://sws.geonames.org/8068285/',
-'432545127':'http://sws.geonames.org/8068282/',
-'432545151':'http://sws.geonames.org/8068384/',
-'432545159':'http://sws.geonames.org/8068293/',
-'432545164':'http://sws.geonames.org/8068340/',
-'432545167':'http://sws.geonames.org/8068336/',
-'432545735':'http://sws.geonames.org/8057528/',
-'1254613335':'http://sws.geonames.org/8074890/',
-'4463581108':'http://sws.geonames.org/8067832/',
-'4463630990':'http://sws.geonames.org/8068331/',
-'4751269930':'http://sws.geonames.org/8075341/',
-'5067020921':'http://sws.geonames.org/8069018/',
-'5403972521':'http://sws.geonames.org/8056322/',
-'5999965287':'http://sws.geonames.org/8072863/',
-'5999966385':'http://sws.geonames.org/8071266/',
-'1112199870':'http://sws.geonames.org/8068338/',
-'4829044527':'http://sws.geonames.org/8075337/',
-'5765816357':'http://sws.geonames.org/8053594/',
-'3204460725':'http://sws.geonames.org/8074809/',
-'3204460727':'http://sws.geonames.org/8074824/',
-'3204460728':'http://sws.geonames.org/8074824/',
-'3204465824':'http://sws.geonames.org/8074809/',
-'4524942519':'http://sws.geonames.org/8068330/',
-'3483492258':'http://sws.geonames.org/284324/',
-'3419207697':'http://sws.geonames.org/8067746/',
-'3478216346':'http://sws.geonames.org/8074801/',
-'4174362112':'http://sws.geonames.org/8073734/',
-'4993558724':'http://sws.geonames.org/284797/',
-'4349516016':'http://sws.geonames.org/8052461/',
-'4464361593':'http://sws.geonames.org/8067755/',
-'4464361594':'http://sws.geonames.org/8067673/',
-'4464369791':'http://sws.geonames.org/8067751/',
-'4464402490':'http://sws.geonames.org/282239/',
-'5054248123':'http://sws.geonames.org/8074823/',
-'1588361854':'http://sws.geonames.org/8073302/',
-'4795071221':'http://sws.geonames.org/8075636/',
-'5054262321':'http://sws.geonames.org/8074823/',
-'5054262322':'http://sws.geonames.org/8074852/',
-'5054262421':'http://sws.geonames.org/8074847/',
-'3483686087':'http://sws.geonames.org/8074789/',
-'3483686090':'http://sws.geonames.org/8074520/',
-'3483686696':'http://sws.geonames.org/8074312/',
-'3483696782':'http://sws.geonames.org/8074791/',
-'3719973870':'http://sws.geonames.org/285094/',
-'3869438161':'http://sws.geonames.org/282793/',
-'3483863942':'http://sws.geonames.org/284324/',
-'3977812666':'http://sws.geonames.org/8056621/',
-'4220426590':'http://sws.geonames.org/8134164/',
-'1972192231':'http://sws.geonames.org/8075344/',
-'1972192246':'http://sws.geonames.org/8075345/',
-'4278611690':'http://sws.geonames.org/8057828/',
-'1343244132':'http://sws.geonames.org/8074981/',
-'4465023097':'http://sws.geonames.org/8054014/',
-'4420292389':'http://sws.geonames.org/8071630/',
-'2642219222':'http://sws.geonames.org/8057530/',
-'5752357932':'http://sws.geonames.org/8075341/',
-'5752357939':'http://sws.geonames.org/8075342/',
-'5752357941':'http://sws.geonames.org/8075341/',
-'5752357947':'http://sws.geonames.org/8075342/',
-'4648760390':'http://sws.geonames.org/8071892/',
-'5573327223':'http://sws.geonames.org/285103/',
-'2510069500':'http://sws.geonames.org/8072863/',
-'2163913972':'http://sws.geonames.org/282726/',
-'4696985291':'http://sws.geonames.org/8053948/',
-'3744160077':'http://sws.geonames.org/282239/',
-'4864388021':'http://sws.geonames.org/8067681/',
-'4649150392':'http://sws.geonames.org/8056316/',
-'4279132190':'http://sws.geonames.org/8068384/',
-'4683731890':'http://sws.geonames.org/8067832/',
-'6278501585':'http://sws.geonames.org/6269611/',
-'5209785021':'http://sws.geonames.org/8075341/',
-'5810412692':'http://sws.geonames.org/283444/',
-'4398717677':'http://sws.geonames.org/8057235/',
-'5592712022':'http://sws.geonames.org/7870595/',
-'4258565459':'http://sws.geonames.org/8055948/',
-'4865318723':'http://sws.geonames.org/8074825/',
-'4478604889':'http://sws.geonames.org/284237/',
-'5069180522':'http://sws.geonames.org/8067741/',
-'4775141424':'http://sws.geonames.org/8073047/',
-'4775182421':'http://sws.geonames.org/8073011/',
-'4840471030':'http://sws.geonames.org/8074520/',
-'5381054127':'http://sws.geonames.org/284943/',
-'4775365321':'http://sws.geonames.org/8073014/',
-'5381254524':'http://sws.geonames.org/8075565/',
-'5645668570':'http://sws.geonames.org/8057931/',
-'5645668571':'http://sws.geonames.org/8057828/',
-'5645668572':'http://sws.geonames.org/8056008/',
-'5645674657':'http://sws.geonames.org/8057530/',
-'5645674832':'http://sws.geonames.org/8057920/',
-'5645674833':'http://sws.geonames.org/8052891/',
-'5924248085':'http://sws.geonames.org/8068379/',
-'5791941953':'http://sws.geonames.org/8068337/',
-'5679672221':'http://sws.geonames.org/8075341/',
-'4852198527':'http://sws.geonames.org/8074516/',
-'5316069636':'http://sws.geonames.org/8075575/',
-'5792289134':'http://sws.geonames.org/8068861/',
-'5866418687':'http://sws.geonames.org/8068277/',
-'5866418688':'http://sws.geonames.org/8068277/',
-'4998809990':'http://sws.geonames.org/8073034/',
-'4315420261':'http://sws.geonames.org/8072890/',
-'4842527722':'http://sws.geonames.org/8073010/',
-'3524045093':'http://sws.geonames.org/8075336/',
-'6124456386':'http://sws.geonames.org/8069860/',
-'6124456387':'http://sws.geonames.org/8069860/',
-'5508806121':'http://sws.geonames.org/8068440/',
-'2332682128':'http://sws.geonames.org/10105286/',
-'4316200591':'http://sws.geonames.org/8071885/',
-'5077760222':'http://sws.geonames.org/8072482/',
-'5077760223':'http://sws.geonames.org/8072482/',
-'4187161790':'http://sws.geonames.org/8068280/',
-'4362111792':'http://sws.geonames.org/8068381/',
-'4526873589':'http://sws.geonames.org/8071787/',
-'4430910215':'http://sws.geonames.org/8056615/',
-'5228353721':'http://sws.geonames.org/8072955/',
-'5447710025':'http://sws.geonames.org/284574/',
-'3405888418':'http://sws.geonames.org/8075342/',
-'4410141990':'http://sws.geonames.org/6957225/',
-'4244175656':'http://sws.geonames.org/8073370/',
-'4763660823':'http://sws.geonames.org/282898/',
-'4910830023':'http://sws.geonames.org/8054021/',
-'6037348286':'http://sws.geonames.org/8068845/',
-'6037348287':'http://sws.geonames.org/8069852/',
-'4023240638':'http://sws.geonames.org/8067746/',
-'6037364085':'http://sws.geonames.org/283609/',
-'4317881589':'http://sws.geonames.org/284487/',
-'4363362904':'http://sws.geonames.org/8055433/',
-'2710872413':'http://sws.geonames.org/8335062/',
-'3454615970':'http://sws.geonames.org/8075344/',
-'4730658122':'http://sws.geonames.org/8071250/',
-'4843420021':'http://sws.geonames.org/8071629/',
-'5337020521':'http://sws.geonames.org/8068440/',
-'4056076136':'http://sws.geonames.org/10302563/',
-'5079378721':'http://sws.geonames.org/8056006/',
-'1939406019':'http://sws.geonames.org/8075344/',
-'1939406020':'http://sws.geonames.org/8075337/',
-'1939407326':'http://sws.geonames.org/8075565/',
-'1939409499':'http://sws.geonames.org/8074789/',
-'1939425945':'http://sws.geonames.org/8074791/',
-'1939439474':'http://sws.geonames.org/8074852/',
-'4966721221':'http://sws.geonames.org/8074311/',
-'1939458342':'http://sws.geonames.org/284324/',
-'5767897853':'http://sws.geonames.org/8073308/',
-'4966722621':'http://sws.geonames.org/8052897/',
-'4944364523':'http://sws.geonames.org/8068448/',
-'4222795391':'http://sws.geonames.org/8057922/',
-'4411395289':'http://sws.geonames.org/8073016/',
-'3689391780':'http://sws.geonames.org/282462/',
-'4731173821':'http://sws.geonames.org/8072890/',
-'5296886726':'http://sws.geonames.org/8073091/',
-'5296899421':'http://sws.geonames.org/8068388/',
-'5022678123':'http://sws.geonames.org/281732/',
-'4763884526':'http://sws.geonames.org/8537202/',
-'5734075721':'http://sws.geonames.org/8075342/',
-'2548220512':'http://sws.geonames.org/8057921/',
-'4223839590':'http://sws.geonames.org/8056632/',
-'4340196132':'http://sws.geonames.org/8072885/',
-'4585485897':'http://sws.geonames.org/8067755/',
-'4489873690':'http://sws.geonames.org/8071866/',
-'5058353922':'http://sws.geonames.org/8074823/',
-'5058354721':'http://sws.geonames.org/8074823/',
-'5891407887':'http://sws.geonames.org/8073016/',
-'2587642121':'http://sws.geonames.org/284487/',
-'5135515322':'http://sws.geonames.org/8057931/',
-'5297698422':'http://sws.geonames.org/284574/',
-'4003655770':'http://sws.geonames.org/8074981/',
-'4003655771':'http://sws.geonames.org/8074981/',
-'4003655779':'http://sws.geonames.org/284324/',
-'4003655941':'http://sws.geonames.org/8074809/',
-'4003660005':'http://sws.geonames.org/8074804/',
-'5058899221':'http://sws.geonames.org/8057921/',
-'4247666490':'http://sws.geonames.org/284294/',
-'4247666491':'http://sws.geonames.org/8055905/',
-'5755441924':'http://sws.geonames.org/8075345/',
-'5755441935':'http://sws.geonames.org/8075344/',
-'5755441945':'http://sws.geonames.org/8075340/',
-'4469120293':'http://sws.geonames.org/284067/',
-'4247715489':'http://sws.geonames.org/284294/',
-'2482177629':'http://sws.geonames.org/8073015/',
-'4707821889':'http://sws.geonames.org/8075568/',
-'1328675682':'http://sws.geonames.org/8073042/',
-'4319784900':'http://sws.geonames.org/8138824/',
-'1328686559':'http://sws.geonames.org/8073100/',
-'5370455622':'http://sws.geonames.org/8074145/',
-'6051373885':'http://sws.geonames.org/9886034/',
-'4708726789':'http://sws.geonames.org/8138865/',
-'5833847539':'http://sws.geonames.org/8073072/',
-'5584974023':'http://sws.geonames.org/8057931/',
-'5299115421':'http://sws.geonames.org/8055286/',
-'4741210447':'http://sws.geonames.org/11670379/',
-'4741358623':'http://sws.geonames.org/8138821/',
-'6249035644':'http://sws.geonames.org/8052088/',
-'6072235754':'http://sws.geonames.org/282260/',
-'4654162292':'http://sws.geonames.org/8072888/',
-'3491128448':'http://sws.geonames.org/281998/',
-'6227301894':'http://sws.geonames.org/10120236/',
-'3491333962':'http://sws.geonames.org/281998/',
-'3386695604':'http://sws.geonames.org/8053967/',
-'5233744421':'http://sws.geonames.org/8072888/',
-}
\ No newline at end of file
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+GEO_MAP_PATH = os.path.join(BASE_PATH, 'data/geo_map.csv')
+
+GEONAMES_URL = 'http://sws.geonames.org/{0}/'
+
+
+class GeoMap(Mapping):
+    # Read only OSM id -> GeoNames URL mapping backed by a data file, it is
+    # only read on first access. With mmap the links are compiled once to
+    # a sorted .npy file next to the CSV and looked up by binary search, so
+    # millions of links cost no more than the pages actually touched
+
+    def __init__(self, path=GEO_MAP_PATH, mmap=False):
+        self.path = path
+        self.mmap = mmap
+        self._links = None
+
+    def _read_csv(self):
+        with open(self.path, mode='r', encoding='utf-8') as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader)
+            for osm_id, geo_id in reader:
+                yield osm_id, geo_id
+
+    def _compile(self, npy_path):
+        import numpy as np
+
+        links = np.array([(int(osm_id), int(geo_id))
+                          for osm_id, geo_id in self._read_csv()],
+                         dtype=np.int64).reshape(-1, 2)
+        links = links[np.argsort(links[:, 0], kind='stable')]
+        np.save(npy_path, np.ascontiguousarray(links.T))
+
+    def _load(self):
+        if self._links is not None:
+            return self._links
+
+        if not self.mmap:
+            self._links = dict(self._read_csv())
+            return self._links
+
+        import numpy as np
+
+        npy_path = os.path.splitext(self.path)[0] + '.npy'
+        if (not os.path.exists(npy_path) or
+                os.path.getmtime(npy_path) < os.path.getmtime(self.path)):
+            self._compile(npy_path)
+        self._links = np.load(npy_path, mmap_mode='r')
+        return self._links
+
+    def _find(self, osm_id):
+        links = self._load()
+        if isinstance(links, dict):
+            return links.get(osm_id)
+
+        try:
+            osm_id = int(osm_id)
+        except (TypeError, ValueError):
+            return None
+        osm_ids = links[0]
+        position = osm_ids.searchsorted(osm_id)
+        if position < len(osm_ids) and osm_ids[position] == osm_id:
+            return links[1][position]
+        return None
+
+    def __getitem__(self, osm_id):
+        geo_id = self._find(osm_id)
+        if geo_id is None:
+            raise KeyError(osm_id)
+        return GEONAMES_URL.format(geo_id)
+
+    def __iter__(self):
+        links = self._load()
+        if isinstance(links, dict):
+            return iter(links)
+        return (str(osm_id) for osm_id in links[0].tolist())
+
+    def __len__(self):
+        links = self._load()
+        if isinstance(links, dict):
+            return len(links)
+        return len(links[0])
+
+
+GEO_MAP = GeoMap()
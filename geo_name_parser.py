@@ -1,14 +1,20 @@
 import os
 import csv
 import re
-from difflib import SequenceMatcher
-
-import xml.etree.ElementTree as ET
-import pandas as pd
-import geopy.distance
 
+from geo_distance import vincenty_distance
 from geo_mapper import GEO_MAP
-from parser import generate_tags, NAME_REGEX
+from geonames import (
+    GAZETTEER_PATH,
+    generate_geo_url,
+    load_geonames_table,
+    open_gazetteer,
+    parse_geo_id,
+    select_gazetteer_table,
+)
+from name_matcher import name_similarity
+from osm_reader import read_osm_csv
+from parser import generate_osm_nodes, NAME_REGEX
 
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 GEO_PATH = os.path.join(BASE_PATH, 'data/geonames/palestine.xml')
@@ -17,25 +23,11 @@ GAZA_PATH = os.path.join(BASE_PATH, 'data/gaza/gaza.csv')
 
 
 def find_name_match(osm_name_str, geo_name):
-    percentage = '0'
-    seq_match = SequenceMatcher(None, osm_name_str, geo_name)
-    name_len = max(len(osm_name_str), len(geo_name))
-    match = seq_match.find_longest_match(0,
-                                         len(osm_name_str),
-                                         0,
-                                         len(geo_name))
-    if match.size != 0:
-        percentage = match.size/name_len * 100
-        print("Common Substring ::>", osm_name_str[match.a: match.a + match.size])
-
-    percentage = '{0}%'.format(percentage)
-    return percentage
+    # Similarity score between 0 and 1, see name_matcher.name_similarity
+    return name_similarity(osm_name_str, geo_name)
 
 
 if __name__ == '__main__':
-    tree = ET.parse(GEO_PATH)
-    root = tree.getroot()
-
     rows = [['']]
     csv.register_dialect('myDialect',
                          quoting=csv.QUOTE_ALL,
@@ -44,45 +36,54 @@ if __name__ == '__main__':
     inverted_geo = dict(map(reversed, GEO_MAP.items()))
     osm_map = dict()
 
-    for child in root.iter('{http://www.geonames.org/ontology#}Feature'):
-        geo_id = child.attrib['{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about']
-        if inverted_geo.get(geo_id):
-            name = child.find('{http://www.geonames.org/ontology#}name').text
-            lat = child.find('{http://www.w3.org/2003/01/geo/wgs84_pos#}lat').text
-            lon = child.find('{http://www.w3.org/2003/01/geo/wgs84_pos#}long').text
-            osm_id = inverted_geo[geo_id]
-            osm_map[osm_id] = {
-                'geo_name': name,
-                'geo_lat': lat,
-                'geo_lon': lon,
-            }
+    # Only keep the features which are linked from GEO_MAP, a gazetteer
+    # built from site.csv has no names to match against
+    geo_ids = set(map(parse_geo_id, inverted_geo))
+    gazetteer = None
+    if os.path.isdir(GAZETTEER_PATH):
+        gazetteer = open_gazetteer(GAZETTEER_PATH)
+    if gazetteer is not None and gazetteer['has_names']:
+        table = select_gazetteer_table(gazetteer, geo_ids=geo_ids)
+    else:
+        table = load_geonames_table(GEO_PATH, geo_ids=geo_ids)
+    for geo_id, name, lat, lon in zip(table['geo_id'],
+                                      table['name'],
+                                      table['lat'],
+                                      table['lon']):
+        osm_id = inverted_geo[generate_geo_url(geo_id)]
+        osm_map[osm_id] = {
+            'geo_name': name,
+            'geo_lat': str(lat),
+            'geo_lon': str(lon),
+        }
 
     for source_path in [GAZA_PATH, WEST_BANK_PATH]:
-        with open(source_path, mode='r') as csv_file:
-            data = pd.read_csv(csv_file)
-            for _, entry in data.iterrows():
-                osm_id = str(entry['id'])
-                osm_name = ''
-                if osm_map.get(osm_id):
-                    tags = generate_tags(entry['tags'])
-                    for key, value in tags.items():
-                        if re.match(NAME_REGEX, key):
-                            osm_name = value
-
-                    osm_data = osm_map[osm_id]
-                    osm_data['osm_name'] = osm_name
-                    osm_data['osm_lat'] = str(entry['lat'])
-                    osm_data['osm_lon'] = str(entry['lon'])
+        for node in generate_osm_nodes(read_osm_csv(source_path)):
+            osm_id = str(node.id)
+            osm_name = ''
+            if osm_map.get(osm_id):
+                for key, value in node.items():
+                    if re.match(NAME_REGEX, key):
+                        osm_name = value
+
+                osm_data = osm_map[osm_id]
+                osm_data['osm_name'] = osm_name
+                osm_data['osm_lat'] = str(node.lat)
+                osm_data['osm_lon'] = str(node.lon)
 
     headers = [['geo_name', 'geo_lat',
                 'geo_lon', 'osm_name', 'osm_lat',
                 'osm_lon', 'name_match', 'distance']]
-    for key, comp_obj in osm_map.items():
+    # Measure every pair with one call instead of one geopy call per pair
+    comp_objs = list(osm_map.values())
+    distances = vincenty_distance(
+        [comp_obj['geo_lat'] for comp_obj in comp_objs],
+        [comp_obj['geo_lon'] for comp_obj in comp_objs],
+        [comp_obj['osm_lat'] for comp_obj in comp_objs],
+        [comp_obj['osm_lon'] for comp_obj in comp_objs])
+    for key, comp_obj, dis in zip(osm_map.keys(), comp_objs, distances):
         print(key)
-        coords_1 = (comp_obj['geo_lat'], comp_obj['geo_lon'])
-        coords_2 = (comp_obj['osm_lat'], comp_obj['osm_lon'])
-        dis = geopy.distance.vincenty(coords_1, coords_2).m
-        dis = '{0}m'.format(dis)
+        dis = '{0}m'.format(float(dis))
 
         name_match = find_name_match(comp_obj['osm_name'], comp_obj['geo_name'])
         headers.append([comp_obj['geo_name'],
@@ -0,0 +1,233 @@
+import argparse
+import csv
+import os
+import re
+import zipfile
+from array import array
+from xml.etree import ElementTree as et
+
+import numpy as np
+
+from geo_mapper import GEONAMES_URL
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+GEO_NAMES_PATH = os.path.join(BASE_PATH, 'data/geonames/site.csv')
+GAZETTEER_PATH = os.path.join(BASE_PATH, 'data/geonames/gazetteer')
+
+GN_NAMESPACE = 'http://www.geonames.org/ontology#'
+WGS84_NAMESPACE = 'http://www.w3.org/2003/01/geo/wgs84_pos#'
+RDF_NAMESPACE = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+
+FEATURE_TAG = '{%s}Feature' % GN_NAMESPACE
+NAME_TAG = '{%s}name' % GN_NAMESPACE
+LAT_TAG = '{%s}lat' % WGS84_NAMESPACE
+LON_TAG = '{%s}long' % WGS84_NAMESPACE
+ABOUT_ATTRIBUTE = '{%s}about' % RDF_NAMESPACE
+
+GEONAMES_ID_PATTERN = re.compile(r'(\d+)/?$')
+
+
+def parse_geo_id(geo_url):
+    # http://sws.geonames.org/8042091/ -> 8042091
+    return int(GEONAMES_ID_PATTERN.search(geo_url).group(1))
+
+
+def generate_geo_url(geo_id):
+    return GEONAMES_URL.format(geo_id)
+
+
+def in_bbox(lat, lon, bbox):
+    min_lat, min_lon, max_lat, max_lon = bbox
+    return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+
+
+def open_geonames_dump(geo_path):
+    # all-geonames-rdf.zip holds a single text file, read it in place
+    if zipfile.is_zipfile(geo_path):
+        with zipfile.ZipFile(geo_path) as archive:
+            return archive.open(archive.namelist()[0])
+    return open(geo_path, mode='rb')
+
+
+def read_feature(element, geo_ids, bbox):
+    geo_id = parse_geo_id(element.get(ABOUT_ATTRIBUTE))
+    if geo_ids is None or geo_id in geo_ids:
+        lat = float(element.findtext(LAT_TAG))
+        lon = float(element.findtext(LON_TAG))
+        if bbox is None or in_bbox(lat, lon, bbox):
+            return geo_id, element.findtext(NAME_TAG), lat, lon
+    return None
+
+
+def iter_document_features(dump_file, geo_ids=None, bbox=None):
+    # A single RDF/XML document, every feature is dropped from the tree as
+    # soon as it has been read so memory does not grow with the file
+    context = et.iterparse(dump_file, events=('start', 'end'))
+    _, root = next(context)
+    for event, element in context:
+        if event != 'end' or element.tag != FEATURE_TAG:
+            continue
+        feature = read_feature(element, geo_ids, bbox)
+        if feature is not None:
+            yield feature
+        element.clear()
+        root.clear()
+
+
+def iter_line_features(dump_file, geo_ids=None, bbox=None):
+    # The official dump has two lines per feature, its URL then its own
+    # one line RDF/XML document. The URL is enough to skip the features
+    # outside geo_ids without parsing their document
+    geo_id = None
+    for line in dump_file:
+        line = line.strip()
+        if not line.startswith(b'<'):
+            geo_id = parse_geo_id(line.decode('utf-8')) if line else None
+            continue
+        if geo_ids is not None and geo_id is not None \
+                and geo_id not in geo_ids:
+            continue
+        for element in et.fromstring(line).iter(FEATURE_TAG):
+            feature = read_feature(element, geo_ids, bbox)
+            if feature is not None:
+                yield feature
+
+
+def iter_geonames_features(geo_path, geo_ids=None, bbox=None):
+    # Stream the gn:Feature elements of a GeoNames RDF dump, either a
+    # single RDF/XML document or the line based all-geonames-rdf dump.
+    # geo_ids is a set of integer ids and bbox is
+    # (min_lat, min_lon, max_lat, max_lon)
+    with open_geonames_dump(geo_path) as dump_file:
+        if dump_file.peek(64).lstrip().startswith(b'<'):
+            yield from iter_document_features(dump_file, geo_ids, bbox)
+        else:
+            yield from iter_line_features(dump_file, geo_ids, bbox)
+
+
+def load_geonames_table(geo_path, geo_ids=None, bbox=None):
+    # Columnar (geo_id, name, lat, lon) table of the matching features
+    ids = array('q')
+    names = []
+    lats = array('d')
+    lons = array('d')
+    for geo_id, name, lat, lon in iter_geonames_features(geo_path,
+                                                         geo_ids,
+                                                         bbox):
+        ids.append(geo_id)
+        names.append(name)
+        lats.append(lat)
+        lons.append(lon)
+    return {
+        'geo_id': np.frombuffer(ids, dtype=np.int64),
+        'name': names,
+        'lat': np.frombuffer(lats, dtype=np.float64),
+        'lon': np.frombuffer(lons, dtype=np.float64),
+    }
+
+
+def load_geonames_csv(geo_names_path=GEO_NAMES_PATH):
+    # site.csv only carries "id","lat","long", the names are left empty
+    ids = array('q')
+    lats = array('d')
+    lons = array('d')
+    with open(geo_names_path, mode='r', encoding='utf-8') as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader)
+        for geo_url, lat, lon in reader:
+            ids.append(parse_geo_id(geo_url))
+            lats.append(float(lat))
+            lons.append(float(lon))
+    return {
+        'geo_id': np.frombuffer(ids, dtype=np.int64),
+        'name': [''] * len(ids),
+        'lat': np.frombuffer(lats, dtype=np.float64),
+        'lon': np.frombuffer(lons, dtype=np.float64),
+    }
+
+
+def build_gazetteer(table, gazetteer_path=GAZETTEER_PATH):
+    # One .npy file per column plus the UTF-8 names, each distinct name is
+    # stored once and features point to it through name_index
+    os.makedirs(gazetteer_path, exist_ok=True)
+    interned = dict()
+    name_index = np.fromiter(
+        (interned.setdefault(name or '', len(interned))
+         for name in table['name']),
+        dtype=np.int32,
+        count=len(table['name']))
+    encoded = [name.encode('utf-8') for name in interned]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+
+    np.save(os.path.join(gazetteer_path, 'geo_id.npy'),
+            np.asarray(table['geo_id'], dtype=np.int64))
+    np.save(os.path.join(gazetteer_path, 'lat.npy'),
+            np.asarray(table['lat'], dtype=np.float64))
+    np.save(os.path.join(gazetteer_path, 'lon.npy'),
+            np.asarray(table['lon'], dtype=np.float64))
+    np.save(os.path.join(gazetteer_path, 'name_index.npy'), name_index)
+    np.save(os.path.join(gazetteer_path, 'name_offsets.npy'), offsets)
+    # site.csv has no names, the name matching needs to know it
+    np.save(os.path.join(gazetteer_path, 'has_names.npy'),
+            np.asarray(any(table['name'])))
+    with open(os.path.join(gazetteer_path, 'names.bin'), mode='wb') as names:
+        names.write(b''.join(encoded))
+
+
+def open_gazetteer(gazetteer_path=GAZETTEER_PATH):
+    # Every column is memory mapped, nothing is read until it is used
+    gazetteer = dict()
+    for column in ('geo_id', 'lat', 'lon', 'name_index', 'name_offsets'):
+        gazetteer[column] = np.load(
+            os.path.join(gazetteer_path, column + '.npy'), mmap_mode='r')
+    has_names_path = os.path.join(gazetteer_path, 'has_names.npy')
+    names_path = os.path.join(gazetteer_path, 'names.bin')
+    if os.path.exists(has_names_path):
+        gazetteer['has_names'] = bool(np.load(has_names_path))
+    else:
+        gazetteer['has_names'] = bool(os.path.getsize(names_path))
+    if os.path.getsize(names_path):
+        gazetteer['names'] = np.memmap(names_path, dtype=np.uint8, mode='r')
+    else:
+        gazetteer['names'] = np.zeros(0, dtype=np.uint8)
+    return gazetteer
+
+
+def get_gazetteer_name(gazetteer, position):
+    offsets = gazetteer['name_offsets']
+    name = gazetteer['name_index'][position]
+    start, end = offsets[name], offsets[name + 1]
+    return gazetteer['names'][start:end].tobytes().decode('utf-8')
+
+
+def select_gazetteer_table(gazetteer, geo_ids=None):
+    # Same columns as load_geonames_table, restricted to geo_ids
+    positions = np.arange(len(gazetteer['geo_id']))
+    if geo_ids is not None:
+        wanted = np.fromiter(geo_ids, dtype=np.int64, count=len(geo_ids))
+        positions = np.flatnonzero(np.isin(gazetteer['geo_id'], wanted))
+    return {
+        'geo_id': np.asarray(gazetteer['geo_id'][positions]),
+        'name': [get_gazetteer_name(gazetteer, position)
+                 for position in positions],
+        'lat': np.asarray(gazetteer['lat'][positions]),
+        'lon': np.asarray(gazetteer['lon'][positions]),
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Compile GeoNames features into a binary gazetteer')
+    arg_parser.add_argument('source',
+                            nargs='?',
+                            default=GEO_NAMES_PATH,
+                            help='GeoNames RDF/XML document, '
+                                 'all-geonames-rdf dump or site.csv')
+    arg_parser.add_argument('--output', default=GAZETTEER_PATH)
+    args = arg_parser.parse_args()
+    if args.source.endswith('.csv'):
+        geo_table = load_geonames_csv(args.source)
+    else:
+        geo_table = load_geonames_table(args.source)
+    build_gazetteer(geo_table, args.output)
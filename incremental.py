@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+from collections import Counter
+
+from osm_node import OsmNode
+from osm_reader import read_osm_csv_chunks, CHUNK_SIZE
+from osm_xml_reader import (read_osm_change_chunks,
+                            CREATE_ACTION,
+                            DELETE_ACTION)
+from parser import (
+    DATA_SOURCES,
+    OSM_URL,
+    generate_node_properties,
+    generate_ntriples_node,
+    generate_output_path,
+    generate_tags,
+)
+
+INCREMENTAL_COLUMNS = ('id', 'tags', 'lat', 'lon', 'version')
+
+# Number of subjects per DELETE statement for removed nodes
+DELETE_BATCH_SIZE = 1000
+
+
+def load_state(state_path):
+    # The state maps every emitted node id to the version it was emitted at
+    if not os.path.exists(state_path):
+        return dict()
+    with open(state_path, mode='r', encoding='utf-8') as state_file:
+        return json.load(state_file)
+
+
+def save_state(state, state_path):
+    with open(state_path, mode='w', encoding='utf-8') as state_file:
+        json.dump(state, state_file)
+
+
+def generate_delete_statement(node_ids):
+    subjects = ' '.join('<{0}>'.format(OSM_URL.format(node_id))
+                        for node_id in node_ids)
+    return ('DELETE {{ ?s ?p ?o }} WHERE {{ VALUES ?s {{ {0} }} ?s ?p ?o }} ;\n'
+            .format(subjects))
+
+
+def generate_insert_statement(triples):
+    return 'INSERT DATA {{\n{0}}} ;\n'.format(''.join(triples))
+
+
+def generate_rdf_delta(source_path, chunk_size=CHUNK_SIZE):
+    # Only convert the nodes which are new or got a new version since the
+    # last run, the delta is a SPARQL Update removing the old triples of
+    # changed or deleted nodes and inserting the new ones
+    state_path = generate_output_path(source_path, 'json', '_state')
+    delta_path = generate_output_path(source_path, 'ru', '_delta')
+    state = load_state(state_path)
+    seen = set()
+    keys = Counter()
+    stats = Counter()
+
+    with open(delta_path, mode='w', encoding='utf-8') as delta_file:
+        chunks = read_osm_csv_chunks(source_path,
+                                     INCREMENTAL_COLUMNS,
+                                     chunk_size)
+        for rows in chunks:
+            changed = []
+            triples = []
+            for node_id, tags, lat, lon, version in rows:
+                node_id = str(node_id)
+                version = str(version)
+                seen.add(node_id)
+                previous = state.get(node_id)
+                if previous == version:
+                    continue
+                elif previous is None:
+                    stats['added'] += 1
+                else:
+                    stats['changed'] += 1
+                    changed.append(node_id)
+
+                node = OsmNode.from_tags(node_id, generate_tags(tags), lat, lon)
+                properties = generate_node_properties(node, keys)
+                triples.append(generate_ntriples_node(node_id, properties))
+                state[node_id] = version
+
+            if changed:
+                delta_file.write(generate_delete_statement(changed))
+            if triples:
+                delta_file.write(generate_insert_statement(triples))
+
+        deleted = [node_id for node_id in state if node_id not in seen]
+        for index in range(0, len(deleted), DELETE_BATCH_SIZE):
+            batch = deleted[index: index + DELETE_BATCH_SIZE]
+            delta_file.write(generate_delete_statement(batch))
+        for node_id in deleted:
+            del state[node_id]
+        stats['deleted'] = len(deleted)
+
+    save_state(state, state_path)
+    return stats
+
+
+def generate_change_delta(change_path, chunk_size=CHUNK_SIZE):
+    # Apply an osmChange (.osc) file, created nodes are inserted, modified
+    # nodes replace their triples and deleted nodes are removed
+    delta_path = generate_output_path(change_path, 'ru', '_delta')
+    keys = Counter()
+    stats = Counter()
+
+    with open(delta_path, mode='w', encoding='utf-8') as delta_file:
+        for rows in read_osm_change_chunks(change_path, chunk_size):
+            # A node may change more than once in a file, its last action
+            # within the chunk wins
+            changes = dict()
+            for action, node_id, tags, lat, lon in rows:
+                changes[str(node_id)] = (action, tags, lat, lon)
+
+            removed = []
+            triples = []
+            for node_id, (action, tags, lat, lon) in changes.items():
+                stats[action] += 1
+                if action != CREATE_ACTION:
+                    removed.append(node_id)
+                if action == DELETE_ACTION or not tags:
+                    continue
+                node = OsmNode.from_tags(node_id, tags, lat, lon)
+                properties = generate_node_properties(node, keys)
+                triples.append(generate_ntriples_node(node_id, properties))
+
+            if removed:
+                delta_file.write(generate_delete_statement(removed))
+            if triples:
+                delta_file.write(generate_insert_statement(triples))
+    return stats
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Convert only the nodes changed since the last run')
+    arg_parser.add_argument('--chunk-size',
+                            type=int,
+                            default=CHUNK_SIZE,
+                            help='Number of CSV rows to read at once')
+    arg_parser.add_argument('--change',
+                            action='append',
+                            default=None,
+                            help='Apply this .osc change file instead')
+    args = arg_parser.parse_args()
+    for change in args.change or ():
+        change_stats = generate_change_delta(change, args.chunk_size)
+        print('{0}: {1} created, {2} modified, {3} deleted'.format(
+            os.path.basename(change),
+            change_stats['create'],
+            change_stats['modify'],
+            change_stats['delete']))
+    for source in () if args.change else DATA_SOURCES:
+        delta_stats = generate_rdf_delta(source, args.chunk_size)
+        print('{0}: {1} added, {2} changed, {3} deleted'.format(
+            os.path.basename(source),
+            delta_stats['added'],
+            delta_stats['changed'],
+            delta_stats['deleted']))
@@ -0,0 +1,45 @@
+from collections import Counter
+from itertools import compress
+from operator import is_not
+from sys import getsizeof
+
+# Values are dropped all at once when the table gets this big, names and
+# descriptions are rarely repeated while the frequent values come back
+# after a few nodes
+MAX_VALUES = 1 << 16
+
+INTERNED_KEYS = dict()
+INTERNED_VALUES = dict()
+
+# Duplicates replaced by their interned copy in the current process and the
+# bytes they held, which can be freed once the reader drops its copy. Only
+# counted while enabled, measuring costs as much as the interning itself
+INTERN_STATS = Counter()
+INTERN_STATS_ENABLED = False
+
+
+def enable_intern_stats(enabled=True):
+    global INTERN_STATS_ENABLED
+    INTERN_STATS_ENABLED = enabled
+    INTERN_STATS.clear()
+
+
+def intern_strings(table, strings, name):
+    # Everything runs through map so the lookups stay in C
+    interned = tuple(map(table.setdefault, strings, strings))
+    if INTERN_STATS_ENABLED:
+        replaced = list(compress(strings, map(is_not, strings, interned)))
+        INTERN_STATS[name] += len(replaced)
+        INTERN_STATS['bytes'] += sum(map(getsizeof, replaced))
+    return interned
+
+
+def intern_key(key):
+    return INTERNED_KEYS.setdefault(key, key)
+
+
+def intern_tags(tags):
+    if len(INTERNED_VALUES) > MAX_VALUES:
+        INTERNED_VALUES.clear()
+    return (intern_strings(INTERNED_KEYS, tuple(tags.keys()), 'keys'),
+            intern_strings(INTERNED_VALUES, tuple(tags.values()), 'values'))
@@ -0,0 +1,135 @@
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+NGRAM_SIZE = 3
+
+# Letters which are written in more than one way, hamza carriers are
+# already unified by the NFKD decomposition in normalize_name
+ARABIC_LETTERS = str.maketrans({
+    'ٱ': 'ا',  # alef wasla
+    'ى': 'ي',  # alef maksura
+    'ی': 'ي',  # farsi yeh
+    'ة': 'ه',  # ta marbuta
+    'ک': 'ك',  # keheh
+    'ـ': None,  # tatweel
+})
+
+ARABIC_TRANSLITERATION = str.maketrans({
+    'ا': 'a', 'ب': 'b', 'ت': 't', 'ث': 'th',
+    'ج': 'j', 'ح': 'h', 'خ': 'kh', 'د': 'd',
+    'ذ': 'dh', 'ر': 'r', 'ز': 'z', 'س': 's',
+    'ش': 'sh', 'ص': 's', 'ض': 'd', 'ط': 't',
+    'ظ': 'z', 'ع': '', 'غ': 'gh', 'ف': 'f',
+    'ق': 'q', 'ك': 'k', 'ل': 'l', 'م': 'm',
+    'ن': 'n', 'ه': 'h', 'و': 'w', 'ي': 'y',
+    'ء': '',
+})
+
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]|_')
+SPACES_PATTERN = re.compile(r'\s+')
+# Vowels and the weak letters are what transliterations disagree on the
+# most, comparing the consonant skeleton makes مسجد and Masjid meet
+VOWELS_PATTERN = re.compile('[aeiouyw]')
+REPEATED_PATTERN = re.compile(r'(.)\1+')
+ARABIC_PATTERN = re.compile('[\u0600-\u06ff]')
+
+
+def normalize_name(name):
+    # Unicode compatibility forms, no tashkeel or Latin accents, unified
+    # Arabic letters, no punctuation and lower case
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(char for char in name
+                   if unicodedata.category(char) != 'Mn')
+    name = name.translate(ARABIC_LETTERS).casefold()
+    name = PUNCTUATION_PATTERN.sub(' ', name)
+    return SPACES_PATTERN.sub(' ', name).strip()
+
+
+def transliterate_name(name):
+    # Latin consonant skeleton of an already normalized name
+    name = name.translate(ARABIC_TRANSLITERATION).replace('q', 'k')
+    name = VOWELS_PATTERN.sub('', name)
+    name = REPEATED_PATTERN.sub(r'\1', name)
+    return SPACES_PATTERN.sub(' ', name).strip()
+
+
+def generate_ngrams(text, size=NGRAM_SIZE):
+    if not text:
+        return set()
+    text = ' {0} '.format(text)
+    return {text[index: index + size]
+            for index in range(max(len(text) - size + 1, 1))}
+
+
+def generate_name_forms(name):
+    normalized = normalize_name(name)
+    return normalized, transliterate_name(normalized)
+
+
+def is_arabic(name):
+    return ARABIC_PATTERN.search(name) is not None
+
+
+def dice(ngrams_1, ngrams_2):
+    if not ngrams_1 or not ngrams_2:
+        return 0.0
+    return 2 * len(ngrams_1 & ngrams_2) / (len(ngrams_1) + len(ngrams_2))
+
+
+def name_similarity(name_1, name_2):
+    # Score in [0, 1]. The skeleton drops the vowels, within one script it
+    # would make Mall and Mill equal, so it is only compared across scripts
+    forms_1 = generate_name_forms(name_1)
+    forms_2 = generate_name_forms(name_2)
+    if is_arabic(forms_1[0]) == is_arabic(forms_2[0]):
+        return dice(generate_ngrams(forms_1[0]), generate_ngrams(forms_2[0]))
+    return dice(generate_ngrams(forms_1[1]), generate_ngrams(forms_2[1]))
+
+
+def build_name_index(names):
+    # Inverted n-gram index of the candidate names, one for the normalized
+    # form and one for the transliterated form, plus the script of every
+    # candidate
+    index = {
+        'forms': [],
+        'arabic': np.fromiter((is_arabic(normalize_name(name))
+                               for name in names),
+                              dtype=bool,
+                              count=len(names)),
+    }
+    for form in range(2):
+        postings = defaultdict(list)
+        sizes = np.zeros(len(names), dtype=np.float64)
+        for position, name in enumerate(names):
+            ngrams = generate_ngrams(generate_name_forms(name)[form])
+            sizes[position] = len(ngrams)
+            for ngram in ngrams:
+                postings[ngram].append(position)
+        postings = {ngram: np.asarray(positions, dtype=np.intp)
+                    for ngram, positions in postings.items()}
+        index['forms'].append((postings, sizes))
+    return index
+
+
+def score_names(name, index):
+    # Dice score of one name against every indexed candidate at once, the
+    # transliterated form is used for the candidates in the other script
+    scores = []
+    forms = generate_name_forms(name)
+    for form, (postings, sizes) in zip(forms, index['forms']):
+        ngrams = generate_ngrams(form)
+        matches = [postings[ngram] for ngram in ngrams if ngram in postings]
+        shared = np.zeros(len(sizes), dtype=np.float64)
+        if matches:
+            shared = np.bincount(np.concatenate(matches),
+                                 minlength=len(sizes)).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            form_scores = np.where(sizes + len(ngrams) > 0,
+                                   2 * shared / (sizes + len(ngrams)),
+                                   0.0)
+        scores.append(form_scores)
+    other_script = index['arabic'] != is_arabic(forms[0])
+    return np.where(other_script, scores[1], scores[0])
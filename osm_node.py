@@ -0,0 +1,52 @@
+from interning import intern_tags
+
+# Nodes with the same keys in the same order share one keys tuple, the
+# layouts are dropped all at once past this size like the interned values
+MAX_KEY_LAYOUTS = 1 << 14
+
+KEY_LAYOUTS = dict()
+
+
+class OsmNode(object):
+    # One node between the readers and the serializers or linkers, the tags
+    # are kept as two parallel tuples instead of a dict per node
+    __slots__ = ('id', 'lat', 'lon', 'keys', 'values')
+
+    def __init__(self, node_id, lat, lon, keys=(), values=()):
+        self.id = int(node_id)
+        self.lat = float(lat)
+        self.lon = float(lon)
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def from_tags(cls, node_id, tags, lat, lon):
+        # Every reader goes through here, the keys and the frequent values
+        # are replaced by their interned copy
+        keys, values = intern_tags(tags)
+        if len(KEY_LAYOUTS) > MAX_KEY_LAYOUTS:
+            KEY_LAYOUTS.clear()
+        keys = KEY_LAYOUTS.setdefault(keys, keys)
+        return cls(node_id, lat, lon, keys, values)
+
+    def __repr__(self):
+        return 'OsmNode({0}, {1}, {2}, {3})'.format(self.id,
+                                                    self.lat,
+                                                    self.lon,
+                                                    dict(self.items()))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def get(self, key, default=None):
+        # Nodes only have a handful of tags, a scan beats hashing here
+        for node_key, value in zip(self.keys, self.values):
+            if node_key == key:
+                return value
+        return default
+
+    def items(self):
+        return zip(self.keys, self.values)
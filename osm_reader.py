@@ -0,0 +1,47 @@
+import pandas as pd
+
+# Local imports
+from osm_xml_reader import read_osm_xml_chunks, OSM_XML_EXTENSIONS
+from pbf_reader import read_osm_pbf_chunks
+
+CHUNK_SIZE = 10000
+
+NODE_COLUMNS = ('id', 'tags', 'lat', 'lon')
+
+PBF_EXTENSION = '.pbf'
+
+# Every extension a source may end with, longest first so .osm.pbf is
+# stripped before .pbf
+SOURCE_EXTENSIONS = tuple(sorted(
+    ('.csv', '.osm' + PBF_EXTENSION, PBF_EXTENSION) + OSM_XML_EXTENSIONS,
+    key=len,
+    reverse=True))
+
+
+def read_osm_csv_chunks(source_path,
+                        columns=NODE_COLUMNS,
+                        chunk_size=CHUNK_SIZE):
+    # Walk the Overpass style CSV (id,type,tags,lat,lon,...) chunk by chunk
+    # and only keep the requested columns, so memory stays bounded by the
+    # chunk size instead of the file size
+    columns = list(columns)
+    with open(source_path, mode='r') as csv_file:
+        chunks = pd.read_csv(csv_file, usecols=columns, chunksize=chunk_size)
+        for chunk in chunks:
+            values = [chunk[column].tolist() for column in columns]
+            yield list(zip(*values))
+
+
+def read_osm_csv(source_path, columns=NODE_COLUMNS, chunk_size=CHUNK_SIZE):
+    for rows in read_osm_csv_chunks(source_path, columns, chunk_size):
+        yield from rows
+
+
+def read_osm_node_chunks(source_path, chunk_size=CHUNK_SIZE, workers=None):
+    # (id, tags, lat, lon) rows of any supported source, the tags are the
+    # exported string for CSV and already a dict for PBF and XML extracts
+    if source_path.endswith(PBF_EXTENSION):
+        return read_osm_pbf_chunks(source_path, workers)
+    elif source_path.endswith(OSM_XML_EXTENSIONS):
+        return read_osm_xml_chunks(source_path, chunk_size)
+    return read_osm_csv_chunks(source_path, chunk_size=chunk_size)
@@ -0,0 +1,79 @@
+import gzip
+from xml.etree import ElementTree as et
+
+OSM_XML_EXTENSIONS = ('.osm', '.osm.gz', '.osc', '.osc.gz')
+
+# Actions of an osmChange file, nodes of a plain .osm file are creations
+CREATE_ACTION = 'create'
+MODIFY_ACTION = 'modify'
+DELETE_ACTION = 'delete'
+CHANGE_ACTIONS = frozenset((CREATE_ACTION, MODIFY_ACTION, DELETE_ACTION))
+OSM_ELEMENTS = frozenset(('node', 'way', 'relation', 'changeset', 'bounds'))
+
+
+def open_osm_xml(source_path):
+    if source_path.endswith('.gz'):
+        return gzip.open(source_path, mode='rb')
+    return open(source_path, mode='rb')
+
+
+def parse_coordinate(value):
+    # Deleted nodes of an osmChange do not always keep their position
+    return float(value) if value is not None else None
+
+
+def iter_osm_changes(source_path):
+    # Stream (action, id, tags, lat, lon) for every node, elements are
+    # cleared from their parent once read so memory does not grow with the
+    # size of the file
+    with open_osm_xml(source_path) as xml_file:
+        root = container = None
+        action = CREATE_ACTION
+        for event, element in et.iterparse(xml_file, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if root is None:
+                    root = container = element
+                elif tag in CHANGE_ACTIONS:
+                    action, container = tag, element
+                continue
+
+            if tag == 'node':
+                tags = {child.get('k'): child.get('v')
+                        for child in element.iter('tag')}
+                yield (action,
+                       int(element.get('id')),
+                       tags,
+                       parse_coordinate(element.get('lat')),
+                       parse_coordinate(element.get('lon')))
+            if tag in OSM_ELEMENTS:
+                container.clear()
+            elif tag in CHANGE_ACTIONS:
+                action, container = CREATE_ACTION, root
+                root.clear()
+
+
+def read_osm_xml_chunks(source_path, chunk_size):
+    # Current state of the tagged nodes as (id, tags, lat, lon) rows, the
+    # deletions of an osmChange file are skipped
+    rows = []
+    for action, node_id, tags, lat, lon in iter_osm_changes(source_path):
+        if action == DELETE_ACTION or not tags:
+            continue
+        rows.append((node_id, tags, lat, lon))
+        if len(rows) >= chunk_size:
+            yield rows
+            rows = []
+    if rows:
+        yield rows
+
+
+def read_osm_change_chunks(source_path, chunk_size):
+    rows = []
+    for change in iter_osm_changes(source_path):
+        rows.append(change)
+        if len(rows) >= chunk_size:
+            yield rows
+            rows = []
+    if rows:
+        yield rows
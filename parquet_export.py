@@ -0,0 +1,141 @@
+import argparse
+from array import array
+from collections import Counter
+
+# Third Party Imports
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Local imports
+from osm_reader import read_osm_node_chunks, CHUNK_SIZE
+from parser import (
+    DATA_SOURCES,
+    KEYS,
+    generate_node_properties,
+    generate_node_tags,
+    generate_osm_nodes,
+    generate_output_path,
+    resolve_tag_key,
+)
+
+# Written as typed columns from the row itself instead of as tag strings
+NODE_KEYS = frozenset(('id', 'latitude', 'longitude'))
+TAG_COLUMNS = tuple(key for key in KEYS if key not in NODE_KEYS)
+
+# Tag values repeat a lot, every tag column is dictionary encoded
+TAG_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+def generate_column_name(key, lang_attr):
+    # name + ar -> name_ar
+    return '{0}_{1}'.format(key, lang_attr) if lang_attr else key
+
+
+def collect_languages(source_path, chunk_size=CHUNK_SIZE):
+    # Cheap first pass for the schema, only the keys are resolved to find
+    # the languages seen, no property is built
+    columns = set()
+    for rows in read_osm_node_chunks(source_path, chunk_size):
+        for node in generate_osm_nodes(rows):
+            for key, value in generate_node_tags(node):
+                tag, lang_attr, ignored = resolve_tag_key(key)
+                if value and lang_attr and tag is not None:
+                    columns.add((tag.rsplit('}', 1)[-1], lang_attr))
+    return columns
+
+
+def order_columns(columns):
+    # Every KEYS entry gets a column, the languages seen follow their key
+    languages = dict()
+    for key, lang_attr in columns:
+        if lang_attr:
+            languages.setdefault(key, []).append(lang_attr)
+    for key in TAG_COLUMNS:
+        yield key, None
+        for lang_attr in sorted(languages.get(key, ())):
+            yield key, lang_attr
+
+
+def build_node_schema(columns):
+    fields = [
+        pa.field('id', pa.int64()),
+        pa.field('lat', pa.float64()),
+        pa.field('lon', pa.float64()),
+    ]
+    fields.extend(pa.field(generate_column_name(*column), TAG_TYPE)
+                  for column in columns)
+    return pa.schema(fields)
+
+
+def collect_columns(nodes, keys):
+    # Tags are sparse, every column only keeps the rows of the chunk holding
+    # a value and is expanded when the row group is built
+    ids = array('q')
+    lats = array('d')
+    lons = array('d')
+    columns = dict()
+    for node in nodes:
+        row = len(ids)
+        ids.append(node.id)
+        lats.append(node.lat)
+        lons.append(node.lon)
+        properties = generate_node_properties(node, keys)
+        for tag, value, lang_attr in properties[3:]:
+            rows_values = columns.setdefault(
+                (tag.rsplit('}', 1)[-1], lang_attr),
+                (array('q'), []))
+            # The first value wins when several keys map to one column
+            if rows_values[0] and rows_values[0][-1] == row:
+                continue
+            rows_values[0].append(row)
+            rows_values[1].append(value)
+    return ids, lats, lons, columns
+
+
+def build_node_table(schema, columns, ids, lats, lons, values):
+    # One row group, the columns without a value in the chunk are all null
+    size = len(ids)
+    arrays = [
+        pa.array(ids, type=pa.int64()),
+        pa.array(lats, type=pa.float64()),
+        pa.array(lons, type=pa.float64()),
+    ]
+    for column in columns:
+        if column not in values:
+            arrays.append(pa.nulls(size, TAG_TYPE))
+            continue
+        column_values = [None] * size
+        for row, value in zip(*values[column]):
+            column_values[row] = value
+        arrays.append(
+            pa.array(column_values, type=pa.string()).dictionary_encode())
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def generate_parquet_file(source_path, chunk_size=CHUNK_SIZE):
+    keys = Counter()
+    columns = list(order_columns(collect_languages(source_path, chunk_size)))
+    schema = build_node_schema(columns)
+    file_name = generate_output_path(source_path, 'parquet')
+    with pq.ParquetWriter(file_name, schema, use_dictionary=True) as writer:
+        for rows in read_osm_node_chunks(source_path, chunk_size):
+            chunk = collect_columns(generate_osm_nodes(rows), keys)
+            writer.write_table(build_node_table(schema, columns, *chunk))
+    return file_name
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Export the parsed nodes as Parquet')
+    arg_parser.add_argument('--source',
+                            action='append',
+                            default=None,
+                            help='Export this file instead of the bundled '
+                                 'extracts')
+    arg_parser.add_argument('--chunk-size',
+                            type=int,
+                            default=CHUNK_SIZE,
+                            help='Number of CSV rows to read at once')
+    args = arg_parser.parse_args()
+    for source in args.source or DATA_SOURCES:
+        generate_parquet_file(source, args.chunk_size)
@@ -1,12 +1,30 @@
+import argparse
+import cProfile
+import gzip
+import json
 import os
 import re
+from collections import Counter, deque
+from contextlib import closing
+from functools import lru_cache
+from itertools import chain
+from multiprocessing import Pool
+from xml.sax.saxutils import escape
 
-import pandas as pd
 # Third Party Imports
 from xml.etree import ElementTree as et
 
 # Local imports
 from geo_mapper import GEO_MAP
+from interning import INTERN_STATS, enable_intern_stats, intern_key
+from osm_node import OsmNode
+from osm_reader import read_osm_node_chunks, CHUNK_SIZE, SOURCE_EXTENSIONS
+from profiling import (STAGE_STATS,
+                       enable_profiling,
+                       disable_profiling,
+                       generate_stage_summary,
+                       print_profile_summary)
+from triple_store import STORE_PATH, open_store, replace_nodes
 
 
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +39,48 @@ OWL_NAMESPACE = "http://www.w3.org/2002/07/owl#"
 OSM_URL = "https://www.openstreetmap.org/node/{0}"
 WIKIDATA_URL = 'https://wikidata.org/entity/{0}'
 
+NAMESPACE_PREFIXES = {
+    OSM_NAMESPACE: 'osm',
+    RDF_NAMESPACE: 'rdf',
+    OWL_NAMESPACE: 'owl',
+    RDFS_NAMESPACE: 'rdfs',
+}
+
+RDF_TYPE_URI = RDF_NAMESPACE + 'type'
+SAME_AS_URI = OWL_NAMESPACE + 'sameAs'
+SAME_AS_TAG = '{%s}sameAs' % OWL_NAMESPACE
+LINK_SET_SUFFIX = 'sameAs'
+LINK_SET_FORMATS = ('xml', 'nt', 'ttl')
+NODE_CLASS_URI = OSM_NAMESPACE + 'node'
+
+# store loads the triples into the SQLite quad store instead of a file
+STORE_FORMAT = 'store'
+OUTPUT_FORMATS = ('xml', 'nt', 'ttl', STORE_FORMAT)
+
+TURTLE_PREFIXES = (
+    ('node', OSM_URL.format('')),
+    ('osm', OSM_NAMESPACE),
+)
+LINK_SET_TURTLE_PREFIXES = (
+    ('node', OSM_URL.format('')),
+    ('owl', OWL_NAMESPACE),
+)
+TURTLE_LOCAL_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_][A-Za-z0-9_\-]*$')
+
+NTRIPLES_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+XML_ATTRIBUTE_ENTITIES = {
+    '"': '&quot;',
+    '\r': '&#13;',
+    '\n': '&#10;',
+    '\t': '&#09;',
+}
+
 DATA_SOURCES = (
     WEST_BANK_PATH,
     GAZA_PATH
@@ -594,17 +654,71 @@ NAME_REGEX = '^(name|notes)[:]+[0-9a-zA-Z]{2}$'
 UNDERSCORE_REGEX = '^[0-9a-zA-Z]+[_]+[0-9a-zA-Z]+[:]+[0-9a-zA-Z]{2}$'
 ADDRESS_REGEX = '^[0-9a-zA-Z]+[:]+[0-9a-zA-Z]+[:]+[0-9a-zA-Z]{2}$'
 
+NAME_PATTERN = re.compile(NAME_REGEX)
+OSM_ID_TAG = '{%s}id' % OSM_NAMESPACE
+OSM_LATITUDE_TAG = '{%s}latitude' % OSM_NAMESPACE
+OSM_LONGITUDE_TAG = '{%s}longitude' % OSM_NAMESPACE
+IGNORE_KEYS_SET = frozenset(IGNORE_KEYS)
+KEYS_SET = frozenset(KEYS)
+
+# Tags are exported as {key=value, key=value}, values may contain the
+# separator or an equal sign as well
+TAG_SEPARATOR = ', '
+
+# Functions timed by --profile, nested stages are included in the time of
+# the stage calling them. The writers consume the fragments while writing,
+# so write_*_stream and replace_nodes include the whole conversion,
+# write_fragment is the time spent in the file writes alone
+PROFILED_STAGES = (
+    'read_chunk',
+    'generate_osm_node',
+    'generate_tags',
+    'generate_node_properties',
+    'generate_rdf_node_resource',
+    'serialize_rdf_resource',
+    'generate_ntriples_node',
+    'generate_turtle_node',
+    'write_fragment',
+    'write_rdf_stream',
+    'write_ntriples_stream',
+    'write_turtle_stream',
+    'replace_nodes',
+    'generate_rdf_tree',
+)
+
 
 def generate_tags(tags):
     node_tags = dict()
-    tags = tags[1: len(tags) - 2].split(',')
-    for element in tags:
-        values = element.split('=')
-        if len(values) > 1:
-            node_tags[values[0].lstrip()] = values[1].lstrip()
+    key = None
+    for pair in tags[1:-1].split(TAG_SEPARATOR):
+        name, equal, value = pair.partition('=')
+        if equal and ' ' not in name:
+            key = name
+            node_tags[key] = value
+        elif key is not None:
+            # Not a key, this is the rest of the previous value
+            node_tags[key] += TAG_SEPARATOR + pair
     return node_tags
 
 
+@lru_cache(maxsize=None)
+def resolve_tag_key(key):
+    # Resolve a raw OSM key once to (qualified tag, language, ignored), the
+    # qualified tag is None whenever the key should not be written
+    if key in IGNORE_KEYS_SET:
+        return None, None, True
+
+    lang_attr = None
+    if NAME_PATTERN.match(key):
+        parts = key.split(':')
+        key, lang_attr = parts[0], parts[-1]
+
+    key = OWL_MAP.get(key) or key
+    if key not in KEYS_SET:
+        return None, lang_attr, False
+    return intern_key('{%s}%s' % (OSM_NAMESPACE, key)), lang_attr, False
+
+
 def generate_key_using_delimiter(key, delimiter):
     strings = list(map(lambda item: item.strip(''), key.split(delimiter)))
     if len(strings) > 1:
@@ -613,8 +727,39 @@ def generate_key_using_delimiter(key, delimiter):
     return key
 
 
-def generate_rdf_node_resource(node_id, tags, lat, lon, keys):
-    resource_uri = OSM_URL.format(node_id)
+def generate_node_tags(node):
+    # Every node is in Palestine whatever its country tag says
+    if 'country' not in node:
+        return tuple(node.items()) + (('country', 'Palestine'),)
+    return ((key, 'Palestine' if key == 'country' else value)
+            for key, value in node.items())
+
+
+def generate_node_properties(node, keys):
+    # Map a node to its (qualified tag, value, language) properties, this is
+    # shared by every output format
+    properties = [
+        (OSM_ID_TAG, str(node.id), None),
+        (OSM_LATITUDE_TAG, str(node.lat), None),
+        (OSM_LONGITUDE_TAG, str(node.lon), None),
+    ]
+
+    for key, value in generate_node_tags(node):
+        if value:
+            keys[key] += 1
+            tag, lang_attr, ignored = resolve_tag_key(key)
+            if ignored:
+                continue
+            elif key == 'amenity':
+                value = TAGS_AMINTY_MAPPER.get(value, value)
+
+            if tag is not None:
+                properties.append((tag, value, lang_attr))
+    return properties
+
+
+def generate_rdf_node_resource(node, keys):
+    resource_uri = OSM_URL.format(node.id)
     resource = et.Element(
         '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description')
     resource.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about',
@@ -625,79 +770,20 @@ def generate_rdf_node_resource(node_id, tags, lat, lon, keys):
     resource.append(element_type)
     element_type.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource', '#node')
 
-    # Create element ID
-    element_id = et.Element('{https://raw.githubusercontent.com/birzeitknowledgegraph-2019/Ontology/master/osm_v2.rdf#}id')
-    element_id.text = node_id
-    resource.append(element_id)
-
-    element_lat = et.Element('{https://raw.githubusercontent.com/birzeitknowledgegraph-2019/Ontology/master/osm_v2.rdf#}latitude')
-    element_lat.text = lat
-    resource.append(element_lat)
-
-    element_lon = et.Element('{https://raw.githubusercontent.com/birzeitknowledgegraph-2019/Ontology/master/osm_v2.rdf#}longitude')
-    element_lon.text = lon
-    resource.append(element_lon)
-
-    geo_resource = GEO_MAP.get(node_id)
-    # uncomment this whenever we need to apply for mappings
-    # if geo_resource:
-    #     owl_geo = et.Element('{http://www.w3.org/2002/07/owl#}sameAs')
-    #     owl_geo.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource',
-    #                 geo_resource)
-    #     resource.append(owl_geo)
-
-    for key, value in tags.items():
-        if key == 'country':
-            tags[key] = 'Palestine'
-            break
-    else:
-        tags['country'] = 'Palestine'
-
-    has_wiki_data = False
-    for key, value in tags.items():
-        if value:
-            if key not in keys:
-                keys.append(key)
-            if key in IGNORE_KEYS:
-                continue
-            elif key == 'amenity':
-                value = TAGS_AMINTY_MAPPER.get(tags['amenity'], tags['amenity'])
-            elif key == 'wikidata':
-                pass
-                # has_wiki_data = True
-                # owl_same = et.Element('{http://www.w3.org/2002/07/owl#}sameAs')
-                # owl_same.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource',
-                #              WIKIDATA_URL.format(value))
-                # resource.append(owl_same)
-
-            lang_attr = None
-            if re.match(NAME_REGEX, key):
-                key, lang_attr = key.split(':')
-
-            if OWL_MAP.get(key):
-                key = OWL_MAP[key]
-
-            if key in KEYS:
-                key = '{https://raw.githubusercontent.com/birzeitknowledgegraph-2019/Ontology/master/osm_v2.rdf#}' + key
-                element_tag = et.Element(key)
-                if lang_attr:
-                    element_tag.set('xml:lang', lang_attr)
-                element_tag.text = value
-                resource.append(element_tag)
-    # Uncomment this when is is needed to generate separate sameAs
-    # file for both west bank and gaza
-    # if not (has_wiki_data or geo_resource):
-    #     resource = None
-
+    properties = generate_node_properties(node, keys)
+    for tag, value, lang_attr in properties:
+        element_tag = et.Element(tag)
+        if lang_attr:
+            element_tag.set('xml:lang', lang_attr)
+        element_tag.text = value
+        resource.append(element_tag)
     return resource
 
 
 def generate_root_rdf():
 
-    et.register_namespace('osm', OSM_NAMESPACE)
-    et.register_namespace('rdf', RDF_NAMESPACE)
-    et.register_namespace('owl', OWL_NAMESPACE)
-    et.register_namespace('rdfs', RDFS_NAMESPACE)
+    for namespace, prefix in NAMESPACE_PREFIXES.items():
+        et.register_namespace(prefix, namespace)
     rdf = et.Element('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF')
     rdf.set('xmlns:xsd', XSD_NAMESPACE)
     return rdf
@@ -732,35 +818,611 @@ def generate_owl_ontology(root):
         root.append(element_type)
 
 
+def strip_source_extension(file_name):
+    # extract-2024.01.osm.pbf -> extract-2024.01
+    for source_extension in SOURCE_EXTENSIONS:
+        if file_name.endswith(source_extension):
+            return file_name[:-len(source_extension)]
+    return file_name
+
+
+def generate_output_path(source_path, extension, suffix=''):
+    # Written next to the source, a bare file name stays in the current
+    # directory
+    name = strip_source_extension(os.path.basename(source_path)) + suffix
+    return os.path.join(os.path.dirname(source_path),
+                        '{0}.{1}'.format(name, extension))
+
+
 def generate_rdf_tree(root, source_path):
     tree = et.ElementTree(root)
-    # name = os.path.basename(source_path).split('.')[0] + 'sameAs'
-    name = os.path.basename(source_path).split('.')[0]
-    xml_name = name + '.xml'
-    file_name = '{0}/{1}'.format(os.path.dirname(source_path), xml_name)
+    file_name = generate_output_path(source_path, 'xml')
     tree.write(file_name,
                encoding='utf-8',
                xml_declaration=True,
                method='xml')
 
 
-def generate_rdf_file(source_path):
-    keys = []
-    root = generate_root_rdf()
-    with open(source_path, mode='r') as csv_file:
-        data = pd.read_csv(csv_file)
-        for _, entry in data.iterrows():
-            tags = generate_tags(entry['tags'])
-            resource_node = generate_rdf_node_resource(str(entry['id']),
-                                                       tags,
-                                                       str(entry['lat']),
-                                                       str(entry['lon']),
-                                                       keys)
-            if resource_node:
-                root.append(resource_node)
-    generate_rdf_tree(root, source_path)
+def generate_qname(tag):
+    # Same prefixes as the ones registered in generate_root_rdf
+    if tag[:1] == '{':
+        namespace, local_name = tag[1:].split('}', 1)
+        return '{0}:{1}'.format(NAMESPACE_PREFIXES[namespace], local_name)
+    return tag
+
+
+def serialize_rdf_element(element):
+    # Serialize a single element the same way ElementTree.write does, but
+    # without the namespace declarations which live on the rdf:RDF root
+    parts = ['<', generate_qname(element.tag)]
+    for name, value in element.items():
+        parts.append(' {0}="{1}"'.format(
+            generate_qname(name), escape(value, XML_ATTRIBUTE_ENTITIES)))
+    if element.text is None and not len(element):
+        parts.append(' />')
+    else:
+        parts.append('>')
+        if element.text:
+            parts.append(escape(element.text))
+        for child in element:
+            parts.append(serialize_rdf_element(child))
+        parts.append('</{0}>'.format(generate_qname(element.tag)))
+    if element.tail:
+        parts.append(escape(element.tail))
+    return ''.join(parts)
+
+
+def serialize_rdf_resource(resource):
+    # Entry point of the recursive serialize_rdf_element, timed once per
+    # resource
+    return serialize_rdf_element(resource)
+
+
+def write_fragment(output_file, fragment):
+    output_file.write(fragment)
+
+
+def write_rdf_stream(fragments, source_path, namespaces=None, suffix=''):
+    namespaces = namespaces or (OSM_NAMESPACE, RDF_NAMESPACE)
+    declarations = sorted(
+        (NAMESPACE_PREFIXES[namespace], namespace) for namespace in namespaces
+    )
+    file_name = generate_output_path(source_path, 'xml', suffix)
+    with open(file_name,
+              mode='w',
+              encoding='utf-8',
+              errors='xmlcharrefreplace') as rdf_file:
+        rdf_file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        rdf_file.write('<rdf:RDF')
+        for prefix, namespace in declarations:
+            rdf_file.write(' xmlns:{0}="{1}"'.format(prefix, namespace))
+        rdf_file.write(' xmlns:xsd="{0}">'.format(XSD_NAMESPACE))
+        for fragment in fragments:
+            write_fragment(rdf_file, fragment)
+        rdf_file.write('</rdf:RDF>')
+
+
+@lru_cache(maxsize=None)
+def generate_uri(tag):
+    # {namespace}local tags become namespace + local
+    return tag[1:].replace('}', '', 1)
+
+
+def generate_ntriples_node(node_id, properties, graph=None):
+    subject = '<{0}> '.format(OSM_URL.format(node_id))
+    end = ' <{0}> .\n'.format(graph) if graph else ' .\n'
+    lines = [
+        '{0}<{1}> <{2}>{3}'.format(subject, RDF_TYPE_URI, NODE_CLASS_URI, end)
+    ]
+    for tag, value, lang_attr in properties:
+        literal = '"{0}"'.format(value.translate(NTRIPLES_ESCAPES))
+        if lang_attr:
+            literal = '{0}@{1}'.format(literal, lang_attr)
+        lines.append('{0}<{1}> {2}{3}'.format(subject,
+                                              generate_uri(tag),
+                                              literal,
+                                              end))
+    return ''.join(lines)
+
+
+@lru_cache(maxsize=None)
+def generate_turtle_predicate(tag):
+    # Use the osm: prefix whenever the key is a valid prefixed local name
+    uri = generate_uri(tag)
+    if uri.startswith(OSM_NAMESPACE):
+        local_name = uri[len(OSM_NAMESPACE):]
+        if TURTLE_LOCAL_NAME_PATTERN.match(local_name):
+            return 'osm:' + local_name
+    return '<{0}>'.format(uri)
+
+
+def generate_turtle_node(node_id, properties):
+    # All the node properties are grouped under one subject
+    lines = ['node:{0} a osm:node'.format(node_id)]
+    for tag, value, lang_attr in properties:
+        literal = '"{0}"'.format(value.translate(NTRIPLES_ESCAPES))
+        if lang_attr:
+            literal = '{0}@{1}'.format(literal, lang_attr)
+        lines.append('    {0} {1}'.format(generate_turtle_predicate(tag),
+                                          literal))
+    return ' ;\n'.join(lines) + ' .\n\n'
+
+
+def open_rdf_output(source_path,
+                    extension,
+                    compress=False,
+                    append=False,
+                    suffix=''):
+    opener = open
+    if compress:
+        extension += '.gz'
+        opener = gzip.open
+    file_name = generate_output_path(source_path, extension, suffix)
+    mode = 'at' if append else 'wt'
+    return opener(file_name, mode=mode, encoding='utf-8')
+
+
+def write_turtle_stream(fragments,
+                        source_path,
+                        compress=False,
+                        prefixes=TURTLE_PREFIXES,
+                        suffix=''):
+    with open_rdf_output(source_path,
+                         'ttl',
+                         compress,
+                         suffix=suffix) as ttl_file:
+        for prefix, namespace in prefixes:
+            ttl_file.write('@prefix {0}: <{1}> .\n'.format(prefix, namespace))
+        ttl_file.write('\n')
+        for fragment in fragments:
+            write_fragment(ttl_file, fragment)
+
+
+def write_ntriples_stream(fragments,
+                          source_path,
+                          compress=False,
+                          graph=None,
+                          append=False,
+                          suffix=''):
+    # One triple (or quad when a graph is given) per line, appending to an
+    # existing file keeps it valid, gzip included
+    extension = 'nq' if graph else 'nt'
+    with open_rdf_output(source_path,
+                         extension,
+                         compress,
+                         append,
+                         suffix) as nt_file:
+        for fragment in fragments:
+            write_fragment(nt_file, fragment)
+
+
+def generate_row_tags(tags):
+    # Readers of PBF and XML extracts hand over the tags already as a dict
+    if isinstance(tags, dict):
+        return tags
+    return generate_tags(tags)
+
+
+def generate_osm_node(node_id, tags, lat, lon):
+    return OsmNode.from_tags(node_id, generate_row_tags(tags), lat, lon)
+
+
+def generate_osm_nodes(rows):
+    # (id, tags, lat, lon) rows of any reader to OsmNode records
+    for row in rows:
+        yield generate_osm_node(*row)
+
+
+def read_chunk(chunks):
+    # Reading is timed chunk by chunk, the readers are generators
+    return next(chunks, None)
+
+
+def iter_osm_chunks(source_path, chunk_size=CHUNK_SIZE, workers=None):
+    chunks = read_osm_node_chunks(source_path, chunk_size, workers)
+    rows = read_chunk(chunks)
+    while rows is not None:
+        yield rows
+        rows = read_chunk(chunks)
+
+
+def read_osm_node_records(source_path, chunk_size=CHUNK_SIZE, workers=None):
+    for rows in iter_osm_chunks(source_path, chunk_size, workers):
+        yield from generate_osm_nodes(rows)
+
+
+def generate_rdf_node_resources(nodes, keys):
+    for node in nodes:
+        resource_node = generate_rdf_node_resource(node, keys)
+        if resource_node is not None:
+            yield resource_node
+
+
+def generate_nodes_properties(nodes, keys):
+    for node in nodes:
+        yield str(node.id), generate_node_properties(node, keys)
+
+
+def generate_ntriples(nodes, keys, graph=None):
+    for node_id, properties in generate_nodes_properties(nodes, keys):
+        yield generate_ntriples_node(node_id, properties, graph)
+
+
+def generate_turtle(nodes, keys):
+    for node_id, properties in generate_nodes_properties(nodes, keys):
+        yield generate_turtle_node(node_id, properties)
+
+
+def generate_node_quads(node_id, properties, graph=None):
+    subject = OSM_URL.format(node_id)
+    graph = graph or ''
+    yield subject, RDF_TYPE_URI, NODE_CLASS_URI, '', 0, graph
+    for tag, value, lang_attr in properties:
+        yield subject, generate_uri(tag), value, lang_attr or '', 1, graph
+
+
+def generate_quads(nodes, keys, graph=None):
+    # The quads of every node together, a node is replaced as a whole
+    for node_id, properties in generate_nodes_properties(nodes, keys):
+        yield list(generate_node_quads(node_id, properties, graph))
+
+
+def generate_fragments(nodes, keys, output_format='xml', graph=None):
+    if output_format == 'nt':
+        return generate_ntriples(nodes, keys, graph)
+    elif output_format == 'ttl':
+        return generate_turtle(nodes, keys)
+    resources = generate_rdf_node_resources(nodes, keys)
+    return map(serialize_rdf_resource, resources)
+
+
+def generate_rdf_shard(rows, output_format='xml', graph=None):
+    # Runs inside a worker process, the shard is sent back already
+    # serialized so only one string crosses the process boundary
+    # Stage timings are per process, they are sent back with the shard
+    STAGE_STATS.clear()
+    INTERN_STATS.clear()
+    keys = Counter()
+    fragments = generate_fragments(generate_osm_nodes(rows),
+                                   keys,
+                                   output_format,
+                                   graph)
+    return (''.join(fragments),
+            keys,
+            Counter(STAGE_STATS),
+            Counter(INTERN_STATS))
+
+
+def merge_rdf_shard(shard, keys):
+    fragment, shard_keys, shard_stats, shard_intern_stats = shard
+    keys.update(shard_keys)
+    STAGE_STATS.update(shard_stats)
+    INTERN_STATS.update(shard_intern_stats)
+    return fragment
+
+
+def iter_rdf_shards(source_path,
+                    workers,
+                    keys,
+                    chunk_size=CHUNK_SIZE,
+                    output_format='xml',
+                    graph=None,
+                    decode_workers=None):
+    # Every chunk of rows is a shard, results are collected in submission
+    # order and only a couple of shards per worker are in flight at once
+    with Pool(workers) as pool:
+        pending = deque()
+        chunks = iter_osm_chunks(source_path, chunk_size, decode_workers)
+        for rows in chunks:
+            pending.append(pool.apply_async(generate_rdf_shard,
+                                            (rows, output_format, graph)))
+            if len(pending) >= workers * 2:
+                yield merge_rdf_shard(pending.popleft().get(), keys)
+        while pending:
+            yield merge_rdf_shard(pending.popleft().get(), keys)
+
+
+def generate_row_links(node_id, tags):
+    # owl:sameAs targets of a row, its GeoNames feature and its wikidata
+    # entity. CSV tags are only tokenized when they hold a wikidata key
+    links = []
+    geo_resource = GEO_MAP.get(node_id)
+    if geo_resource:
+        links.append(geo_resource)
+    if isinstance(tags, dict) or 'wikidata=' in tags:
+        wiki_data = generate_row_tags(tags).get('wikidata')
+        if wiki_data:
+            links.append(WIKIDATA_URL.format(wiki_data))
+    return links
+
+
+def generate_link_fragment(node_id, links, output_format='xml'):
+    if output_format == 'nt':
+        subject = OSM_URL.format(node_id)
+        return ''.join('<{0}> <{1}> <{2}> .\n'.format(subject,
+                                                      SAME_AS_URI,
+                                                      link)
+                       for link in links)
+    elif output_format == 'ttl':
+        objects = ', '.join('<{0}>'.format(link) for link in links)
+        return 'node:{0} owl:sameAs {1} .\n'.format(node_id, objects)
+
+    resource = et.Element(
+        '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description')
+    resource.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about',
+                 OSM_URL.format(node_id))
+    for link in links:
+        same_as = et.SubElement(resource, SAME_AS_TAG)
+        same_as.set('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource',
+                    link)
+    return serialize_rdf_element(resource)
+
+
+def generate_link_fragments(rows, output_format='xml'):
+    # Raw reader rows, no OsmNode is built for the nodes without links
+    for node_id, tags, _, _ in rows:
+        node_id = str(node_id)
+        links = generate_row_links(node_id, tags)
+        if links:
+            yield generate_link_fragment(node_id, links, output_format)
+
+
+def generate_link_set_file(source_path,
+                           output_format='xml',
+                           chunk_size=CHUNK_SIZE,
+                           compress=False):
+    # Only the owl:sameAs triples, in a single pass over the rows, written
+    # next to the source as <name>sameAs.<format>
+    if output_format not in LINK_SET_FORMATS:
+        raise ValueError('Unsupported link set format {0}'.format(
+            output_format))
+    rows = chain.from_iterable(iter_osm_chunks(source_path, chunk_size))
+    fragments = generate_link_fragments(rows, output_format)
+    if output_format == 'nt':
+        write_ntriples_stream(fragments,
+                              source_path,
+                              compress,
+                              suffix=LINK_SET_SUFFIX)
+    elif output_format == 'ttl':
+        write_turtle_stream(fragments,
+                            source_path,
+                            compress,
+                            prefixes=LINK_SET_TURTLE_PREFIXES,
+                            suffix=LINK_SET_SUFFIX)
+    else:
+        write_rdf_stream(fragments,
+                         source_path,
+                         namespaces=(OWL_NAMESPACE, RDF_NAMESPACE),
+                         suffix=LINK_SET_SUFFIX)
+
+
+def generate_keys_report(keys, source_path):
+    # Keys seen in the source with the number of nodes using them, the
+    # unmapped ones are the candidates to add to KEYS or OWL_MAP
+    unmapped = dict()
+    for key, count in keys.most_common():
+        tag, _, ignored = resolve_tag_key(key)
+        if tag is None and not ignored:
+            unmapped[key] = count
+
+    file_name = generate_output_path(source_path, 'json', '_keys')
+    with open(file_name, mode='w', encoding='utf-8') as report_file:
+        json.dump({'keys': dict(keys.most_common()), 'unmapped': unmapped},
+                  report_file,
+                  ensure_ascii=False,
+                  indent=4)
+
+
+def count_tag_kinds(keys):
+    # Tags skipped through IGNORE_KEYS, left without a predicate and
+    # written as language tagged names, derived from the keys statistics
+    # so the conversion itself does not pay for the counters
+    counters = Counter(ignored=0, unmapped=0, language=0)
+    for key, count in keys.items():
+        tag, lang_attr, ignored = resolve_tag_key(key)
+        if ignored:
+            counters['ignored'] += count
+        elif tag is None:
+            counters['unmapped'] += count
+        elif lang_attr:
+            counters['language'] += count
+    return counters
+
+
+def generate_profile_summary(keys, source_path):
+    summary = generate_stage_summary()
+    counters = count_tag_kinds(keys)
+    interning = {
+        'keys': INTERN_STATS['keys'],
+        'values': INTERN_STATS['values'],
+        'bytes': INTERN_STATS['bytes'],
+    }
+    print(os.path.basename(source_path))
+    print_profile_summary(summary, dict(
+        counters,
+        **{'interned_' + name: count for name, count in interning.items()}))
+    file_name = generate_output_path(source_path, 'json', '_profile')
+    with open(file_name, mode='w', encoding='utf-8') as profile_file:
+        json.dump({'stages': summary, 'tags': counters, 'interning': interning},
+                  profile_file,
+                  indent=4)
+
+
+def generate_rdf_file(source_path,
+                      stream=False,
+                      chunk_size=CHUNK_SIZE,
+                      workers=None,
+                      keys_report=False,
+                      output_format='xml',
+                      compress=False,
+                      graph=None,
+                      append=False,
+                      profile=False,
+                      cprofile=False,
+                      decode_workers=None,
+                      store_path=STORE_PATH):
+    # Interning statistics are per run, the interned strings are kept
+    enable_intern_stats(profile)
+    if profile:
+        enable_profiling(globals(), PROFILED_STAGES)
+    profiler = cProfile.Profile() if cprofile else None
+    if profiler:
+        profiler.enable()
+    try:
+        keys = convert_rdf_file(source_path,
+                                stream,
+                                chunk_size,
+                                workers,
+                                output_format,
+                                compress,
+                                graph,
+                                append,
+                                decode_workers,
+                                store_path)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(generate_output_path(source_path, 'prof'))
+        if profile:
+            disable_profiling(globals(), PROFILED_STAGES)
+
+    if profile:
+        generate_profile_summary(keys, source_path)
+    if keys_report:
+        generate_keys_report(keys, source_path)
+    return keys
+
+
+def convert_rdf_file(source_path,
+                     stream=False,
+                     chunk_size=CHUNK_SIZE,
+                     workers=None,
+                     output_format='xml',
+                     compress=False,
+                     graph=None,
+                     append=False,
+                     decode_workers=None,
+                     store_path=STORE_PATH):
+    keys = Counter()
+    if output_format == STORE_FORMAT:
+        # SQLite takes a single writer, the nodes are converted in process
+        nodes = read_osm_node_records(source_path, chunk_size, decode_workers)
+        with closing(open_store(store_path)) as connection:
+            replace_nodes(connection, generate_quads(nodes, keys, graph))
+    elif output_format == 'xml' and not (stream or workers):
+        root = generate_root_rdf()
+        nodes = read_osm_node_records(source_path, chunk_size, decode_workers)
+        for resource_node in generate_rdf_node_resources(nodes, keys):
+            root.append(resource_node)
+        generate_rdf_tree(root, source_path)
+    else:
+        if workers:
+            fragments = iter_rdf_shards(source_path,
+                                        workers,
+                                        keys,
+                                        chunk_size,
+                                        output_format,
+                                        graph,
+                                        decode_workers)
+        else:
+            nodes = read_osm_node_records(source_path,
+                                          chunk_size,
+                                          decode_workers)
+            fragments = generate_fragments(nodes, keys, output_format, graph)
+
+        if output_format == 'nt':
+            write_ntriples_stream(fragments,
+                                  source_path,
+                                  compress,
+                                  graph,
+                                  append)
+        elif output_format == 'ttl':
+            write_turtle_stream(fragments, source_path, compress)
+        else:
+            # Write every resource as soon as it is built instead of
+            # keeping the whole tree in memory
+            write_rdf_stream(fragments, source_path)
+    return keys
 
 
 if __name__ == '__main__':
-    for source in DATA_SOURCES:
-        generate_rdf_file(source)
+    arg_parser = argparse.ArgumentParser(description='OpenStreet Parser')
+    arg_parser.add_argument('--stream',
+                            action='store_true',
+                            help='Write resources to disk while converting')
+    arg_parser.add_argument('--chunk-size',
+                            type=int,
+                            default=CHUNK_SIZE,
+                            help='Number of CSV rows to read at once')
+    arg_parser.add_argument('--workers',
+                            type=int,
+                            default=None,
+                            help='Convert chunks in a pool of processes')
+    arg_parser.add_argument('--keys-report',
+                            action='store_true',
+                            help='Write the tag keys statistics as JSON')
+    arg_parser.add_argument('--format',
+                            choices=OUTPUT_FORMATS,
+                            default='xml',
+                            help='Output format, RDF/XML, N-Triples, Turtle '
+                                 'or the SQLite quad store')
+    arg_parser.add_argument('--gzip',
+                            action='store_true',
+                            help='Compress N-Triples or Turtle output')
+    arg_parser.add_argument('--graph',
+                            default=None,
+                            help='Write N-Quads into this named graph')
+    arg_parser.add_argument('--append',
+                            action='store_true',
+                            help='Append to an existing N-Triples file')
+    arg_parser.add_argument('--links',
+                            action='store_true',
+                            help='Only write the owl:sameAs link set')
+    arg_parser.add_argument('--profile',
+                            action='store_true',
+                            help='Time the conversion stages and count tags')
+    arg_parser.add_argument('--cprofile',
+                            action='store_true',
+                            help='Write cProfile statistics next to the output')
+    arg_parser.add_argument('--decode-workers',
+                            type=int,
+                            default=None,
+                            help='Decode .osm.pbf blocks in a pool of processes')
+    arg_parser.add_argument('--store',
+                            default=STORE_PATH,
+                            help='SQLite quad store used by --format store')
+    arg_parser.add_argument('--source',
+                            action='append',
+                            default=None,
+                            help='Convert this CSV, .osm.pbf or .osm file '
+                                 'instead of the bundled extracts')
+    args = arg_parser.parse_args()
+    if args.links:
+        if args.format not in LINK_SET_FORMATS:
+            arg_parser.error('--links writes xml, nt or ttl, not {0}'.format(
+                args.format))
+        if args.gzip and args.format == 'xml':
+            arg_parser.error('--links only compresses nt or ttl with --gzip')
+        if args.graph or args.append:
+            arg_parser.error('--graph and --append are not supported with '
+                             '--links')
+    for source in args.source or DATA_SOURCES:
+        if args.links:
+            generate_link_set_file(source,
+                                   output_format=args.format,
+                                   chunk_size=args.chunk_size,
+                                   compress=args.gzip)
+            continue
+        generate_rdf_file(source,
+                          stream=args.stream,
+                          chunk_size=args.chunk_size,
+                          workers=args.workers,
+                          keys_report=args.keys_report,
+                          output_format=args.format,
+                          compress=args.gzip,
+                          graph=args.graph,
+                          append=args.append,
+                          profile=args.profile,
+                          cprofile=args.cprofile,
+                          decode_workers=args.decode_workers,
+                          store_path=args.store)
@@ -0,0 +1,229 @@
+import struct
+import zlib
+from collections import deque
+from multiprocessing import Pool
+
+# Field numbers of the OSM PBF messages (fileformat.proto, osmformat.proto)
+BLOB_HEADER_TYPE = 1
+BLOB_HEADER_DATA_SIZE = 3
+BLOB_RAW = 1
+BLOB_ZLIB_DATA = 3
+BLOCK_STRING_TABLE = 1
+BLOCK_PRIMITIVE_GROUP = 2
+BLOCK_GRANULARITY = 17
+BLOCK_LAT_OFFSET = 19
+BLOCK_LON_OFFSET = 20
+STRING_TABLE_STRING = 1
+GROUP_NODES = 1
+GROUP_DENSE = 2
+NODE_ID = 1
+NODE_KEYS = 2
+NODE_VALUES = 3
+NODE_LAT = 8
+NODE_LON = 9
+DENSE_ID = 1
+DENSE_LAT = 8
+DENSE_LON = 9
+DENSE_KEYS_VALUES = 10
+
+DATA_BLOCK_TYPE = 'OSMData'
+DEFAULT_GRANULARITY = 100
+NANO_DEGREES = 1e9
+
+
+def read_varint(buffer, position):
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def to_signed(value):
+    # int64 fields are sent as 64 bit two's complement varints
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def to_zigzag(value):
+    # sint64 fields are zigzag encoded
+    return (value >> 1) ^ -(value & 1)
+
+
+def iter_fields(buffer):
+    # Yield (field number, value) of a protobuf message, varints as int and
+    # length delimited fields as bytes, fixed width fields are skipped
+    position = 0
+    size = len(buffer)
+    while position < size:
+        key, position = read_varint(buffer, position)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, position = read_varint(buffer, position)
+        elif wire_type == 2:
+            length, position = read_varint(buffer, position)
+            value = buffer[position:position + length]
+            position += length
+        elif wire_type == 1:
+            position += 8
+            continue
+        elif wire_type == 5:
+            position += 4
+            continue
+        else:
+            raise ValueError('Unsupported wire type {0}'.format(wire_type))
+        yield field, value
+
+
+def read_packed(buffer):
+    values = []
+    position = 0
+    size = len(buffer)
+    while position < size:
+        value, position = read_varint(buffer, position)
+        values.append(value)
+    return values
+
+
+def read_packed_deltas(buffer):
+    # Dense ids and coordinates are zigzag encoded deltas
+    values = []
+    current = 0
+    for value in read_packed(buffer):
+        current += to_zigzag(value)
+        values.append(current)
+    return values
+
+
+def iter_blobs(source_path):
+    # The file is a sequence of (header length, BlobHeader, Blob), only the
+    # data blobs are returned, the OSMHeader block carries no nodes
+    with open(source_path, mode='rb') as pbf_file:
+        while True:
+            header_size = pbf_file.read(4)
+            if not header_size:
+                break
+            header = pbf_file.read(struct.unpack('>I', header_size)[0])
+            block_type, data_size = None, 0
+            for field, value in iter_fields(header):
+                if field == BLOB_HEADER_TYPE:
+                    block_type = value.decode('utf-8')
+                elif field == BLOB_HEADER_DATA_SIZE:
+                    data_size = value
+            blob = pbf_file.read(data_size)
+            if block_type == DATA_BLOCK_TYPE:
+                yield blob
+
+
+def read_blob(blob):
+    for field, value in iter_fields(blob):
+        if field == BLOB_RAW:
+            return value
+        elif field == BLOB_ZLIB_DATA:
+            return zlib.decompress(value)
+    raise ValueError('Unsupported blob compression')
+
+
+def decode_nodes(group, strings, to_degrees):
+    for field, value in iter_fields(group):
+        if field != GROUP_NODES:
+            continue
+        node_id, keys, values, lat, lon = 0, [], [], 0, 0
+        for node_field, node_value in iter_fields(value):
+            if node_field == NODE_ID:
+                node_id = to_zigzag(node_value)
+            elif node_field == NODE_KEYS:
+                keys = read_packed(node_value)
+            elif node_field == NODE_VALUES:
+                values = read_packed(node_value)
+            elif node_field == NODE_LAT:
+                lat = to_zigzag(node_value)
+            elif node_field == NODE_LON:
+                lon = to_zigzag(node_value)
+        if keys:
+            tags = {strings[key]: strings[value]
+                    for key, value in zip(keys, values)}
+            yield (node_id, tags) + to_degrees(lat, lon)
+
+
+def decode_dense_nodes(dense, strings, to_degrees):
+    ids, lats, lons, keys_values = [], [], [], []
+    for field, value in iter_fields(dense):
+        if field == DENSE_ID:
+            ids = read_packed_deltas(value)
+        elif field == DENSE_LAT:
+            lats = read_packed_deltas(value)
+        elif field == DENSE_LON:
+            lons = read_packed_deltas(value)
+        elif field == DENSE_KEYS_VALUES:
+            keys_values = read_packed(value)
+
+    # keys_vals holds key, value string indexes of every node in turn, each
+    # node being terminated by a 0
+    position = 0
+    for node_id, lat, lon in zip(ids, lats, lons):
+        tags = dict()
+        while position < len(keys_values) and keys_values[position]:
+            key = strings[keys_values[position]]
+            tags[key] = strings[keys_values[position + 1]]
+            position += 2
+        position += 1
+        if tags:
+            yield (node_id, tags) + to_degrees(lat, lon)
+
+
+def decode_block(blob):
+    # Decode one PrimitiveBlock into (id, tags, lat, lon) rows, untagged
+    # nodes only carry way geometry and are left out like in the CSV export
+    strings = []
+    groups = []
+    granularity = DEFAULT_GRANULARITY
+    lat_offset = lon_offset = 0
+    for field, value in iter_fields(read_blob(blob)):
+        if field == BLOCK_STRING_TABLE:
+            strings = [string.decode('utf-8')
+                       for _, string in iter_fields(value)]
+        elif field == BLOCK_PRIMITIVE_GROUP:
+            groups.append(value)
+        elif field == BLOCK_GRANULARITY:
+            granularity = value
+        elif field == BLOCK_LAT_OFFSET:
+            lat_offset = to_signed(value)
+        elif field == BLOCK_LON_OFFSET:
+            lon_offset = to_signed(value)
+
+    def to_degrees(lat, lon):
+        # Integer nanodegrees divided once, so the float prints the same
+        # as the decimal coordinates of the CSV export
+        return ((lat_offset + granularity * lat) / NANO_DEGREES,
+                (lon_offset + granularity * lon) / NANO_DEGREES)
+
+    rows = []
+    for group in groups:
+        rows.extend(decode_nodes(group, strings, to_degrees))
+        for field, value in iter_fields(group):
+            if field == GROUP_DENSE:
+                rows.extend(decode_dense_nodes(value, strings, to_degrees))
+    return rows
+
+
+def read_osm_pbf_chunks(source_path, workers=None):
+    # Every data block is a chunk, blocks are decoded in a pool of processes
+    # while the file is being read and come back in file order. Only a
+    # couple of blocks per worker are in flight, Pool.imap would read and
+    # decode the whole file ahead of a slower consumer
+    blobs = iter_blobs(source_path)
+    if not workers:
+        yield from map(decode_block, blobs)
+        return
+    with Pool(workers) as pool:
+        pending = deque()
+        for blob in blobs:
+            pending.append(pool.apply_async(decode_block, (blob,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
@@ -0,0 +1,62 @@
+from collections import Counter
+from functools import wraps
+from time import perf_counter
+
+
+# Cumulative (seconds, calls) per stage of the process that ran them
+STAGE_STATS = Counter()
+
+
+def profile_stage(stage, function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            STAGE_STATS[(stage, 'seconds')] += perf_counter() - start
+            STAGE_STATS[(stage, 'calls')] += 1
+    wrapper.profiled = True
+    return wrapper
+
+
+def enable_profiling(namespace, stages):
+    # The stages are swapped in the module namespace so the callers pick
+    # the timed version through their global lookup, nothing is paid for
+    # the instrumentation while it is disabled
+    STAGE_STATS.clear()
+    for stage in stages:
+        function = namespace[stage]
+        if not getattr(function, 'profiled', False):
+            namespace[stage] = profile_stage(stage, function)
+
+
+def disable_profiling(namespace, stages):
+    for stage in stages:
+        function = namespace[stage]
+        if getattr(function, 'profiled', False):
+            namespace[stage] = function.__wrapped__
+
+
+def generate_stage_summary(stats=STAGE_STATS):
+    summary = dict()
+    for (stage, field), value in sorted(stats.items()):
+        summary.setdefault(stage, {'calls': 0, 'seconds': 0.0})[field] = value
+    for stage_summary in summary.values():
+        calls = stage_summary['calls']
+        stage_summary['us_per_call'] = (
+            stage_summary['seconds'] * 1e6 / calls if calls else 0.0)
+    return summary
+
+
+def print_profile_summary(summary, counters):
+    print('{0:<32}{1:>12}{2:>12}{3:>12}'.format(
+        'stage', 'calls', 'seconds', 'us/call'))
+    for stage, stage_summary in summary.items():
+        print('{0:<32}{1:>12}{2:>12.3f}{3:>12.2f}'.format(
+            stage,
+            stage_summary['calls'],
+            stage_summary['seconds'],
+            stage_summary['us_per_call']))
+    for name, count in counters.items():
+        print('{0:<32}{1:>12}'.format(name, count))
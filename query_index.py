@@ -0,0 +1,165 @@
+import argparse
+import csv
+import sys
+from collections import Counter
+from contextlib import closing
+from itertools import product
+
+# Local imports
+from parser import (
+    DATA_SOURCES,
+    OSM_NAMESPACE,
+    OSM_URL,
+    generate_nodes_properties,
+    generate_uri,
+    read_osm_node_records,
+)
+from triple_store import open_store
+
+SUBJECT_COLUMN = 'osm_subject'
+
+# Columns as (name, predicate, language, optional), the same projection as
+# data/ameinty-sparql-query.txt
+AMENITY_LANGUAGE_COLUMNS = (
+    ('amenity', 'amenity', None, False),
+    ('ar', 'name', 'ar', True),
+    ('en', 'name', 'en', True),
+    ('fr', 'name', 'fr', True),
+)
+
+
+def generate_predicate_uri(predicate):
+    return OSM_NAMESPACE + predicate
+
+
+def add_to_index(index, subject, predicate, value, lang):
+    index.setdefault(predicate, dict()).setdefault(subject, []).append(
+        (value, lang))
+
+
+def build_source_index(sources, predicates=None):
+    # predicate -> subject -> [(value, language)] straight from the source
+    # files, subjects keep the order of the files
+    index = dict()
+    keys = Counter()
+    for source in sources:
+        nodes = read_osm_node_records(source)
+        for node_id, properties in generate_nodes_properties(nodes, keys):
+            subject = OSM_URL.format(node_id)
+            for tag, value, lang_attr in properties:
+                predicate = generate_uri(tag)
+                if predicates is None or predicate in predicates:
+                    add_to_index(index, subject, predicate, value, lang_attr)
+    return index
+
+
+def build_store_index(store_path, predicates):
+    # Only the literals of the queried predicates are read, through the
+    # predicate index of the quad store
+    index = dict()
+    with closing(open_store(store_path)) as connection:
+        for predicate in predicates:
+            quads = connection.execute(
+                'SELECT DISTINCT subject, object, lang FROM quads '
+                'WHERE predicate = ? AND literal = 1', (predicate,))
+            for subject, value, lang in quads:
+                add_to_index(index, subject, predicate, value, lang or None)
+    return index
+
+
+def get_column_values(index, subject, predicate, lang):
+    values = index.get(predicate, {}).get(subject, ())
+    return [value for value, value_lang in values
+            if lang is None or value_lang == lang]
+
+
+def select_nodes(index, columns, filters=None):
+    # Every subject having all the required columns, optional columns are
+    # left empty when missing and several values give one row each, like
+    # the solutions of the SPARQL query
+    columns = [(name, generate_predicate_uri(predicate), lang, optional)
+               for name, predicate, lang, optional in columns]
+    filters = filters or dict()
+    required = [column for column in columns if not column[3]]
+    if not required:
+        raise ValueError('At least one column must be required')
+
+    first_predicate = required[0][1]
+    for subject in index.get(first_predicate, {}):
+        values = []
+        for name, predicate, lang, optional in columns:
+            column_values = get_column_values(index, subject, predicate, lang)
+            if name in filters:
+                column_values = [value for value in column_values
+                                 if value == filters[name]]
+            if not column_values:
+                if not optional or name in filters:
+                    break
+                column_values = ['']
+            values.append(column_values)
+        else:
+            for row in product(*values):
+                yield (subject,) + row
+
+
+def write_csv(rows, columns, output_file):
+    writer = csv.writer(output_file, lineterminator='\n')
+    writer.writerow([SUBJECT_COLUMN] + [column[0] for column in columns])
+    writer.writerows(rows)
+
+
+def parse_column(column):
+    # name=predicate[@lang], a leading ? marks the column as optional
+    name, _, predicate = column.partition('=')
+    optional = name.startswith('?')
+    predicate, _, lang = predicate.partition('@')
+    return name.lstrip('?'), predicate or name.lstrip('?'), lang or None, \
+        optional
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Project the converted nodes by predicate to CSV')
+    arg_parser.add_argument('--source',
+                            action='append',
+                            default=None,
+                            help='Index this file instead of the bundled '
+                                 'extracts')
+    arg_parser.add_argument('--store',
+                            default=None,
+                            help='Index the SQLite store written by parser.py')
+    arg_parser.add_argument('--column',
+                            action='append',
+                            default=None,
+                            help='name=predicate[@lang], prefix the name '
+                                 'with ? for an optional column, defaults '
+                                 'to the amenity/language report')
+    arg_parser.add_argument('--filter',
+                            action='append',
+                            default=[],
+                            help='name=value, only keep rows with this value')
+    arg_parser.add_argument('--output',
+                            default=None,
+                            help='Write the CSV to this file')
+    args = arg_parser.parse_args()
+
+    if args.column:
+        query_columns = [parse_column(column) for column in args.column]
+    else:
+        query_columns = AMENITY_LANGUAGE_COLUMNS
+    query_filters = dict(query_filter.split('=', 1)
+                         for query_filter in args.filter)
+    query_predicates = {generate_predicate_uri(column[1])
+                        for column in query_columns}
+    if args.store:
+        predicate_index = build_store_index(args.store, query_predicates)
+    else:
+        predicate_index = build_source_index(args.source or DATA_SOURCES,
+                                             query_predicates)
+
+    results = select_nodes(predicate_index, query_columns, query_filters)
+    if args.output:
+        with open(args.output, mode='w', encoding='utf-8') as csv_file:
+            write_csv(results, query_columns, csv_file)
+    else:
+        write_csv(results, query_columns, sys.stdout)
@@ -0,0 +1,93 @@
+import argparse
+import os
+import sys
+from contextlib import closing
+
+# Third Party Imports
+from rdflib import Graph, Literal, URIRef
+from rdflib.store import Store
+
+# Local imports
+from triple_store import STORE_PATH, open_store
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+AMENITY_QUERY_PATH = os.path.join(BASE_PATH, 'data/ameinty-sparql-query.txt')
+
+
+class SQLiteStore(Store):
+    # Read only view of the quads table for the rdflib SPARQL engine, every
+    # triple pattern becomes a lookup on the primary key or the predicate
+    # index. Named graphs are queried as their union.
+
+    def __init__(self, connection):
+        super(SQLiteStore, self).__init__()
+        self.connection = connection
+
+    def triples(self, triple_pattern, context=None):
+        clauses = []
+        parameters = []
+        for column, term in zip(('subject', 'predicate'), triple_pattern[:2]):
+            if term is None:
+                continue
+            elif not isinstance(term, URIRef):
+                return
+            clauses.append('{0} = ?'.format(column))
+            parameters.append(str(term))
+
+        term = triple_pattern[2]
+        if isinstance(term, Literal):
+            if term.datatype is not None:
+                return
+            clauses.append('object = ? AND lang = ? AND literal = 1')
+            parameters.extend((str(term), term.language or ''))
+        elif isinstance(term, URIRef):
+            clauses.append('object = ? AND literal = 0')
+            parameters.append(str(term))
+        elif term is not None:
+            return
+
+        query = 'SELECT DISTINCT subject, predicate, object, lang, literal ' \
+                'FROM quads'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        for subject, predicate, value, lang, literal in \
+                self.connection.execute(query, parameters):
+            if literal:
+                value = Literal(value, lang=lang or None)
+            else:
+                value = URIRef(value)
+            yield (URIRef(subject), URIRef(predicate), value), iter(())
+
+    def __len__(self, context=None):
+        query = 'SELECT COUNT(*) FROM (SELECT DISTINCT subject, predicate, ' \
+                'object, lang, literal FROM quads)'
+        return self.connection.execute(query).fetchone()[0]
+
+
+def run_query(connection, query):
+    graph = Graph(store=SQLiteStore(connection))
+    return graph.query(query)
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Run a SPARQL query against the converted nodes')
+    arg_parser.add_argument('query',
+                            nargs='?',
+                            default=AMENITY_QUERY_PATH,
+                            help='File holding the SPARQL query')
+    arg_parser.add_argument('--store',
+                            default=STORE_PATH,
+                            help='SQLite store written by parser.py')
+    arg_parser.add_argument('--output',
+                            default=None,
+                            help='Write the results as CSV to this file')
+    args = arg_parser.parse_args()
+    with open(args.query, mode='r', encoding='utf-8') as query_file:
+        query_text = query_file.read()
+    with closing(open_store(args.store)) as store_connection:
+        results = run_query(store_connection, query_text)
+        if args.output:
+            results.serialize(destination=args.output, format='csv')
+        else:
+            sys.stdout.write(results.serialize(format='csv').decode('utf-8'))
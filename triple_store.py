@@ -0,0 +1,65 @@
+import os
+import sqlite3
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+STORE_PATH = os.path.join(BASE_PATH, 'data/osm.sqlite')
+
+# Number of quads written in a single transaction
+BATCH_SIZE = 50000
+
+# Quads are kept as plain text, objects are either a URI or a literal with
+# an optional language, the default graph is the empty string
+STORE_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS quads ('
+    'subject TEXT NOT NULL, '
+    'predicate TEXT NOT NULL, '
+    'object TEXT NOT NULL, '
+    'lang TEXT NOT NULL, '
+    'literal INTEGER NOT NULL, '
+    'graph TEXT NOT NULL, '
+    'PRIMARY KEY (subject, predicate, object, lang, literal, graph)'
+    ') WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS quads_predicate ON quads (predicate, object)',
+)
+
+INSERT_QUAD = 'INSERT OR IGNORE INTO quads VALUES (?, ?, ?, ?, ?, ?)'
+DELETE_SUBJECT = 'DELETE FROM quads WHERE subject = ? AND graph = ?'
+
+
+def open_store(store_path=STORE_PATH):
+    connection = sqlite3.connect(store_path)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    for statement in STORE_SCHEMA:
+        connection.execute(statement)
+    return connection
+
+
+def write_batch(connection, subjects, batch):
+    # The previous quads of the reloaded subjects go in the same
+    # transaction as their new ones
+    with connection:
+        connection.executemany(DELETE_SUBJECT, subjects)
+        connection.executemany(INSERT_QUAD, batch)
+
+
+def replace_nodes(connection, nodes_quads, batch_size=BATCH_SIZE):
+    # nodes_quads holds the list of quads of every node, all sharing the
+    # node subject and graph. A node is never split across two batches so
+    # reloading a changed source leaves only its current quads
+    subjects = []
+    batch = []
+    count = 0
+    for quads in nodes_quads:
+        if not quads:
+            continue
+        subjects.append((quads[0][0], quads[0][5]))
+        batch.extend(quads)
+        if len(batch) >= batch_size:
+            write_batch(connection, subjects, batch)
+            count += len(batch)
+            subjects, batch = [], []
+    if batch:
+        write_batch(connection, subjects, batch)
+        count += len(batch)
+    return count